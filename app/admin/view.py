@@ -14,27 +14,62 @@ Classes:
 
 from sqladmin import ModelView
 
+from app.booking.booking_dao import BookingDAO
 from app.booking.booking_models import Bookings
+from app.exceptions import RoomCannotBeBookedException
+from app.hotels.hotel_cache import hotel_search_cache
 from app.hotels.hotel_models import Hotels
+from app.hotels.rooms.room_cache import room_cache
 from app.hotels.rooms.room_models import Rooms
+from app.users.user_cache import user_cache
 from app.users.user_models import Users
 
 
 class BookingsAdmin(ModelView, model=Bookings):
     """
     Admin view for managing bookings.
+
+    Bookings are created, changed and deleted through `BookingDAO`, so the daily room
+    occupancy, the room inventory index and the cached availability follow them, and a sold
+    out room cannot be booked from the admin panel either.
     """
 
     column_list = [c.name for c in Bookings.__table__.c]
 
+    async def insert_model(self, request, data):
+        values = _booking_values(data)
+        booking = await BookingDAO.add(
+            values["user_id"], values["room_id"], values["date_from"], values["date_to"]
+        )
+        if booking is None:
+            raise RoomCannotBeBookedException
+        return booking
+
+    async def update_model(self, request, pk, data):
+        booking = await BookingDAO.update(int(pk), **_booking_values(data))
+        if booking is None:
+            raise RoomCannotBeBookedException
+        return booking
+
+    async def delete_model(self, request, pk):
+        await BookingDAO.delete(id=int(pk))
+
 
 class UserAdmin(ModelView, model=Users):
     """
     Admin view for managing users.
+
+    Changed and deleted users are dropped from the user cache of every worker.
     """
 
     column_list = [Users.id, Users.email]
 
+    async def after_model_change(self, data, model, is_created, request):
+        await user_cache.invalidate(model.id)
+
+    async def after_model_delete(self, model, request):
+        await user_cache.invalidate(model.id)
+
 
 class HotelsAdmin(ModelView, model=Hotels):
     """
@@ -47,6 +82,37 @@ class HotelsAdmin(ModelView, model=Hotels):
 class RoomsAdmin(ModelView, model=Rooms):
     """
     Admin view for managing rooms.
+
+    Changed and deleted rooms are dropped from the room cache and outdate the cached
+    searches of their hotel, and of the hotel they were moved from.
     """
 
     column_list = [c.name for c in Rooms.__table__.c]
+
+    async def on_model_change(self, data, model, is_created, request):
+        request.state.previous_hotel_id = None if is_created else model.hotel_id
+
+    async def after_model_change(self, data, model, is_created, request):
+        hotel_ids = {model.hotel_id, getattr(request.state, "previous_hotel_id", None)}
+        await self._invalidate(hotel_ids - {None})
+
+    async def after_model_delete(self, model, request):
+        await self._invalidate({model.hotel_id})
+
+    @staticmethod
+    async def _invalidate(hotel_ids: set[int]) -> None:
+        await room_cache.invalidate_rooms(hotel_ids)
+        await hotel_search_cache.invalidate_hotels(hotel_ids)
+
+
+def _booking_values(data: dict) -> dict:
+    """
+    Converts the form data of a booking to the values of its columns.
+    """
+    values = {
+        key: data[key] for key in ("date_from", "date_to", "price") if data.get(key) is not None
+    }
+    for relation in ("room", "user"):
+        if data.get(relation):
+            values[f"{relation}_id"] = int(data[relation])
+    return values
@@ -1,4 +1,21 @@
+from prometheus_client import Gauge
 from prometheus_fastapi_instrumentator import Instrumentator
+from sqlalchemy import QueuePool
+
+from app.database import engine
+
+
+def setup_pool_metrics(pool):
+    if not isinstance(pool, QueuePool):
+        return
+    Gauge("db_pool_size", "Configured size of the database pool").set_function(pool.size)
+    Gauge("db_pool_in_use", "Database connections checked out of the pool").set_function(
+        pool.checkedout
+    )
+    Gauge("db_pool_idle", "Idle database connections in the pool").set_function(pool.checkedin)
+    Gauge("db_pool_overflow", "Database connections opened above the pool size").set_function(
+        lambda: max(pool.overflow(), 0)
+    )
 
 
 def setup_instrumentation(app):
@@ -7,3 +24,4 @@ def setup_instrumentation(app):
         excluded_handlers=[".*admin.*", "/metrics"],
     )
     instrumentor.instrument(app).expose(app)
+    setup_pool_metrics(engine.sync_engine.pool)
@@ -2,6 +2,7 @@ from time import time
 
 from fastapi import Request
 
+from app.database import READ_PRIMARY_COOKIE, read_from_primary
 from app.logger import logger
 
 
@@ -15,3 +16,11 @@ def setup_middleware(app):
             extra={"process_time": round(time() - start_time, 3)},
         )
         return response
+
+    @app.middleware("http")
+    async def route_reads_after_writes(request: Request, call_next):
+        token = read_from_primary.set(READ_PRIMARY_COOKIE in request.cookies)
+        try:
+            return await call_next(request)
+        finally:
+            read_from_primary.reset(token)
@@ -0,0 +1,31 @@
+import asyncio
+
+from app.logger import logger
+from app.outbox.outbox_dao import OutboxDAO
+from config import settings
+
+
+async def dispatch_outbox():
+    while True:
+        try:
+            dispatched = await OutboxDAO.dispatch(settings.OUTBOX_BATCH_SIZE)
+        except Exception:
+            logger.error("Cannot dispatch outbox", exc_info=True)
+            dispatched = 0
+        if dispatched == settings.OUTBOX_BATCH_SIZE:
+            continue
+        try:
+            await asyncio.wait_for(OutboxDAO.written.wait(), settings.OUTBOX_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        OutboxDAO.written.clear()
+
+
+def setup_outbox_dispatcher(app):
+    @app.on_event("startup")
+    async def start_outbox_dispatcher():
+        app.state.outbox_dispatcher = asyncio.create_task(dispatch_outbox())
+
+    @app.on_event("shutdown")
+    async def stop_outbox_dispatcher():
+        app.state.outbox_dispatcher.cancel()
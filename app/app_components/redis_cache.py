@@ -1,14 +1,21 @@
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
+import asyncio
+
 from redis import asyncio as aioredis
 
+from app.cache import listen_for_invalidations
 from config import settings
 
 
-def init_cache():
-    redis = aioredis.from_url(
-        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
-        encoding="utf-8",
-        decode_responses=True,
-    )
-    FastAPICache.init(RedisBackend(redis), prefix="/cache")
+def setup_cache_invalidation(app):
+    @app.on_event("startup")
+    async def start_cache_invalidation():
+        redis = aioredis.from_url(
+            f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        app.state.cache_invalidation = asyncio.create_task(listen_for_invalidations(redis))
+
+    @app.on_event("shutdown")
+    async def stop_cache_invalidation():
+        app.state.cache_invalidation.cancel()
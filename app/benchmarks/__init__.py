@@ -0,0 +1,14 @@
+"""
+Benchmarks Package
+
+This package contains benchmarks of the hot paths of the application. Benchmarks are run as
+modules, for example `python -m app.benchmarks.serialization`, and are not collected by pytest.
+
+Modules:
+    - serialization: Measures the cost of encoding list responses per 1000 rows.
+    - images: Measures the CPU time of writing the renditions of one uploaded image.
+    - seed: Loads a synthetic dataset at a configurable scale into the configured database.
+    - load: Drives a running application with concurrent virtual users and reports the
+     throughput and latency percentiles of its endpoints.
+    - compare: Compares the report of a load run with a baseline report.
+"""
@@ -0,0 +1,80 @@
+"""
+Comparison of Load Reports.
+
+Compares the report of a load run with the report of a baseline run (see
+`app.benchmarks.load`) and prints the relative change of the throughput and of the latency
+percentiles of every endpoint. The exit status is 1 if an endpoint regressed by more than the
+tolerance: its throughput dropped, one of its percentiles grew or its error rate grew.
+
+Usage:
+    python -m app.benchmarks.compare baseline.json report.json [--tolerance 0.1]
+"""
+
+import argparse
+import json
+import sys
+
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def change(baseline: float | None, current: float | None) -> float | None:
+    """
+    Returns the relative change from the baseline value, None if one of them is missing.
+    """
+    if not baseline or current is None:
+        return None
+    return round((current - baseline) / baseline, 3)
+
+
+def compare(baseline: dict, report: dict, tolerance: float) -> tuple[dict, list[str]]:
+    """
+    Compares two load reports.
+
+    Args:
+        baseline (dict): The report of the baseline run.
+        report (dict): The report of the compared run.
+        tolerance (float): The relative change above which an endpoint regressed.
+
+    Returns:
+        tuple[dict, list[str]]: The relative changes by endpoint and metric, and the
+         descriptions of the regressions.
+    """
+    changes, regressions = {}, []
+    for endpoint, current in report["endpoints"].items():
+        previous = baseline["endpoints"].get(endpoint)
+        if previous is None:
+            continue
+        endpoint_changes = {
+            metric: change(previous[metric], current[metric])
+            for metric in ("throughput_rps", *LATENCY_METRICS)
+        }
+        changes[endpoint] = endpoint_changes
+        throughput = endpoint_changes["throughput_rps"]
+        if throughput is not None and throughput < -tolerance:
+            regressions.append(f"{endpoint}: throughput {throughput:+.1%}")
+        for metric in LATENCY_METRICS:
+            latency = endpoint_changes[metric]
+            if latency is not None and latency > tolerance:
+                regressions.append(f"{endpoint}: {metric} {latency:+.1%}")
+        previous_rate = previous["errors"] / max(previous["requests"], 1)
+        current_rate = current["errors"] / max(current["requests"], 1)
+        if current_rate > previous_rate + tolerance / 10:
+            regressions.append(f"{endpoint}: error rate {previous_rate:.1%} -> {current_rate:.1%}")
+    return changes, regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("baseline")
+    parser.add_argument("report")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    arguments = parser.parse_args()
+    with open(arguments.baseline, encoding="utf-8") as baseline_file:
+        baseline_report = json.load(baseline_file)
+    with open(arguments.report, encoding="utf-8") as report_file:
+        current_report = json.load(report_file)
+    endpoint_changes, found_regressions = compare(
+        baseline_report, current_report, arguments.tolerance
+    )
+    print(json.dumps({"changes": endpoint_changes, "regressions": found_regressions}, indent=2))
+    sys.exit(1 if found_regressions else 0)
@@ -0,0 +1,115 @@
+"""
+Image Processing Benchmark.
+
+Measures the CPU time the `proceed_picture` task spends on one uploaded image, for two ways of
+producing the configured renditions:
+
+    - baseline: the previous task, decoding the full-resolution image and resizing it to every
+      size from scratch with the default filter and encoder settings.
+    - pipeline: `create_renditions`, decoding once at a reduced scale and downsampling every
+      rendition from the previous one.
+
+Source images are synthetic photos of the given resolution, encoded as JPEG and as PNG. Results
+are printed as JSON with the median CPU time per image in milliseconds and the total size of
+the written renditions.
+
+Usage:
+    python -m app.benchmarks.images [--width 4000] [--height 3000] [--repeat 10]
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image
+
+from app.tasks.image_renditions import create_renditions
+from config import settings
+
+
+def synthetic_photo(width: int, height: int) -> Image.Image:
+    """
+    Returns a noisy colour gradient, which compresses roughly like a photo.
+    """
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 48)
+    radial = Image.radial_gradient("L").resize((width, height))
+    return Image.merge("RGB", (gradient, Image.blend(noise, radial, 0.5), radial))
+
+
+def baseline(path: Path) -> list[Path]:
+    """
+    Writes the renditions as the task did before the rendition pipeline.
+    """
+    written = []
+    image = Image.open(path)
+    for width, height in settings.IMAGE_RENDITIONS:
+        rendition_path = path.with_name(f"baseline_{width}_{height}_{path.stem}.webp")
+        image.resize((width, height)).save(rendition_path, "WEBP")
+        written.append(rendition_path)
+    return written
+
+
+def pipeline(path: Path) -> list[Path]:
+    """
+    Writes the renditions with the configured rendition pipeline.
+    """
+    return create_renditions(
+        path,
+        sizes=settings.IMAGE_RENDITIONS,
+        formats=settings.IMAGE_FORMATS,
+        quality={"webp": settings.IMAGE_WEBP_QUALITY, "avif": settings.IMAGE_AVIF_QUALITY},
+    )
+
+
+def measure(process: Callable[[Path], list[Path]], path: Path, repeat: int) -> dict:
+    """
+    Returns the median CPU time of processing the image and the size of its renditions.
+    """
+    written = process(path)
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        process(path)
+        timings.append(time.process_time() - started)
+    return {
+        "cpu_ms": round(statistics.median(timings) * 1000, 1),
+        "output_kb": round(sum(rendition.stat().st_size for rendition in written) / 1024, 1),
+    }
+
+
+def run(width: int, height: int, repeat: int) -> dict:
+    """
+    Runs the benchmark and returns the results by source format and pipeline.
+    """
+    photo = synthetic_photo(width, height)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for source_format, extension in (("JPEG", "jpg"), ("PNG", "png")):
+            path = Path(directory) / f"1.{extension}"
+            photo.save(path, source_format)
+            results[source_format.lower()] = {
+                name: measure(process, path, repeat)
+                for name, process in (("baseline", baseline), ("pipeline", pipeline))
+            }
+    return {
+        "width": width,
+        "height": height,
+        "renditions": settings.IMAGE_RENDITIONS,
+        "formats": settings.IMAGE_FORMATS,
+        "repeat": repeat,
+        "per_image": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=10)
+    arguments = parser.parse_args()
+    print(json.dumps(run(arguments.width, arguments.height, arguments.repeat), indent=2))
@@ -0,0 +1,273 @@
+"""
+Load Generator for the Booking API.
+
+Drives a running instance of the application with concurrent virtual users. Every virtual
+user logs in as one of the users of the benchmark dataset (see `app.benchmarks.seed`) and then
+runs weighted scenarios in a loop until the run ends:
+
+    - search: searches hotels in the region or city of a mock hotel for a random period.
+    - rooms: lists the rooms of a random hotel for a random period.
+    - booking: books a random room for a random period and deletes the booking.
+    - login: logs in again.
+
+Every request is timed, and the run is reported as JSON with the number of requests and
+errors, the throughput and the p50/p95/p99 latency of every endpoint. Reports of two runs can
+be compared with `app.benchmarks.compare`.
+
+Usage:
+    python -m app.benchmarks.load --base-url http://localhost:8000 --users 50 --duration 60 \\
+        [--hotels 1000] [--rooms 5000] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+import httpx
+
+from app.benchmarks.seed import (
+    BENCHMARK_EMAIL,
+    BENCHMARK_PASSWORD,
+    MAX_NIGHTS,
+    mock_locations,
+)
+
+SCENARIO_WEIGHTS = {"search": 50, "rooms": 30, "booking": 15, "login": 5}
+MAX_SEARCH_NIGHTS = 7
+
+
+class LoadRun:
+    """
+    State of a load run: the parameters of the generated requests and the timings.
+
+    Attributes:
+        hotels (int): The number of hotels of the dataset.
+        rooms (int): The number of rooms of the dataset.
+        start (date): The first day of the period of the dataset.
+        days (int): The number of days of the period of the dataset.
+        rng (Random): The random generator of the requests.
+        locations (list[str]): The searched regions and cities, the first part of the
+         locations of the mock hotels, so searches match many hotels.
+        latencies (defaultdict[str, list[float]]): The latencies of the successful requests
+         by endpoint, in seconds.
+        errors (defaultdict[str, int]): The number of failed requests by endpoint.
+    """
+
+    def __init__(self, hotels: int, rooms: int, start: date, days: int, seed: int):
+        self.hotels = hotels
+        self.rooms = rooms
+        self.start = start
+        self.days = days
+        self.rng = random.Random(seed)
+        self.locations = sorted({location.split(",")[0].strip() for location in mock_locations()})
+        self.latencies: defaultdict[str, list[float]] = defaultdict(list)
+        self.errors: defaultdict[str, int] = defaultdict(int)
+
+    def period(self, max_nights: int) -> dict:
+        """
+        Returns the query parameters of a random period within the dataset period.
+        """
+        date_from = self.start + timedelta(days=self.rng.randrange(self.days))
+        date_to = date_from + timedelta(days=self.rng.randint(1, max_nights))
+        return {"date_from": date_from.isoformat(), "date_to": date_to.isoformat()}
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        url: str,
+        expected: tuple[int, ...] = (200,),
+        **kwargs,
+    ) -> httpx.Response | None:
+        """
+        Sends a timed request and records its latency, or an error if its status is not
+        expected or it fails.
+        """
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[endpoint] += 1
+            return None
+        if response.status_code not in expected:
+            self.errors[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        return response
+
+    async def login(self, client: httpx.AsyncClient, user: int) -> None:
+        """
+        Logs in as the given user of the benchmark dataset.
+        """
+        await self.request(
+            client,
+            "login",
+            "POST",
+            "/v1/auth/login",
+            json={"email": BENCHMARK_EMAIL.format(user), "password": BENCHMARK_PASSWORD},
+        )
+
+    async def search(self, client: httpx.AsyncClient) -> None:
+        """
+        Searches hotels in a random mock location.
+        """
+        location = self.rng.choice(self.locations)
+        await self.request(
+            client,
+            "search",
+            "GET",
+            f"/v1/hotels/{location}",
+            params=self.period(MAX_SEARCH_NIGHTS),
+        )
+
+    async def hotel_rooms(self, client: httpx.AsyncClient) -> None:
+        """
+        Lists the rooms of a random hotel.
+        """
+        hotel_id = self.rng.randint(1, self.hotels)
+        await self.request(
+            client,
+            "rooms",
+            "GET",
+            f"/v1/hotels/{hotel_id}/rooms",
+            params=self.period(MAX_SEARCH_NIGHTS),
+        )
+
+    async def booking(self, client: httpx.AsyncClient) -> None:
+        """
+        Books a random room and deletes the booking. A sold out room is not an error.
+        """
+        params = {"room_id": self.rng.randint(1, self.rooms), **self.period(MAX_NIGHTS)}
+        response = await self.request(
+            client, "booking_create", "POST", "/v1/bookings", expected=(200, 409), params=params
+        )
+        if response is not None and response.status_code == 200:
+            await self.request(
+                client,
+                "booking_delete",
+                "DELETE",
+                "/v1/bookings",
+                params={"bookings_id": response.json()["id"]},
+            )
+
+    async def virtual_user(
+        self,
+        base_url: str,
+        user: int,
+        deadline: float,
+        timeout: float,
+    ) -> None:
+        """
+        Logs in as the given user and runs random scenarios until the deadline.
+        """
+        scenarios = {
+            "search": self.search,
+            "rooms": self.hotel_rooms,
+            "booking": self.booking,
+            "login": lambda client: self.login(client, user),
+        }
+        names, weights = list(SCENARIO_WEIGHTS), list(SCENARIO_WEIGHTS.values())
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+            await self.login(client, user)
+            while time.monotonic() < deadline:
+                await scenarios[self.rng.choices(names, weights)[0]](client)
+
+    def report(self, elapsed: float) -> dict:
+        """
+        Returns the throughput and latency percentiles of every endpoint.
+        """
+        endpoints = {}
+        for endpoint in sorted(set(self.latencies) | set(self.errors)):
+            latencies = sorted(self.latencies[endpoint])
+            endpoints[endpoint] = {
+                "requests": len(latencies) + self.errors[endpoint],
+                "errors": self.errors[endpoint],
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+            }
+        return endpoints
+
+
+def percentile(latencies: list[float], rank: float) -> float | None:
+    """
+    Returns the nearest-rank percentile of sorted latencies in milliseconds.
+    """
+    if not latencies:
+        return None
+    index = max(math.ceil(rank / 100 * len(latencies)) - 1, 0)
+    return round(latencies[index] * 1000, 2)
+
+
+async def run(
+    base_url: str,
+    users: int,
+    duration: float,
+    hotels: int,
+    rooms: int,
+    start: date,
+    days: int,
+    seed: int,
+    timeout: float,
+) -> dict:
+    """
+    Runs the virtual users for the given duration and returns the report of the run.
+    """
+    load_run = LoadRun(hotels=hotels, rooms=rooms, start=start, days=days, seed=seed)
+    started = time.monotonic()
+    await asyncio.gather(
+        *(
+            load_run.virtual_user(base_url, user + 1, started + duration, timeout)
+            for user in range(users)
+        )
+    )
+    elapsed = time.monotonic() - started
+    return {
+        "base_url": base_url,
+        "users": users,
+        "duration_s": round(elapsed, 1),
+        "endpoints": load_run.report(elapsed),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--hotels", type=int, default=1000)
+    parser.add_argument("--rooms", type=int, default=5000)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2025, 1, 1))
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", help="the file to write the report to, stdout by default")
+    arguments = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = asyncio.run(
+        run(
+            base_url=arguments.base_url,
+            users=arguments.users,
+            duration=arguments.duration,
+            hotels=arguments.hotels,
+            rooms=arguments.rooms,
+            start=arguments.start,
+            days=arguments.days,
+            seed=arguments.seed,
+            timeout=arguments.timeout,
+        )
+    )
+    content = json.dumps(report, indent=2, ensure_ascii=False)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            output.write(content)
+    else:
+        print(content)
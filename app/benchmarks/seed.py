@@ -0,0 +1,248 @@
+"""
+Synthetic Dataset for Benchmarks.
+
+Recreates the tables of the configured database and fills them with a synthetic dataset at the
+requested scale. Hotels, rooms and users are generated from the shapes of the mock data, and
+bookings are spread randomly over a period without overbooking any room. Rows are loaded with
+`COPY`, so millions of bookings take seconds rather than minutes. The daily room occupancy is
+rebuilt and the tables are analyzed at the end.
+
+Every user gets the password of the first mock user, `BENCHMARK_PASSWORD`, so the load
+generator can log in as any of them.
+
+Usage:
+    python -m app.benchmarks.seed --hotels 1000 --rooms-per-hotel 5 --users 10000 \\
+        --bookings 1000000 [--start 2025-01-01] [--days 365] [--seed 42]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import text
+
+from app.booking.booking_dao import BookingDAO
+from app.database import Base, engine, init_models
+from config import settings
+
+MOCK_DATA = Path(__file__).resolve().parents[1] / "tests" / "mock_data"
+
+BENCHMARK_PASSWORD = "firstuser"
+BENCHMARK_EMAIL = "user{}@benchmark.ru"
+
+MAX_NIGHTS = 14
+BOOKINGS_PER_COPY = 100_000
+ATTEMPTS_PER_BOOKING = 5
+
+
+def mock_data(model: str) -> list[dict]:
+    """
+    Returns the mock rows of a model.
+    """
+    with open(MOCK_DATA / f"{model}.json", encoding="utf-8") as json_file:
+        return json.load(json_file)
+
+
+def mock_locations() -> list[str]:
+    """
+    Returns the locations of the mock hotels, the search terms of the benchmarks.
+    """
+    return sorted({hotel["location"] for hotel in mock_data("hotels")})
+
+
+async def recreate_tables() -> None:
+    """
+    Drops and creates all tables of the application.
+    """
+    init_models()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+
+def hotel_and_room_records(
+    rng: random.Random,
+    hotels: int,
+    rooms_per_hotel: int,
+) -> tuple[list[tuple], list[tuple]]:
+    """
+    Returns the `COPY` records of the hotels and of their rooms, picked from the mock rooms.
+    """
+    mock_hotels, mock_rooms = mock_data("hotels"), mock_data("rooms")
+    hotel_records, room_records = [], []
+    for hotel_index in range(hotels):
+        hotel = mock_hotels[hotel_index % len(mock_hotels)]
+        hotel_rooms = [mock_rooms[rng.randrange(len(mock_rooms))] for _ in range(rooms_per_hotel)]
+        hotel_records.append(
+            (
+                f"{hotel['name']} {hotel_index + 1}",
+                hotel["location"],
+                json.dumps(hotel["services"]),
+                sum(room["quantity"] for room in hotel_rooms),
+                hotel["image_id"],
+            )
+        )
+        room_records.extend(
+            (
+                hotel_index + 1,
+                room["name"],
+                room["description"],
+                room["price"],
+                json.dumps(room["services"]),
+                room["quantity"],
+                room["image_id"],
+            )
+            for room in hotel_rooms
+        )
+    return hotel_records, room_records
+
+
+def booking_records(
+    rng: random.Random,
+    rooms: list,
+    users: int,
+    bookings: int,
+    start: date,
+    days: int,
+) -> Iterator[list[tuple]]:
+    """
+    Yields the `COPY` records of the bookings in chunks of `BOOKINGS_PER_COPY`.
+
+    A booking is only generated if its room is free on every day of the period, so the
+    dataset never overbooks a room. Fewer bookings than requested are generated when the
+    rooms fill up.
+    """
+    occupancy = {room["id"]: array("i", [0]) * (days + MAX_NIGHTS + 1) for room in rooms}
+    chunk = []
+    for _ in range(bookings):
+        for _ in range(ATTEMPTS_PER_BOOKING):
+            room = rooms[rng.randrange(len(rooms))]
+            first_day, nights = rng.randrange(days), rng.randint(1, MAX_NIGHTS)
+            counters = occupancy[room["id"]]
+            booked_days = range(first_day, first_day + nights + 1)
+            if all(counters[day] < room["quantity"] for day in booked_days):
+                break
+        else:
+            continue
+        for day in booked_days:
+            counters[day] += 1
+        date_from = start + timedelta(days=first_day)
+        chunk.append(
+            (
+                room["id"],
+                rng.randint(1, users),
+                date_from,
+                date_from + timedelta(days=nights),
+                room["price"],
+            )
+        )
+        if len(chunk) == BOOKINGS_PER_COPY:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def seed(
+    hotels: int,
+    rooms_per_hotel: int,
+    users: int,
+    bookings: int,
+    start: date,
+    days: int,
+    seed_value: int,
+) -> dict:
+    """
+    Recreates the tables and loads the synthetic dataset.
+
+    Returns:
+        dict: The number of loaded rows by table and the seeding time.
+    """
+    rng = random.Random(seed_value)
+    started = time.perf_counter()
+    hotel_records, room_records = hotel_and_room_records(rng, hotels, rooms_per_hotel)
+    hashed_password = mock_data("users")[0]["hashed_password"]
+    await recreate_tables()
+
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        async with driver.transaction():
+            await driver.copy_records_to_table(
+                "hotels",
+                records=hotel_records,
+                columns=["name", "location", "services", "rooms_quantity", "image_id"],
+            )
+            await driver.copy_records_to_table(
+                "rooms",
+                records=room_records,
+                columns=[
+                    "hotel_id",
+                    "name",
+                    "description",
+                    "price",
+                    "services",
+                    "quantity",
+                    "image_id",
+                ],
+            )
+            await driver.copy_records_to_table(
+                "users",
+                records=[
+                    (BENCHMARK_EMAIL.format(index + 1), hashed_password) for index in range(users)
+                ],
+                columns=["email", "hashed_password"],
+            )
+            rooms = await driver.fetch("SELECT id, quantity, price FROM rooms ORDER BY id")
+            loaded = 0
+            for chunk in booking_records(rng, rooms, users, bookings, start, days):
+                await driver.copy_records_to_table(
+                    "bookings",
+                    records=chunk,
+                    columns=["room_id", "user_id", "date_from", "date_to", "price"],
+                )
+                loaded += len(chunk)
+
+    await BookingDAO.rebuild_occupancy()
+    async with engine.begin() as connection:
+        await connection.execute(text("ANALYZE"))
+
+    return {
+        "hotels": len(hotel_records),
+        "rooms": len(room_records),
+        "users": users,
+        "bookings": loaded,
+        "seconds": round(time.perf_counter() - started, 1),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hotels", type=int, default=1000)
+    parser.add_argument("--rooms-per-hotel", type=int, default=5)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2025, 1, 1))
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=42)
+    arguments = parser.parse_args()
+    if settings.MODE == "PROD":
+        parser.error("the benchmark dataset replaces all data and cannot be seeded in PROD mode")
+    summary = asyncio.run(
+        seed(
+            hotels=arguments.hotels,
+            rooms_per_hotel=arguments.rooms_per_hotel,
+            users=arguments.users,
+            bookings=arguments.bookings,
+            start=arguments.start,
+            days=arguments.days,
+            seed_value=arguments.seed,
+        )
+    )
+    print(json.dumps(summary, indent=2))
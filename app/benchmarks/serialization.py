@@ -0,0 +1,166 @@
+"""
+Serialization Benchmark.
+
+Measures the cost of turning 1000 rows of the list endpoints (booking history, hotel search,
+room listing) into a JSON response body, for three encoders:
+
+    - stdlib: the default FastAPI path, validating the rows against the response schema,
+      converting the models back to JSON compatible Python objects and encoding them with
+      `json.dumps` as `JSONResponse` does.
+    - orjson: the same path with `orjson.dumps` as `ORJSONResponse` does.
+    - fast_path: `model_list_response`, validating and encoding in one pass of pydantic-core.
+
+Rows are generated from the shapes of the mock data. Results are printed as JSON with the
+median time per 1000 rows in milliseconds.
+
+Usage:
+    python -m app.benchmarks.serialization [--rows 1000] [--repeat 50]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from app.booking.booking_schemas import BookingsInfoSchema
+from app.hotels.hotel_schemas import HotelsRoomsLeftSchema
+from app.hotels.rooms.room_schemas import HotelRoomsSchema
+from app.responses import model_list_response
+
+MOCK_DATA = Path(__file__).resolve().parents[1] / "tests" / "mock_data"
+
+
+def _mock(model: str) -> list[dict]:
+    with open(MOCK_DATA / f"{model}.json", encoding="utf-8") as json_file:
+        return json.load(json_file)
+
+
+def booking_rows(count: int) -> list[dict]:
+    """
+    Returns rows shaped like the result of `BookingDAO.find_all`.
+    """
+    rooms = _mock("rooms")
+    rows = []
+    for index in range(count):
+        room = rooms[index % len(rooms)]
+        date_from = date(2025, 1, 1) + timedelta(days=index % 365)
+        rows.append(
+            {
+                "id": index + 1,
+                "room_id": index % len(rooms) + 1,
+                "user_id": 1,
+                "date_from": date_from,
+                "date_to": date_from + timedelta(days=7),
+                "price": room["price"],
+                "total_cost": room["price"] * 7,
+                "total_days": 7,
+                "image_id": room["image_id"],
+                "name": room["name"],
+                "description": room["description"],
+                "services": room["services"],
+            }
+        )
+    return rows
+
+
+def hotel_rows(count: int) -> list[dict]:
+    """
+    Returns rows shaped like the hotel search result.
+    """
+    hotels = _mock("hotels")
+    return [
+        {
+            **hotels[index % len(hotels)],
+            "id": index + 1,
+            "rooms_left": index % 10 + 1,
+            "min_price": 4000 + index % 20 * 500,
+        }
+        for index in range(count)
+    ]
+
+
+def room_rows(count: int) -> list[dict]:
+    """
+    Returns rows shaped like the result of `RoomsDAO.get_left_rooms`.
+    """
+    rooms = _mock("rooms")
+    return [
+        {
+            **rooms[index % len(rooms)],
+            "id": index + 1,
+            "total_cost": rooms[index % len(rooms)]["price"] * 3,
+            "rooms_left": index % 5,
+        }
+        for index in range(count)
+    ]
+
+
+def encoders(schema: type[BaseModel]) -> dict[str, Callable[[list[dict]], bytes]]:
+    """
+    Returns the encoders to compare for lists of the given schema.
+    """
+    adapter = TypeAdapter(list[schema])
+
+    def stdlib(rows: list[dict]) -> bytes:
+        content = adapter.dump_python(adapter.validate_python(rows), mode="json")
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+    def orjson_encoder(rows: list[dict]) -> bytes:
+        content = adapter.dump_python(adapter.validate_python(rows), mode="json")
+        return orjson.dumps(content)
+
+    def fast_path(rows: list[dict]) -> bytes:
+        return model_list_response(schema, rows).body
+
+    return {"stdlib": stdlib, "orjson": orjson_encoder, "fast_path": fast_path}
+
+
+def measure(encode: Callable[[list[dict]], bytes], rows: list[dict], repeat: int) -> float:
+    """
+    Returns the median time of encoding the rows, in milliseconds per 1000 rows.
+    """
+    encode(rows)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(rows)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000 * 1000 / len(rows)
+
+
+def run(rows: int, repeat: int) -> dict:
+    """
+    Runs the benchmark and returns the results by endpoint and encoder.
+    """
+    cases = {
+        "bookings": (BookingsInfoSchema, booking_rows(rows)),
+        "hotels_search": (HotelsRoomsLeftSchema, hotel_rows(rows)),
+        "hotel_rooms": (HotelRoomsSchema, room_rows(rows)),
+    }
+    results = {}
+    for name, (schema, case_rows) in cases.items():
+        bodies = {
+            encoder: json.loads(encode(case_rows)) for encoder, encode in encoders(schema).items()
+        }
+        assert len({json.dumps(body) for body in bodies.values()}) == 1
+        results[name] = {
+            encoder: round(measure(encode, case_rows, repeat), 3)
+            for encoder, encode in encoders(schema).items()
+        }
+    return {"rows": rows, "repeat": repeat, "ms_per_1000_rows": results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    arguments = parser.parse_args()
+    print(json.dumps(run(arguments.rows, arguments.repeat), indent=2))
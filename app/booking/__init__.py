@@ -7,7 +7,8 @@ It consists of DAO, models, schemas, and API routes related to bookings.
 Modules:
     - dao: Contains the BookingDAO class with asynchronous methods for managing bookings
      in the database.
-    - models: Contains the `Bookings` model for representing booking records in the database.
+    - models: Contains the `Bookings` model for representing booking records in the database
+     and the `RoomDailyOccupancy` model with the booked rooms of each room type per day.
     - schemas: Contains the Pydantic schemas for validating and serializing booking-related data.
     - router: Contains FastAPI router for handling booking-related API endpoints, such as creating,
               retrieving, and deleting bookings.
@@ -17,14 +18,24 @@ to API interaction.
 """
 
 from app.booking.booking_dao import BookingDAO
-from app.booking.booking_models import Bookings
+from app.booking.booking_models import Bookings, RoomDailyOccupancy
 from app.booking.booking_router import router
-from app.booking.booking_schemas import BookingsInfoSchema, BookingsSchema
+from app.booking.booking_schemas import (
+    BookingsBatchItemSchema,
+    BookingsBatchResultSchema,
+    BookingsBatchSchema,
+    BookingsInfoSchema,
+    BookingsSchema,
+)
 
 __all__ = [
     "BookingDAO",
     "Bookings",
+    "RoomDailyOccupancy",
     "BookingsSchema",
     "BookingsInfoSchema",
+    "BookingsBatchItemSchema",
+    "BookingsBatchSchema",
+    "BookingsBatchResultSchema",
     "router",
 ]
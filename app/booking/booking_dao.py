@@ -3,21 +3,64 @@ Booking Data Access Object Module
 
 This module provides the BookingDAO class, which offers asynchronous methods
 for performing booking-related operations in the database, such as adding a new
-booking and retrieving all bookings for a specific user.
+booking, booking several rooms at once and retrieving the bookings of a user page by page
+or as a stream. It also outdates the cached hotel searches covering the hotels of the booked
+rooms. Confirmation emails of new bookings are written to the outbox in the same transactions
+(see `app.outbox`).
+
+The `room_daily_occupancy` table is updated in the same transactions that add, change and
+delete bookings, and availability checks read it instead of aggregating bookings. It can be
+rebuilt from the bookings and checked against them (see `rebuild_occupancy` and
+`check_occupancy`).
 """
 
-from datetime import date
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import AsyncIterator
 
-from sqlalchemy import and_, func, insert, select
+from sqlalchemy import (
+    Date,
+    Select,
+    and_,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.booking.booking_models import Bookings
-from app.booking.booking_schemas import BookingsInfoSchema
+from app.booking.booking_models import Bookings, RoomDailyOccupancy
+from app.booking.booking_schemas import (
+    BookingsBatchItemSchema,
+    BookingsInfoSchema,
+    BookingsSchema,
+)
 from app.dao.base import BaseDAO
-from app.database import async_session_maker
+from app.database import async_session_maker, read_session_maker, session_scope
+from app.hotels.hotel_cache import hotel_search_cache
 from app.hotels.rooms.room_models import Rooms
 from app.logger import logger
+from app.outbox.outbox_dao import OutboxDAO
+
+BOOKING_LOCK_NAMESPACE = 1
+
+OCCUPANCY_ROWS_PER_STATEMENT = 10000
+
+BOOKINGS_STREAM_CHUNK = 500
+
+CONFIRMATION_TASK = "app.tasks.tasks.send_bookings_confirmation_email"
+BATCH_CONFIRMATION_TASK = "app.tasks.tasks.send_bookings_batch_confirmation_email"
+
+EXPECTED_OCCUPANCY_SQL = """
+    SELECT room_id, day::date AS day, count(*) AS booked
+    FROM bookings, generate_series(date_from, date_to, interval '1 day') AS day
+    GROUP BY room_id, day
+"""
 
 
 class BookingDAO(BaseDAO):
@@ -37,22 +80,30 @@ class BookingDAO(BaseDAO):
         room_id: int,
         date_from: date,
         date_to: date,
+        session: AsyncSession | None = None,
+        confirm_to: str | None = None,
     ) -> Bookings | None:
         """
         Asynchronously adds a new booking for a specified room within a given date range.
 
-        The method checks room availability by determining the number of rooms already booked
-        for the specified period and comparing it against the total quantity available.
-        If at least one room is free, it retrieves the room's price, inserts a new booking
-        record into the database, commits the transaction, and returns the created booking.
+        The method takes a transaction-level advisory lock on the room, so concurrent bookings
+        of the same room are serialized and cannot both take its last free unit. The
+        availability check, the price lookup and the insert are then done by a single
+        `INSERT ... SELECT` statement, which inserts nothing when the room is sold out.
         In case no rooms are available or if an exception occurs during the process, it logs
         the error details and returns None.
 
+        The confirmation email is written to the outbox in the transaction of the booking, so
+        it is sent if and only if the booking is committed.
+
         Args:
             user_id (int): The identifier of the user making the booking.
             room_id (int): The identifier of the room to be booked.
             date_from (date): The starting date of the booking period.
             date_to (date): The ending date of the booking period.
+            session (AsyncSession | None): The session to use instead of a new one.
+            confirm_to (str | None): The email address to send the confirmation to, None to
+             send no confirmation.
 
         Returns:
             Bookings: The newly created booking object if the booking is successful.
@@ -63,27 +114,32 @@ class BookingDAO(BaseDAO):
             The function does not propagate these exceptions further.
         """
         try:
-            async with async_session_maker() as session:
-                available_rooms = await cls._get_available_rooms(
-                    session, room_id, date_from, date_to
-                )
-                if available_rooms <= 0:
-                    logger.info(
-                        "Нет свободных комнат для бронирования.",
-                        extra={"room_id": room_id, "date_from": date_from, "date_to": date_to},
-                    )
-                    return None
-                price: int | None = await cls._get_room_price(session, room_id)
-
+            async with session_scope(session) as session:
+                hotel_ids = await cls._lock_rooms(session, [room_id])
                 booking_new = await cls._create_booking(
                     session,
                     user_id,
                     room_id,
                     date_from,
                     date_to,
-                    price,
                 )
+                if booking_new is None:
+                    await session.rollback()
+                    logger.info(
+                        "Нет свободных комнат для бронирования.",
+                        extra={"room_id": room_id, "date_from": date_from, "date_to": date_to},
+                    )
+                    return None
+                await cls._occupy(session, [booking_new], 1)
+                if confirm_to is not None:
+                    await OutboxDAO.add(
+                        session,
+                        CONFIRMATION_TASK,
+                        {"bookings": _confirmation(booking_new), "email_to": confirm_to},
+                    )
                 await session.commit()
+                OutboxDAO.notify()
+                await hotel_search_cache.invalidate_hotels(hotel_ids)
                 return booking_new
         except (SQLAlchemyError, Exception) as error:
             if isinstance(error, SQLAlchemyError):
@@ -102,117 +158,437 @@ class BookingDAO(BaseDAO):
                 exc_info=True,
             )
 
+    @classmethod
+    async def add_many(
+        cls,
+        user_id: int,
+        items: list[BookingsBatchItemSchema],
+        all_or_nothing: bool = True,
+        session: AsyncSession | None = None,
+        confirm_to: str | None = None,
+    ) -> tuple[list[Bookings], list[BookingsBatchItemSchema]] | None:
+        """
+        Asynchronously adds bookings for several rooms and periods at once.
+
+        All rooms of the batch are locked with advisory locks, their availability is checked
+        in one pass and the accepted bookings are inserted with one multi-row
+        `INSERT ... RETURNING` statement. In `all_or_nothing` mode nothing is inserted when at
+        least one item cannot be booked. One confirmation email listing the created bookings
+        is written to the outbox in the same transaction.
+
+        Args:
+            user_id (int): The identifier of the user making the bookings.
+            items (list[BookingsBatchItemSchema]): The requested rooms and periods.
+            all_or_nothing (bool): Whether the batch must be booked entirely or not at all.
+            session (AsyncSession | None): The session to use instead of a new one.
+            confirm_to (str | None): The email address to send the confirmation to, None to
+             send no confirmation.
+
+        Returns:
+            tuple[list[Bookings], list[BookingsBatchItemSchema]]: The created bookings and the
+             items that could not be booked.
+            None: if an exception occurs during the process.
+        """
+        try:
+            async with session_scope(session) as session:
+                hotel_ids = await cls._lock_rooms(
+                    session, sorted({item.room_id for item in items})
+                )
+                accepted, rejected = await cls._split_available(session, user_id, items)
+                if not accepted or (rejected and all_or_nothing):
+                    await session.rollback()
+                    logger.info(
+                        "Нет свободных комнат для бронирования.",
+                        extra={"user_id": user_id, "rejected": len(rejected)},
+                    )
+                    return [], rejected
+
+                add_bookings_query = insert(Bookings).values(accepted).returning(Bookings)
+                result = await session.execute(add_bookings_query)
+                bookings_new = result.scalars().all()
+                await cls._occupy(session, bookings_new, 1)
+                if confirm_to is not None:
+                    await OutboxDAO.add(
+                        session,
+                        BATCH_CONFIRMATION_TASK,
+                        {
+                            "bookings": [_confirmation(booking) for booking in bookings_new],
+                            "email_to": confirm_to,
+                        },
+                    )
+                await session.commit()
+                OutboxDAO.notify()
+                await hotel_search_cache.invalidate_hotels(hotel_ids)
+                return bookings_new, rejected
+        except Exception:
+            logger.error(
+                "Cannot add bookings batch",
+                extra={"user_id": user_id, "items": len(items)},
+                exc_info=True,
+            )
+
+    @classmethod
+    async def delete(cls, session: AsyncSession | None = None, **filter_by) -> Bookings | None:
+        """
+        Deletes the booking that matches the filter criteria together with its daily
+        occupancy and outdates the cached searches covering its hotel.
+
+        Args:
+            session (AsyncSession | None): The session to use instead of a new one.
+            filter_by: Keyword arguments representing filter criteria (example: `{"id": 1}`).
+
+        Returns:
+            Bookings | None: The deleted booking, or None if no booking was found.
+        """
+        async with session_scope(session) as session:
+            query = delete(Bookings).filter_by(**filter_by).returning(Bookings)
+            result = await session.execute(query)
+            deleted = result.scalars().one_or_none()
+            if deleted is None:
+                return None
+            await cls._occupy(session, [deleted], -1)
+            hotel_id = await session.scalar(
+                select(Rooms.hotel_id).where(Rooms.id == deleted.room_id)
+            )
+            await session.commit()
+        await hotel_search_cache.invalidate_hotels([hotel_id])
+        return deleted
+
+    @classmethod
+    async def update(
+        cls,
+        booking_id: int,
+        session: AsyncSession | None = None,
+        **values,
+    ) -> Bookings | None:
+        """
+        Changes a booking and moves its daily occupancy to its new room and period.
+
+        The old and the new room are locked as in `add`, the occupancy of the old booking is
+        released and the changed booking is only kept if its room is still available for
+        its period. The cached searches of both hotels are outdated after the commit.
+
+        Args:
+            booking_id (int): The identifier of the booking.
+            session (AsyncSession | None): The session to use instead of a new one.
+            values: The new values of the booking columns (example: `{"room_id": 2}`).
+
+        Returns:
+            Bookings | None: The changed booking, or None if it was not found or its new room
+             is sold out.
+        """
+        async with session_scope(session) as session:
+            booking = await session.get(Bookings, booking_id, with_for_update=True)
+            if booking is None:
+                return None
+            hotel_ids = await cls._lock_rooms(
+                session, [booking.room_id, values.get("room_id", booking.room_id)]
+            )
+            await cls._occupy(session, [booking], -1)
+            for key, value in values.items():
+                setattr(booking, key, value)
+            await session.flush()
+            rooms_left = await session.scalar(
+                select(
+                    Rooms.quantity
+                    - _booked_rooms(booking.room_id, booking.date_from, booking.date_to)
+                ).where(Rooms.id == booking.room_id)
+            )
+            if rooms_left is None or rooms_left <= 0:
+                await session.rollback()
+                logger.info(
+                    "Нет свободных комнат для бронирования.",
+                    extra={"booking_id": booking_id, "room_id": values.get("room_id")},
+                )
+                return None
+            await cls._occupy(session, [booking], 1)
+            await session.commit()
+        await hotel_search_cache.invalidate_hotels(hotel_ids)
+        return booking
+
+    @classmethod
+    async def rebuild_occupancy(cls) -> None:
+        """
+        Rebuilds the daily room occupancy from the bookings.
+
+        The bookings table is locked against writes while the occupancy is recomputed, so no
+        booking can be added or deleted between the two.
+        """
+        async with async_session_maker() as session:
+            await session.execute(text("LOCK TABLE bookings IN SHARE MODE"))
+            await session.execute(delete(RoomDailyOccupancy))
+            await session.execute(
+                text(
+                    "INSERT INTO room_daily_occupancy (room_id, day, booked) "
+                    + EXPECTED_OCCUPANCY_SQL
+                )
+            )
+            await session.commit()
+
+    @classmethod
+    async def check_occupancy(cls) -> list[dict]:
+        """
+        Compares the daily room occupancy with the bookings.
+
+        Returns:
+            list[dict]: The room, day, expected and stored number of booked rooms of every
+             day where the occupancy does not match the bookings.
+        """
+        check_query = text(
+            f"""
+            WITH expected AS ({EXPECTED_OCCUPANCY_SQL})
+            SELECT
+                coalesce(expected.room_id, stored.room_id) AS room_id,
+                coalesce(expected.day, stored.day) AS day,
+                coalesce(expected.booked, 0) AS expected,
+                coalesce(stored.booked, 0) AS stored
+            FROM expected
+            FULL JOIN room_daily_occupancy AS stored
+                ON stored.room_id = expected.room_id AND stored.day = expected.day
+            WHERE coalesce(expected.booked, 0) <> coalesce(stored.booked, 0)
+            ORDER BY room_id, day
+            """
+        )
+        async with async_session_maker() as session:
+            mismatches = await session.execute(check_query)
+            return [dict(mismatch) for mismatch in mismatches.mappings()]
+
     @classmethod
     async def find_all(
         cls,
         user_id: int,
+        limit: int | None = None,
+        after: tuple[date, int] | None = None,
+        session: AsyncSession | None = None,
     ) -> list[BookingsInfoSchema]:
         """
-        Asynchronously retrieves all bookings for the specified user.
+        Asynchronously retrieves a page of bookings for the specified user.
 
         This method queries the database to fetch booking details for the given user_id.
         It performs a join between the Bookings and Rooms tables to include related room
-        information such as image, name, description, and services. The results are returned
-        as a list of mappings that conform to the BookingsInfoSchema.
+        information such as image, name, description, and services. Bookings are ordered by
+        start date and ID and paginated by key: the next page starts after the last
+        booking of the previous one, so the cost of a page does not depend on its position.
 
         Args:
             user_id (int): The identifier of the user whose bookings are to be retrieved.
+            limit (int | None): The maximum number of bookings, all of them if None.
+            after (tuple[date, int] | None): The start date and ID of the booking after
+             which the page starts.
+            session (AsyncSession | None): The session to use instead of a new one.
 
         Returns:
             list[BookingsInfoSchema]: A list of booking records with associated room details.
         """
-        async with async_session_maker() as session:
-            query_bookings = (
-                select(
-                    Bookings.room_id,
-                    Bookings.user_id,
-                    Bookings.date_from,
-                    Bookings.date_to,
-                    Bookings.price,
-                    Bookings.total_cost,
-                    Bookings.total_days,
-                    Rooms.image_id,
-                    Rooms.name,
-                    Rooms.description,
-                    Rooms.services,
-                )
-                .select_from(Bookings)
-                .join(Rooms, Rooms.id == Bookings.room_id, isouter=True)
-                .where(user_id == Bookings.user_id)
-            )
+        query_bookings = cls._user_bookings_query(user_id, after).limit(limit)
+        async with session_scope(session, read_session_maker()) as session:
             bookings = await session.execute(query_bookings)
             bookings = bookings.mappings().all()
             return bookings
 
     @classmethod
-    async def _get_available_rooms(
-        cls, session: AsyncSession, room_id: int, date_from: date, date_to: date
-    ) -> int:
+    async def stream_all(
+        cls,
+        user_id: int,
+        after: tuple[date, int] | None = None,
+    ) -> AsyncIterator[BookingsInfoSchema]:
         """
-        return available rooms for the specified date range.
+        Asynchronously yields the bookings of the specified user one by one.
+
+        Rows are fetched from a server-side cursor in chunks of `BOOKINGS_STREAM_CHUNK`, so
+        the full list is never loaded into memory. The bookings are ordered as in
+        `find_all`.
+
+        Args:
+            user_id (int): The identifier of the user whose bookings are to be retrieved.
+            after (tuple[date, int] | None): The start date and ID of the booking after
+             which the bookings start.
+
+        Yields:
+            BookingsInfoSchema: A booking record with associated room details.
+        """
+        query_bookings = cls._user_bookings_query(user_id, after).execution_options(
+            yield_per=BOOKINGS_STREAM_CHUNK
+        )
+        async with read_session_maker()() as session:
+            bookings = await session.stream(query_bookings)
+            async for booking in bookings.mappings():
+                yield booking
+
+    @staticmethod
+    def _user_bookings_query(user_id: int, after: tuple[date, int] | None) -> Select:
+        """
+        Builds the query of the bookings of a user ordered by start date and ID.
+        """
+        query_bookings = (
+            select(
+                Bookings.id,
+                Bookings.room_id,
+                Bookings.user_id,
+                Bookings.date_from,
+                Bookings.date_to,
+                Bookings.price,
+                Bookings.total_cost,
+                Bookings.total_days,
+                Rooms.image_id,
+                Rooms.name,
+                Rooms.description,
+                Rooms.services,
+            )
+            .select_from(Bookings)
+            .join(Rooms, Rooms.id == Bookings.room_id, isouter=True)
+            .where(user_id == Bookings.user_id)
+            .order_by(Bookings.date_from, Bookings.id)
+        )
+        if after is not None:
+            query_bookings = query_bookings.where(
+                tuple_(Bookings.date_from, Bookings.id)
+                > tuple_(literal(after[0], Date), literal(after[1]))
+            )
+        return query_bookings
+
+    @classmethod
+    async def _lock_rooms(cls, session: AsyncSession, room_ids: list[int]) -> list[int]:
+        """
+        Takes transaction-level advisory locks on the specified rooms.
+
+        The locks are taken one by one in the order of room IDs, so concurrent transactions
+        locking overlapping sets of rooms cannot deadlock. They are released automatically
+        when the transaction is committed or rolled back.
 
         Args:
             session (AsyncSession): The database session object.
-            room_id (int): The identifier of the room to be booked.
-            date_from (date): The starting date of the booking period.
-            date_to (date): The ending date of the booking period.
+            room_ids (list[int]): The identifiers of the rooms.
+
         Returns:
-            int: The number of available rooms for the specified date range.
+            list[int]: The identifiers of the hotels the rooms belong to.
         """
-        booked_rooms = (
-            select(Bookings)
-            .where(
-                and_(
-                    Bookings.room_id == room_id,
-                    Bookings.date_from <= date_to,
-                    Bookings.date_to >= date_from,
-                )
+        for room_id in sorted(set(room_ids)):
+            await session.execute(
+                select(func.pg_advisory_xact_lock(BOOKING_LOCK_NAMESPACE, room_id))
             )
-            .cte("booked_rooms")
+        hotel_ids = await session.scalars(
+            select(Rooms.hotel_id).where(Rooms.id.in_(room_ids)).distinct()
         )
+        return list(set(hotel_ids))
 
-        query_rooms_left = (
-            select((Rooms.quantity - func.count(booked_rooms.c.room_id)).label("rooms_left"))
-            .select_from(Rooms)
-            .join(
-                booked_rooms,
-                Rooms.id == booked_rooms.c.room_id,
-                isouter=True,
+    @classmethod
+    async def _occupy(
+        cls,
+        session: AsyncSession,
+        bookings: list[Bookings],
+        delta: int,
+    ) -> None:
+        """
+        Adds `delta` to the daily occupancy of every day of the given bookings.
+
+        Args:
+            session (AsyncSession): The database session object.
+            bookings (list[Bookings]): The added or deleted bookings.
+            delta (int): 1 for added bookings, -1 for deleted ones.
+        """
+        changes = defaultdict(int)
+        for booking in bookings:
+            for day in _days(booking.date_from, booking.date_to):
+                changes[(booking.room_id, day)] += delta
+        rows = [
+            {"room_id": room_id, "day": day, "booked": booked}
+            for (room_id, day), booked in changes.items()
+        ]
+        for start in range(0, len(rows), OCCUPANCY_ROWS_PER_STATEMENT):
+            query = pg_insert(RoomDailyOccupancy).values(
+                rows[start : start + OCCUPANCY_ROWS_PER_STATEMENT]
             )
-            .where(room_id == Rooms.id)
-            .group_by(Rooms.quantity, booked_rooms.c.room_id)
-        )
-        rooms_result = await session.execute(query_rooms_left)
-        rooms_left = rooms_result.scalar()
-        return rooms_left if rooms_left is not None else 0
+            query = query.on_conflict_do_update(
+                index_elements=[RoomDailyOccupancy.room_id, RoomDailyOccupancy.day],
+                set_={"booked": RoomDailyOccupancy.booked + query.excluded.booked},
+            )
+            await session.execute(query)
 
     @classmethod
-    async def _get_room_price(cls, session: AsyncSession, room_id: int) -> int | None:
+    async def _split_available(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        items: list[BookingsBatchItemSchema],
+    ) -> tuple[list[dict], list[BookingsBatchItemSchema]]:
         """
-        return rooms price for specified room.
+        Splits batch items into bookable rows and rejected items.
+
+        The rooms and their daily occupancy over the batch period are read with two queries.
+        Items are then checked in order, and each accepted item occupies its days for the
+        items after it, so a batch cannot overbook a room by itself.
 
         Args:
             session (AsyncSession): The database session object.
-            room_id (int): The identifier of the room.
-        Return:
-            int | None: Room price.
+            user_id (int): The identifier of the user making the bookings.
+            items (list[BookingsBatchItemSchema]): The requested rooms and periods.
+
+        Returns:
+            tuple[list[dict], list[BookingsBatchItemSchema]]: Values of the bookings to insert
+             and the items that cannot be booked.
         """
-        query = select(Rooms.price).filter_by(id=room_id)
-        result = await session.execute(query)
-        return result.scalar()
+        room_ids = {item.room_id for item in items}
+        rooms_result = await session.execute(
+            select(Rooms.id, Rooms.quantity, Rooms.price).where(Rooms.id.in_(room_ids))
+        )
+        rooms = {room.id: room for room in rooms_result}
+
+        occupancy_result = await session.execute(
+            select(
+                RoomDailyOccupancy.room_id,
+                RoomDailyOccupancy.day,
+                RoomDailyOccupancy.booked,
+            ).where(
+                and_(
+                    RoomDailyOccupancy.room_id.in_(room_ids),
+                    RoomDailyOccupancy.day.between(
+                        min(item.date_from for item in items),
+                        max(item.date_to for item in items),
+                    ),
+                )
+            )
+        )
+        booked = defaultdict(int)
+        for room_id, day, booked_rooms in occupancy_result:
+            booked[(room_id, day)] = booked_rooms
+
+        accepted, rejected = [], []
+        for item in items:
+            room = rooms.get(item.room_id)
+            days = _days(item.date_from, item.date_to)
+            occupied = max(booked[(item.room_id, day)] for day in days)
+            if room is None or room.quantity - occupied <= 0:
+                rejected.append(item)
+                continue
+            for day in days:
+                booked[(item.room_id, day)] += 1
+            accepted.append(
+                {
+                    "room_id": item.room_id,
+                    "user_id": user_id,
+                    "date_from": item.date_from,
+                    "date_to": item.date_to,
+                    "price": room.price,
+                }
+            )
+        return accepted, rejected
 
     @classmethod
     async def _create_booking(
         cls,
-        session,
+        session: AsyncSession,
         user_id: int,
         room_id: int,
         date_from: date,
         date_to: date,
-        price: int,
-    ) -> Bookings:
+    ) -> Bookings | None:
         """
-        create a new record of booking with specified params
+        create a new record of booking with specified params if the room is available.
+
+        The busiest day of the period in the daily room occupancy is compared with the room
+        quantity inside the same statement that inserts the booking with the current room
+        price.
 
         Args:
             session (AsyncSession): The database session object.
@@ -220,21 +596,60 @@ class BookingDAO(BaseDAO):
             room_id (int): The identifier of the room to be booked.
             date_from (date): The starting date of the booking period.
             date_to (date): The ending date of the booking period.
-            price (int): The price of the booking.
 
         Returns:
-            Bookings: The newly created booking object if the booking is successful.
+            Bookings | None: The newly created booking object, or None if the room is sold out.
         """
+        booked_rooms = _booked_rooms(room_id, date_from, date_to)
+        available_room = select(
+            Rooms.id,
+            literal(user_id),
+            literal(date_from, Date),
+            literal(date_to, Date),
+            Rooms.price,
+        ).where(
+            and_(
+                Rooms.id == room_id,
+                Rooms.quantity - booked_rooms > 0,
+            )
+        )
         add_booking_query = (
             insert(Bookings)
-            .values(
-                room_id=room_id,
-                user_id=user_id,
-                date_from=date_from,
-                date_to=date_to,
-                price=price,
+            .from_select(
+                ["room_id", "user_id", "date_from", "date_to", "price"],
+                available_room,
             )
             .returning(Bookings)
         )
         result = await session.execute(add_booking_query)
         return result.scalar()
+
+
+def _booked_rooms(room_id: int, date_from: date, date_to: date):
+    """
+    Returns the subquery of the number of rooms booked on the busiest day of the period.
+    """
+    return (
+        select(func.coalesce(func.max(RoomDailyOccupancy.booked), 0))
+        .where(
+            and_(
+                RoomDailyOccupancy.room_id == room_id,
+                RoomDailyOccupancy.day.between(literal(date_from, Date), literal(date_to, Date)),
+            )
+        )
+        .scalar_subquery()
+    )
+
+
+def _confirmation(booking: Bookings) -> dict:
+    """
+    Returns the booking as the JSON arguments of its confirmation email.
+    """
+    return BookingsSchema.model_validate(booking, from_attributes=True).model_dump(mode="json")
+
+
+def _days(date_from: date, date_to: date) -> list[date]:
+    """
+    Returns every day from `date_from` to `date_to` inclusive.
+    """
+    return [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
@@ -4,12 +4,16 @@ Bookings Model.
 This module defines the `Bookings` class, which represents the booking records in the database.
 Each booking is associated with a specific room, a user, and a booking period. The class includes
 computed fields to calculate the total cost and number of days for each booking.
+
+The module also defines the `RoomDailyOccupancy` class, which holds the number of booked rooms
+of each room type on each day. It is maintained by `BookingDAO` in the transactions that add
+and delete bookings, so availability for N nights is read from N rows per room.
 """
 
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Computed, ForeignKey
+from sqlalchemy import Computed, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -59,3 +63,34 @@ class Bookings(Base):
     room: Mapped["Rooms"] = relationship(
         back_populates="bookings",
     )
+
+
+class RoomDailyOccupancy(Base):
+    """
+    Represents the number of booked rooms of a room type on one day.
+
+    A booking occupies every day from `date_from` to `date_to` inclusive. Days without
+    bookings may have no row.
+
+    Attributes:
+        room_id (int): The ID of the room type.
+        day (date): The day.
+        booked (int): The number of bookings of the room type occupying the day.
+    """
+
+    __tablename__ = "room_daily_occupancy"
+
+    room_id: Mapped[int] = mapped_column(
+        ForeignKey("rooms.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(primary_key=True)
+    booked: Mapped[int] = mapped_column(nullable=False, server_default="0")
+
+
+Index(
+    "ix_bookings_user_id_date_from_id",
+    Bookings.user_id,
+    Bookings.date_from,
+    Bookings.id,
+)
@@ -2,27 +2,39 @@
 Router module for handling booking-related API endpoints.
 
 This module defines the FastAPI router for booking operations. It includes endpoints
-to retrieve user bookings, add a new booking, and delete an existing booking. It uses
-dependencies to get the current user and interacts with the `BookingDAO` class to
-perform the required actions. Exceptions such as `RoomCannotBeBookedException` are raised
-when necessary, and confirmation emails are sent after successfully adding a booking.
+to retrieve user bookings page by page or as an NDJSON stream, add a new booking, add several
+bookings at once, and delete an existing booking. It uses dependencies to get the current user
+and interacts with the `BookingDAO` class to perform the required actions. Exceptions such as
+`RoomCannotBeBookedException` are raised when necessary, and confirmation emails are sent
+after successfully adding a booking. After a booking is added or deleted the client reads from
+the primary database for a while, so it sees its own changes before the read replica does.
 """
 
 from datetime import date
 
-from fastapi import APIRouter, Depends
-from pydantic import parse_obj_as
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.booking.booking_dao import BookingDAO
-from app.booking.booking_schemas import BookingsInfoSchema, BookingsSchema
+from app.booking.booking_schemas import (
+    BOOKINGS_PAGE_SIZE,
+    MAX_BOOKINGS_PAGE_SIZE,
+    BookingsBatchResultSchema,
+    BookingsBatchSchema,
+    BookingsInfoSchema,
+    BookingsSchema,
+)
+from app.database import get_session, stick_to_primary
 from app.exceptions import (
     DateToEarlierThanDateFrom,
     NoRowFindToDelete,
     RoomCannotBeBookedException,
 )
-from app.tasks.tasks import send_bookings_confirmation_email
-from app.users.user_dependencies import get_current_user
-from app.users.user_models import Users
+from app.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.responses import model_list_response
+from app.users.user_dependencies import get_current_user, get_current_user_from_claims
+from app.users.user_schemas import UsersSchema
 
 router = APIRouter(
     prefix="/bookings",
@@ -32,44 +44,73 @@ router = APIRouter(
 
 @router.get("")
 async def get_bookings(
-    user: Users = Depends(get_current_user),
+    limit: int = Query(BOOKINGS_PAGE_SIZE, ge=1, le=MAX_BOOKINGS_PAGE_SIZE),
+    cursor: str | None = None,
+    stream: bool = False,
+    user: UsersSchema = Depends(get_current_user_from_claims),
 ) -> list[BookingsInfoSchema]:
     """
-    Retrieves all bookings for the current user.
+    Retrieves the bookings of the current user.
 
-    This endpoint fetches all bookings associated with the currently authenticated user.
-    It returns a list of bookings with detailed room information such as image, name,
-    description, and services.
+    This endpoint fetches the bookings associated with the currently authenticated user,
+    ordered by start date, with detailed room information such as image, name, description,
+    and services. Bookings are returned page by page: when more bookings follow, the cursor
+    of the next page is sent in the `X-Next-Cursor` header. With `stream` set, all bookings
+    after the cursor are streamed as NDJSON, one booking per line, without being loaded at
+    once.
 
     Args:
-        user (Users): The current user, fetched using the `get_current_user` dependency.
+        limit (int): The maximum number of bookings in the page.
+        cursor (str | None): The cursor of the page, the first page if None.
+        stream (bool): Whether all bookings are streamed as NDJSON instead of a page.
+        user (UsersSchema): The current user, fetched using the `get_current_user_from_claims`
+         dependency.
 
     Returns:
-        list[BookingsInfoSchema]: A list of bookings with detailed room information.
+        list[BookingsInfoSchema]: A page of bookings with detailed room information.
     """
-    result = await BookingDAO.find_all(user_id=user.id)
-    return result
+    after = None if cursor is None else decode_cursor(cursor, date.fromisoformat, int)
+    if stream:
+
+        async def bookings_lines():
+            async for booking in BookingDAO.stream_all(user_id=user.id, after=after):
+                yield BookingsInfoSchema.model_validate(booking).model_dump_json() + "\n"
+
+        return StreamingResponse(bookings_lines(), media_type="application/x-ndjson")
+
+    result = await BookingDAO.find_all(user_id=user.id, limit=limit + 1, after=after)
+    headers = {}
+    if len(result) > limit:
+        result = result[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(result[-1]["date_from"], result[-1]["id"])
+    return model_list_response(BookingsInfoSchema, result, headers)
 
 
 @router.post("")
 async def add_booking(
+    response: Response,
     room_id: int,
     date_from: date,
     date_to: date,
-    user: Users = Depends(get_current_user),
+    user: UsersSchema = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ) -> BookingsSchema:
     """
     Creates a new user booking for the specified room and dates.
 
     This endpoint allows a user to make a booking for a specific room and date range.
-    If the booking is successful, a confirmation email is sent to the user. If no rooms
+    If the booking is successful, a confirmation email is queued in the outbox within the
+    transaction of the booking and sent to the user in the background. If no rooms
     are available, a `RoomCannotBeBookedException` is raised.
 
     Args:
+        response (Response): The HTTP response where the read routing cookie will be set.
         room_id (int): The ID of the room to be booked.
         date_from (date): The start date of the booking.
         date_to (date): The end date of the booking.
-        user (Users): The current user, fetched using the `get_current_user` dependency.
+        user (UsersSchema): The current user, fetched using the `get_current_user` dependency.
+        session (AsyncSession): The request-scoped database session, shared with
+         `get_current_user`.
 
     Returns:
         BookingsSchema: The newly created booking object.
@@ -81,20 +122,73 @@ async def add_booking(
         room_id,
         date_from,
         date_to,
+        session,
+        confirm_to=user.email,
     )
 
     if booked_room is None:
         raise RoomCannotBeBookedException
-
-    booked_room_dict = parse_obj_as(BookingsSchema, booked_room.__dict__).dict()
-    send_bookings_confirmation_email.delay(bookings=booked_room_dict, email_to=user.email)
+    stick_to_primary(response)
 
     return booked_room
 
 
+@router.post("/batch")
+async def add_bookings_batch(
+    response: Response,
+    bookings_batch: BookingsBatchSchema,
+    user: UsersSchema = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> BookingsBatchResultSchema:
+    """
+    Creates bookings for several rooms and dates in one request.
+
+    All items are checked and inserted together. In all-or-nothing mode a
+    `RoomCannotBeBookedException` is raised if any item cannot be booked; otherwise the
+    available items are booked and the rest are returned as rejected. A single confirmation
+    email listing every created booking is queued in the outbox and sent to the user.
+
+    Args:
+        response (Response): The HTTP response where the read routing cookie will be set.
+        bookings_batch (BookingsBatchSchema): The requested rooms, dates and batch mode.
+        user (UsersSchema): The current user, fetched using the `get_current_user` dependency.
+        session (AsyncSession): The request-scoped database session, shared with
+         `get_current_user`.
+
+    Returns:
+        BookingsBatchResultSchema: The created bookings and the rejected items.
+    """
+    for item in bookings_batch.items:
+        if item.date_from >= item.date_to:
+            raise DateToEarlierThanDateFrom
+    result = await BookingDAO.add_many(
+        user.id,
+        bookings_batch.items,
+        bookings_batch.all_or_nothing,
+        session,
+        confirm_to=user.email,
+    )
+    if result is None:
+        raise RoomCannotBeBookedException
+
+    booked, rejected = result
+    if not booked:
+        raise RoomCannotBeBookedException
+    stick_to_primary(response)
+
+    booked_dicts = [
+        BookingsSchema.model_validate(booking, from_attributes=True).model_dump(mode="json")
+        for booking in booked
+    ]
+    return BookingsBatchResultSchema(booked=booked_dicts, rejected=rejected)
+
+
 @router.delete("")
 async def delete_bookings(
-    bookings_id: int, user: Users = Depends(get_current_user)
+    response: Response,
+    bookings_id: int,
+    user: UsersSchema = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
 ) -> BookingsSchema:
     """
     Deletes an existing booking by ID.
@@ -103,17 +197,22 @@ async def delete_bookings(
     the provided ID, a `NoRowFindToDelete` exception is raised.
 
     Args:
+        response (Response): The HTTP response where the read routing cookie will be set.
         bookings_id (int): The ID of the booking to delete.
-        user (Users): The current user, fetched using the `get_current_user` dependency.
+        user (UsersSchema): The current user, fetched using the `get_current_user` dependency.
+        session (AsyncSession): The request-scoped database session, shared with
+         `get_current_user`.
 
     Returns:
         BookingsSchema: The deleted booking object.
     """
     deleted_booking = await BookingDAO.delete(
+        session,
         id=bookings_id,
         user_id=user.id,
     )
     if not deleted_booking:
         raise NoRowFindToDelete
+    stick_to_primary(response)
 
     return deleted_booking
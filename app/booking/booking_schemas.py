@@ -4,12 +4,18 @@ Schemas for booking data.
 This module contains Pydantic schemas used for validating and serializing booking data.
 The `BookingsSchema` is used for the creation and updating of bookings, while the
 `BookingsInfoSchema` provides a more detailed response including room-specific
-information like name, description, and services.
+information like name, description, and services. The `BookingsBatch*` schemas describe
+requests and responses for booking several rooms at once.
 """
 
 from datetime import date
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+MAX_BOOKINGS_IN_BATCH = 50
+
+BOOKINGS_PAGE_SIZE = 50
+MAX_BOOKINGS_PAGE_SIZE = 500
 
 
 class BookingsSchema(BaseModel):
@@ -40,6 +46,7 @@ class BookingsInfoSchema(BaseModel):
     pricing.
     """
 
+    id: int
     room_id: int
     user_id: int
     date_from: date
@@ -51,3 +58,36 @@ class BookingsInfoSchema(BaseModel):
     name: str
     description: str | None
     services: list[str]
+
+
+class BookingsBatchItemSchema(BaseModel):
+    """
+    Schema for representing a single room requested in a batch booking.
+    """
+
+    room_id: int
+    date_from: date
+    date_to: date
+
+
+class BookingsBatchSchema(BaseModel):
+    """
+    Schema for representing a batch booking request.
+
+    When `all_or_nothing` is set, either every item of the batch is booked or none of them is.
+    Otherwise every available item is booked and the rest are reported as rejected.
+    """
+
+    items: list[BookingsBatchItemSchema] = Field(min_length=1, max_length=MAX_BOOKINGS_IN_BATCH)
+    all_or_nothing: bool = True
+
+
+class BookingsBatchResultSchema(BaseModel):
+    """
+    Schema for representing the result of a batch booking.
+
+    It includes the created bookings and the requested items that could not be booked.
+    """
+
+    booked: list[BookingsSchema]
+    rejected: list[BookingsBatchItemSchema]
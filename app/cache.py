@@ -0,0 +1,193 @@
+"""
+Two-Tier Cache Components.
+
+This module provides the in-process tier of the application caches and the coherence between
+workers. `LocalCache` is a size-bounded LRU with TTL whose entries can be tagged, for example
+with hotel IDs, and dropped by tag. Every worker listens to the invalidation channel in Redis
+(see `listen_for_invalidations`) and applies the invalidations published by other workers to
+its own local caches.
+
+Hits and misses of every tier are counted in the `cache_requests_total` Prometheus counter.
+
+Attributes:
+    INVALIDATION_CHANNEL (str): The Redis channel carrying invalidations of the local caches.
+    CACHE_REQUESTS (Counter): The counter of cache lookups by cache, tier and result.
+    local_caches (dict[str, LocalCache]): The local caches of this worker by name.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Iterable
+
+from prometheus_client import Counter
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.logger import logger
+
+INVALIDATION_CHANNEL = "/cache/invalidate"
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache, tier and result",
+    ["cache", "tier", "result"],
+)
+
+local_caches: dict[str, "LocalCache"] = {}
+
+
+class LocalCache:
+    """
+    In-process LRU cache with TTL and tag-based invalidation.
+
+    Creating a local cache registers it in `local_caches`, so the invalidations published
+    for its name by other workers reach it.
+
+    Attributes:
+        name (str): The name of the cache, used in metrics and invalidation messages.
+        max_size (int): The maximum number of entries.
+        ttl (float): The default lifetime of an entry in seconds.
+    """
+
+    def __init__(self, name: str, max_size: int, ttl: float):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any, tuple]] = OrderedDict()
+        self._tags: defaultdict[str, set[str]] = defaultdict(set)
+        local_caches[name] = self
+
+    def get(self, key: str) -> Any | None:
+        """
+        Returns the cached value, or None if it is not cached or has expired.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            CACHE_REQUESTS.labels(self.name, "local", "hit").inc()
+            return entry[1]
+        if entry is not None:
+            self.delete(key)
+        CACHE_REQUESTS.labels(self.name, "local", "miss").inc()
+        return None
+
+    def set(self, key: str, value: Any, tags: Iterable = (), ttl: float | None = None) -> None:
+        """
+        Caches the value, evicting the least recently used entries above `max_size`.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to cache.
+            tags (Iterable): The tags the entry can be invalidated by.
+            ttl (float | None): The lifetime of the entry, `ttl` of the cache by default.
+        """
+        self.delete(key)
+        tags = tuple(str(tag) for tag in tags)
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value, tags)
+        for tag in tags:
+            self._tags[tag].add(key)
+        while len(self._entries) > self.max_size:
+            self.delete(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        """
+        Removes the entry if it is cached.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate_tags(self, tags: Iterable) -> None:
+        """
+        Removes every entry tagged with one of the given tags.
+
+        Args:
+            tags (Iterable): The tags to invalidate.
+        """
+        for tag in tags:
+            for key in list(self._tags.get(str(tag), ())):
+                self.delete(key)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        self._entries.clear()
+        self._tags.clear()
+
+
+def invalidation_message(
+    cache: str,
+    keys: Iterable[str] = (),
+    tags: Iterable = (),
+    clear: bool = False,
+) -> str:
+    """
+    Builds a message for the invalidation channel.
+
+    Args:
+        cache (str): The name of the local cache to invalidate.
+        keys (Iterable[str]): The keys to remove.
+        tags (Iterable): The tags to invalidate.
+        clear (bool): Whether the whole cache is removed.
+    """
+    return json.dumps(
+        {"cache": cache, "keys": list(keys), "tags": [str(tag) for tag in tags], "clear": clear}
+    )
+
+
+def apply_invalidation(message: str) -> None:
+    """
+    Applies an invalidation message to the local cache of this worker it is meant for.
+
+    Args:
+        message (str): The message built by `invalidation_message`.
+    """
+    invalidation = json.loads(message)
+    cache = local_caches.get(invalidation["cache"])
+    if cache is None:
+        return
+    if invalidation["clear"]:
+        cache.clear()
+    for key in invalidation["keys"]:
+        cache.delete(key)
+    cache.invalidate_tags(invalidation["tags"])
+
+
+async def listen_for_invalidations(redis: aioredis.Redis) -> None:
+    """
+    Applies the invalidations published by all workers to the local caches of this worker.
+
+    Local caches are cleared whenever the subscription is (re)established, since messages
+    published while it was down are lost.
+
+    Args:
+        redis (Redis): The Redis client to subscribe with.
+    """
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                for cache in local_caches.values():
+                    cache.clear()
+                async for message in pubsub.listen():
+                    apply_invalidation(message["data"])
+        except RedisError:
+            logger.warning("Cache invalidation channel is unavailable", exc_info=True)
+            for cache in local_caches.values():
+                cache.clear()
+            await asyncio.sleep(1)
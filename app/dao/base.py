@@ -5,11 +5,15 @@ This class provides generic methods for performing CRUD operations on the databa
 It is designed to be inherited by other DAO classes, which will define the `model` attribute
 to specify the model they interact with. The class includes methods for finding records by ID,
 finding records by filters, retrieving all records, adding new records, and deleting records.
+Finding methods read through `read_session_maker`, so they can be served by the read replica,
+while adding and deleting always go to the primary. Every method accepts an optional `session`,
+so a request can run all of its queries in its own session (see `get_session`).
 """
 
 from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import async_session_maker
+from app.database import read_session_maker, session_scope
 
 
 class BaseDAO:
@@ -33,65 +37,69 @@ class BaseDAO:
     model = None
 
     @classmethod
-    async def find_by_id(cls, model_id: int):
+    async def find_by_id(cls, model_id: int, session: AsyncSession | None = None):
         """
         Retrieve a record by its ID.
 
         Args:
             model_id (int): The ID of the record to retrieve.
+            session (AsyncSession | None): The session to use instead of a new one.
 
         Returns:
             dict | None: The record as a dictionary if found, otherwise None.
         """
-        async with async_session_maker() as session:
+        async with session_scope(session, read_session_maker()) as session:
             query = select(cls.model.__table__.columns).filter_by(id=model_id)
             result = await session.execute(query)
             return result.mappings().one_or_none()
 
     @classmethod
-    async def find_one_or_none(cls, **filter_by):
+    async def find_one_or_none(cls, session: AsyncSession | None = None, **filter_by):
         """
         Retrieve a single record based on filter criteria.
 
         Args:
+            session (AsyncSession | None): The session to use instead of a new one.
             filter_by: Keyword arguments representing filter criteria (example: `{"id": 1}`).
 
         Returns:
             dict | None: The record as a dictionary if found, otherwise None.
         """
-        async with async_session_maker() as session:
+        async with session_scope(session, read_session_maker()) as session:
             query = select(cls.model.__table__.columns).filter_by(**filter_by)
             result = await session.execute(query)
             return result.mappings().one_or_none()
 
     @classmethod
-    async def find_all(cls, **filter_by):
+    async def find_all(cls, session: AsyncSession | None = None, **filter_by):
         """
         Retrieve all records that match the specified filter criteria.
 
         Args:
+            session (AsyncSession | None): The session to use instead of a new one.
             filter_by: Keyword arguments representing filter criteria (example: `{"id": 1}`).
 
         Returns:
             list[dict]: A list of records as dictionaries.
         """
-        async with async_session_maker() as session:
+        async with session_scope(session, read_session_maker()) as session:
             query = select(cls.model.__table__.columns).filter_by(**filter_by)
             result = await session.execute(query)
             return result.mappings().all()
 
     @classmethod
-    async def add(cls, **data):
+    async def add(cls, session: AsyncSession | None = None, **data):
         """
         Add a new record to the database.
 
         Args:
+            session (AsyncSession | None): The session to use instead of a new one.
             data: The data to insert into the record, provided as keyword arguments.
 
         Returns:
             int: The ID of the newly inserted record.
         """
-        async with async_session_maker() as session:
+        async with session_scope(session) as session:
             query = insert(cls.model).values(**data).returning(cls.model.id)
             result = await session.execute(query)
             await session.commit()
@@ -99,17 +107,18 @@ class BaseDAO:
             return user_id
 
     @classmethod
-    async def delete(cls, **filter_by):
+    async def delete(cls, session: AsyncSession | None = None, **filter_by):
         """
         Delete records that match the specified filter criteria.
 
         Args:
+            session (AsyncSession | None): The session to use instead of a new one.
             filter_by: Keyword arguments representing filter criteria (example: `{"id": 1}`).
 
         Returns:
             dict | None: The deleted record as a dictionary, or None if no record was found.
         """
-        async with async_session_maker() as session:
+        async with session_scope(session) as session:
             query = delete(cls.model).filter_by(**filter_by).returning(cls.model)
             result = await session.execute(query)
             await session.commit()
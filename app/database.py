@@ -5,30 +5,162 @@ This module configures and initializes the database for the application using SQ
 It provides the engine and session maker for interacting with the database asynchronously.
 It also includes a function for initializing the models in the application.
 
+Outside of tests the engine uses a queue pool configured from the settings, which records how
+long each connection checkout waits in the `db_pool_checkout_seconds` Prometheus histogram.
+
+Routes that talk to the database several times take one request-scoped session from the
+`get_session` dependency and pass it to the DAO methods, which otherwise open a session of their
+own (see `session_scope`).
+
+Reads can be served by a read replica: DAO read methods take their sessions from
+`read_session_maker`, which returns the replica session maker unless no replica is configured
+or the current request has to read its own writes (see `stick_to_primary`).
+
 Attributes:
     async_session_maker (sessionmaker): The session maker for creating database sessions.
+    async_replica_session_maker (sessionmaker): The session maker for read-only sessions on
+     the replica, the same as `async_session_maker` if no replica is configured.
     engine (Engine): The SQLAlchemy engine used for interacting with the database.
+    replica_engine (Engine): The SQLAlchemy engine used for reading from the replica.
+    read_from_primary (ContextVar[bool]): Whether reads of the current request must go to
+     the primary.
 """
 
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from typing import AsyncIterator
 
-from sqlalchemy import NullPool, func
+from prometheus_client import Histogram
+from sqlalchemy import AsyncAdaptedQueuePool, NullPool, func
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 
 from config import settings
 
+POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the database pool",
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records the time spent waiting for each connection checkout.
+    """
+
+    def _do_get(self):
+        with POOL_CHECKOUT_SECONDS.time():
+            return super()._do_get()
+
+
+READ_PRIMARY_COOKIE = "read_primary"
+
 if settings.MODE == "TEST":
     DATABASE_URL = settings.TEST_DATABASE_URL
+    DATABASE_REPLICA_URL = None
     DATABASE_PARAMS = {"poolclass": NullPool}
 else:
     DATABASE_URL = settings.DATABASE_URL
-    DATABASE_PARAMS = {}
+    DATABASE_REPLICA_URL = settings.DATABASE_REPLICA_URL
+    DATABASE_PARAMS = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    }
 
 engine = create_async_engine(DATABASE_URL, **DATABASE_PARAMS)
 
 async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+if DATABASE_REPLICA_URL is None:
+    replica_engine = engine
+    async_replica_session_maker = async_session_maker
+else:
+    replica_engine = create_async_engine(DATABASE_REPLICA_URL, **DATABASE_PARAMS)
+    async_replica_session_maker = sessionmaker(
+        replica_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+def read_session_maker() -> sessionmaker:
+    """
+    Returns the session maker that read-only DAO methods should use.
+
+    Returns:
+        sessionmaker: The primary session maker if the current request has to read its own
+         writes, otherwise the replica session maker.
+    """
+    if read_from_primary.get():
+        return async_session_maker
+    return async_replica_session_maker
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    Provides one database session for the whole request.
+
+    The session checks out a connection only when it is first used and gives it back when its
+    transaction ends, so a request that reads the user and then adds a booking uses a single
+    connection and a single transaction.
+
+    Yields:
+        AsyncSession: The request-scoped session on the primary database.
+    """
+    async with async_session_maker() as session:
+        yield session
+
+
+@asynccontextmanager
+async def session_scope(
+    session: AsyncSession | None = None,
+    session_maker: sessionmaker | None = None,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Yields the given session, or a new one that is closed on exit if no session is given.
+
+    Args:
+        session (AsyncSession | None): The session of the caller, usually the request session.
+        session_maker (sessionmaker | None): The session maker for a new session, the primary
+         one by default.
+
+    Yields:
+        AsyncSession: The session to run the queries in.
+    """
+    if session is not None:
+        yield session
+        return
+    async with (session_maker or async_session_maker)() as new_session:
+        yield new_session
+
+
+def stick_to_primary(response) -> None:
+    """
+    Routes the reads of the current client to the primary for a while after its own write.
+
+    Sets a short-lived cookie that is turned into `read_from_primary` by the request
+    middleware, so the client sees its bookings before the replica catches up.
+
+    Args:
+        response (Response): The response of the request that wrote to the database.
+    """
+    read_from_primary.set(True)
+    response.set_cookie(
+        READ_PRIMARY_COOKIE,
+        "1",
+        max_age=settings.READ_PRIMARY_AFTER_WRITE_SECONDS,
+        httponly=True,
+    )
+
 
 def init_models():
     """
@@ -38,6 +170,7 @@ def init_models():
     from app.booking.booking_models import Bookings  # noqa
     from app.hotels.hotel_models import Hotels  # noqa
     from app.hotels.rooms.room_models import Rooms  # noqa
+    from app.outbox.outbox_models import OutboxMessages  # noqa
     from app.users.user_models import Users  # noqa
 
 
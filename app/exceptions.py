@@ -56,3 +56,23 @@ class LargeIntervalBetweenDates(BookingExceptions):
 class DateToEarlierThanDateFrom(BookingExceptions):
     status_code = status.HTTP_400_BAD_REQUEST
     detail = "дата конца периода раньше чем начало"
+
+
+class IncorrectCursorException(BookingExceptions):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "неверный курсор страницы"
+
+
+class TooManyRequestsException(BookingExceptions):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    detail = "слишком много запросов, попробуйте позже"
+
+
+class ImageTooLargeException(BookingExceptions):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    detail = "слишком большой файл изображения"
+
+
+class IncorrectContentLengthException(BookingExceptions):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "неверный заголовок Content-Length"
@@ -0,0 +1,330 @@
+"""
+Hotel Search Cache.
+
+This module defines the `HotelSearchCache` class, a Redis cache of hotel search results that is
+invalidated by bookings instead of expiring every few seconds. Every hotel has a version
+counter in Redis which is bumped whenever one of its rooms is booked or released. A cached
+search result remembers the versions of all hotels it covers and is only served while none of
+them has changed, so entries can live for minutes without serving stale availability.
+
+Misses are coalesced: concurrent requests of a worker await one search, and workers take a
+Redis lock so that only one of them runs it while the others wait for its result. An entry
+that outlived its TTL but whose hotels did not change is still served for a while and is
+refreshed in the background.
+
+Fresh results are also kept in a local cache of the worker, tagged with the IDs of their
+hotels. Invalidations are published to the other workers, so local hits need no round trip
+to Redis.
+
+Attributes:
+    hotel_search_cache (HotelSearchCache): The hotel search cache shared by the application.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import date
+from typing import Awaitable, Callable, Iterable
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.cache import (
+    CACHE_REQUESTS,
+    INVALIDATION_CHANNEL,
+    LocalCache,
+    invalidation_message,
+)
+from app.logger import logger
+from config import settings
+
+
+def hotel_version_key(hotel_id: int | str) -> str:
+    """
+    Returns the Redis key of the version counter of a hotel, bumped by its bookings.
+    """
+    return f"/cache/hotel-version:{hotel_id}"
+
+
+class HotelSearchCache:
+    """
+    Cache of hotel search results keyed by location and dates, with per-hotel versions.
+
+    A result is cached together with all hotels matching the location, including sold out
+    ones, because a cancellation can make such a hotel appear in the result. Searches that
+    race with a booking are not cached: the global epoch, bumped with every hotel version,
+    is read before the search and compared when the result is stored. This only holds if
+    the search sees every booking committed before the epoch was read, so searches must run
+    on the primary rather than on a lagging replica. Redis errors are logged and treated as
+    cache misses.
+
+    Attributes:
+        redis (Redis): The Redis client storing entries and versions.
+        ttl (int): The lifetime of a cached search result in seconds.
+        stale_ttl (int): How long after its TTL an unchanged result is still served while
+         it is being refreshed.
+        lock_timeout (float): How long a worker may hold the search lock, and how long the
+         other workers wait for its result.
+        local (LocalCache | None): The optional in-process tier in front of Redis.
+    """
+
+    poll_interval = 0.05
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        ttl: int,
+        stale_ttl: int = 0,
+        lock_timeout: float = 5,
+        local: LocalCache | None = None,
+    ):
+        self.redis = redis
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.lock_timeout = lock_timeout
+        self.local = local
+        self._searches: dict[str, asyncio.Future] = {}
+
+    async def fetch(
+        self,
+        location: str,
+        date_from: date,
+        date_to: date,
+        search: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """
+        Returns the cached search result, running the search on a miss.
+
+        Concurrent misses of the same search share one run of `search`. A stale but
+        unchanged result is returned immediately and refreshed in the background.
+
+        Args:
+            location (str): The searched location, normalized as it is searched.
+            date_from (date): The start date of the booking period.
+            date_to (date): The end date of the booking period.
+            search (Callable[[], Awaitable[list[dict]]]): Runs the search and returns all
+             hotels matching the location, with their rooms left.
+        """
+        key = self._key(location, date_from, date_to)
+        if self.local is not None:
+            hotels = self.local.get(key)
+            if hotels is not None:
+                return hotels
+        cached = await self._read(key)
+        if cached is not None:
+            hotels, fresh_until = cached
+            if fresh_until > time.time():
+                self._remember(key, hotels, fresh_until)
+            else:
+                self._search_once(key, search)
+            return hotels
+        return await asyncio.shield(self._search_once(key, search))
+
+    def _search_once(
+        self,
+        key: str,
+        search: Callable[[], Awaitable[list[dict]]],
+    ) -> asyncio.Future:
+        """
+        Starts the search unless this worker is already running it, and returns its future.
+        """
+        running = self._searches.get(key)
+        if running is not None:
+            return running
+        running = asyncio.ensure_future(self._search_locked(key, search))
+        self._searches[key] = running
+        running.add_done_callback(lambda future: self._search_done(key, future))
+        return running
+
+    def _search_done(self, key: str, future: asyncio.Future) -> None:
+        self._searches.pop(key, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Cannot search hotels", exc_info=future.exception())
+
+    async def _search_locked(
+        self,
+        key: str,
+        search: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """
+        Runs the search and caches its result while holding the Redis lock of the search.
+
+        If another worker holds the lock, its result is awaited instead; the search runs
+        anyway if that worker releases the lock without storing a result or times out.
+        """
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        try:
+            locked = await self.redis.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+        except RedisError:
+            logger.warning("Cannot take hotel search lock in Redis", exc_info=True)
+            locked = False
+        else:
+            if not locked:
+                hotels = await self._wait_for_search(key, lock_key)
+                if hotels is not None:
+                    return hotels
+
+        try:
+            epoch = await self.epoch()
+            hotels = await search()
+            await self._write(key, hotels, epoch)
+            return hotels
+        finally:
+            if locked:
+                await self._unlock(lock_key, token)
+
+    async def _wait_for_search(self, key: str, lock_key: str) -> list[dict] | None:
+        """
+        Waits until another worker caches the search result or releases the search lock.
+        """
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            cached = await self._read(key)
+            if cached is not None:
+                return cached[0]
+            try:
+                if not await self.redis.exists(lock_key):
+                    return None
+            except RedisError:
+                return None
+        return None
+
+    async def _unlock(self, lock_key: str, token: str) -> None:
+        """
+        Releases the search lock if it is still held with the given token.
+        """
+        try:
+            await self.redis.eval(
+                "if redis.call('get', KEYS[1]) == ARGV[1] then "
+                "return redis.call('del', KEYS[1]) end return 0",
+                1,
+                lock_key,
+                token,
+            )
+        except RedisError:
+            logger.warning("Cannot release hotel search lock in Redis", exc_info=True)
+
+    async def _read(self, key: str) -> tuple[list[dict], float] | None:
+        """
+        Returns the cached hotels and the time until which they are fresh, or None if the
+        entry is missing or one of its hotels has changed.
+        """
+        try:
+            cached = await self.redis.get(key)
+            entry = None if cached is None else json.loads(cached)
+            if entry is not None and entry["versions"]:
+                versions = entry["versions"]
+                current = await self.redis.mget([hotel_version_key(id_) for id_ in versions])
+                if current != list(versions.values()):
+                    entry = None
+        except RedisError:
+            logger.warning("Cannot read hotel search from Redis cache", exc_info=True)
+            return None
+        CACHE_REQUESTS.labels("hotels-search", "redis", "miss" if entry is None else "hit").inc()
+        if entry is None:
+            return None
+        return entry["hotels"], entry["fresh_until"]
+
+    def _remember(self, key: str, hotels: list[dict], fresh_until: float) -> None:
+        """
+        Keeps a fresh result in the local cache, tagged with the IDs of its hotels.
+        """
+        if self.local is None:
+            return
+        ttl = min(self.local.ttl, fresh_until - time.time())
+        self.local.set(key, hotels, tags=[hotel["id"] for hotel in hotels], ttl=ttl)
+
+    async def epoch(self) -> str | None:
+        """
+        Returns the global version of all hotels, to be read before running a search.
+        """
+        try:
+            return await self.redis.get(self._epoch_key())
+        except RedisError:
+            logger.warning("Cannot read hotel search epoch from Redis", exc_info=True)
+            return None
+
+    async def _write(self, key: str, hotels: list[dict], epoch: str | None) -> None:
+        """
+        Caches the search result unless a booking was made while the search was running.
+
+        Args:
+            key (str): The key of the search.
+            hotels (list[dict]): All hotels matching the location, with their rooms left.
+            epoch (str | None): The global version returned by `epoch` before the search.
+        """
+        hotel_ids = [str(hotel["id"]) for hotel in hotels]
+        try:
+            current = await self.redis.mget(
+                [self._epoch_key(), *(hotel_version_key(id_) for id_ in hotel_ids)]
+            )
+            if current[0] != epoch:
+                return
+            entry = {
+                "versions": dict(zip(hotel_ids, current[1:])),
+                "fresh_until": time.time() + self.ttl,
+                "hotels": hotels,
+            }
+            await self.redis.set(
+                key,
+                json.dumps(entry, default=str),
+                ex=self.ttl + self.stale_ttl,
+            )
+        except RedisError:
+            logger.warning("Cannot write hotel search to Redis cache", exc_info=True)
+            return
+        self._remember(key, hotels, entry["fresh_until"])
+
+    async def invalidate_hotels(self, hotel_ids: Iterable[int]) -> None:
+        """
+        Bumps the versions of the given hotels, outdating every cached search covering them,
+        and drops those searches from the local caches of all workers.
+
+        Args:
+            hotel_ids (Iterable[int]): The IDs of the hotels whose availability changed.
+        """
+        hotel_ids = set(hotel_ids)
+        if self.local is not None:
+            self.local.invalidate_tags(hotel_ids)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for hotel_id in hotel_ids:
+                    pipe.incr(hotel_version_key(hotel_id))
+                pipe.incr(self._epoch_key())
+                if self.local is not None:
+                    pipe.publish(
+                        INVALIDATION_CHANNEL,
+                        invalidation_message(self.local.name, tags=hotel_ids),
+                    )
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Cannot invalidate hotel search cache", exc_info=True)
+
+    @staticmethod
+    def _key(location: str, date_from: date, date_to: date) -> str:
+        return f"/cache/hotels-search:{location}:{date_from}:{date_to}"
+
+    @staticmethod
+    def _epoch_key() -> str:
+        return "/cache/hotel-version"
+
+
+hotel_search_cache = HotelSearchCache(
+    redis=aioredis.from_url(
+        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+        encoding="utf-8",
+        decode_responses=True,
+    ),
+    ttl=settings.HOTEL_SEARCH_CACHE_TTL_SECONDS,
+    stale_ttl=settings.HOTEL_SEARCH_CACHE_STALE_SECONDS,
+    local=LocalCache(
+        "hotels-search",
+        max_size=settings.LOCAL_CACHE_SIZE,
+        ttl=settings.LOCAL_CACHE_TTL_SECONDS,
+    ),
+)
@@ -13,17 +13,24 @@ Methods:
 
 from datetime import date
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.sql.functions import count
+from sqlalchemy import Date, and_, func, literal, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.booking.booking_models import Bookings
+from app.booking.booking_models import RoomDailyOccupancy
 from app.dao.base import BaseDAO
-from app.database import async_session_maker
-from app.hotels.hotel_models import Hotels
+from app.database import read_session_maker, session_scope
+from app.hotels.hotel_models import Hotels, normalize_location
 from app.hotels.hotel_schemas import HotelsRoomsLeftSchema
 from app.hotels.rooms.room_models import Rooms
 
 
+def _escape_like(value: str) -> str:
+    """
+    Escapes the `LIKE` wildcards in a user supplied string.
+    """
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
 class HotelsDAO(BaseDAO):
     """
     Data Access Object (DAO) for interacting with the Hotels model.
@@ -40,55 +47,68 @@ class HotelsDAO(BaseDAO):
         location: str,
         date_from: date,
         date_to: date,
+        only_available: bool = True,
+        session: AsyncSession | None = None,
     ) -> list[HotelsRoomsLeftSchema]:
         """
         Asynchronously retrieves all hotels in a specified location with available rooms for a
         given date range.
 
+        The location is matched as a substring regardless of case and diacritics, using the
+        trigram index over the normalized hotel location. The busiest day of the period is
+        found in a `LATERAL` subquery over the daily occupancy of the rooms of each matching
+        hotel only, so a search reads one small row per room and night whatever the number
+        of bookings. The lowest room price of every hotel, used to sort the results, is read
+        from the index over the hotel and price of rooms. The hotels are not ordered or
+        limited: the search cache keeps the whole result and pages are cut from it.
+
         Args:
             location (str): The location to search for hotels.
             date_from (date): The start date of the booking period.
             date_to (date): The end date of the booking period.
+            only_available (bool): Whether sold out hotels are left out of the result.
+            session (AsyncSession | None): The session to use instead of a new one on the
+             read replica.
 
         Returns:
             list[HotelsRoomsLeftSchema]: A list of hotels in the specified location with
-             available rooms.
+             available rooms, or with their rooms left if `only_available` is False.
         """
+        location_pattern = func.concat("%", normalize_location(_escape_like(location)), "%")
         busy_rooms = (
-            select(
-                Rooms.hotel_id.label("hotel_id"),
-                count(Bookings.id).label("non_left"),
-            )
-            .select_from(Bookings)
-            .join(Rooms, Rooms.id == Bookings.room_id, isouter=True)
+            select(func.sum(RoomDailyOccupancy.booked).label("non_left"))
+            .select_from(RoomDailyOccupancy)
+            .join(Rooms, Rooms.id == RoomDailyOccupancy.room_id)
             .where(
                 and_(
-                    Bookings.date_from <= date_to,
-                    Bookings.date_to >= date_from,
+                    Rooms.hotel_id == Hotels.id,
+                    RoomDailyOccupancy.day.between(
+                        literal(date_from, Date), literal(date_to, Date)
+                    ),
                 )
             )
-            .group_by(Rooms.hotel_id)
-            .cte("busy_rooms")
+            .group_by(RoomDailyOccupancy.day)
+            .order_by(func.sum(RoomDailyOccupancy.booked).desc())
+            .limit(1)
+            .lateral("busy_rooms")
         )
+        rooms_left = Hotels.rooms_quantity - func.coalesce(busy_rooms.c.non_left, 0)
+        min_price = select(func.min(Rooms.price)).where(Rooms.hotel_id == Hotels.id)
 
         hotels_in_location = (
             select(
                 Hotels.__table__.columns,
-                (Hotels.rooms_quantity - func.coalesce(busy_rooms.c.non_left, 0)).label(
-                    "rooms_left"
-                ),
+                rooms_left.label("rooms_left"),
+                min_price.scalar_subquery().label("min_price"),
             )
             .select_from(Hotels)
-            .join(busy_rooms, Hotels.id == busy_rooms.c.hotel_id, isouter=True)
-            .where(
-                and_(
-                    Hotels.location.like(f"%{location}%"),
-                    (Hotels.rooms_quantity - func.coalesce(busy_rooms.c.non_left, 0)) > 0,
-                )
-            )
+            .outerjoin(busy_rooms, true())
+            .where(normalize_location(Hotels.location).like(location_pattern, escape="/"))
         )
+        if only_available:
+            hotels_in_location = hotels_in_location.where(rooms_left > 0)
 
-        async with async_session_maker() as session:
+        async with session_scope(session, read_session_maker()) as session:
             hotels_rooms = await session.execute(hotels_in_location)
             hotels_rooms = hotels_rooms.mappings().all()
             return hotels_rooms
@@ -4,10 +4,15 @@ Hotels Model.
 This module defines the `Hotels` model, which represents hotels in the database. Each hotel
 contains information such as name, location, services, room quantity, and associated rooms.
 The model supports relationships with rooms and bookings.
+
+Locations are searched case and diacritic insensitively through the `f_unaccent` SQL function
+and a trigram GIN index over the normalized location, which also serves leading-wildcard
+`LIKE` patterns.
 """
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import DDL, Index, event, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -47,3 +52,33 @@ class Hotels(Base):
     rooms: Mapped["Rooms"] = relationship(
         back_populates="hotel",
     )
+
+
+def normalize_location(value):
+    """
+    Builds the SQL expression used to compare locations regardless of case and diacritics.
+
+    Args:
+        value: A column or a value holding a location.
+
+    Returns:
+        The `f_unaccent(lower(value))` SQL expression.
+    """
+    return func.f_unaccent(func.lower(value))
+
+
+Index(
+    "ix_hotels_location_trgm",
+    normalize_location(Hotels.location).label("location_normalized"),
+    postgresql_using="gin",
+    postgresql_ops={"location_normalized": "gin_trgm_ops"},
+)
+
+for statement in (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+    "AS $$ SELECT public.unaccent('public.unaccent', $1) $$",
+):
+    event.listen(Hotels.__table__, "before_create", DDL(statement))
@@ -8,19 +8,52 @@ data.
 
 Endpoints:
     - get_hotel: Retrieves detailed information about a specific hotel by its ID.
-    - get_hotels_by_location_and_time: Retrieves hotels in a specific location with available
-     rooms for a given date range.
+    - get_hotels_by_location_and_time: Retrieves a page of hotels in a specific location with
+     available rooms for a given date range.
+
+Search results are cached in the hotel search cache, which is invalidated by bookings of the
+hotels they cover. Pages of a search are sorted and cut from the cached result, so paging
+through a search queries the database once (see `find_hotels_page` for why paging is not
+done in SQL).
 """
 
 from datetime import date
 
-from fastapi import APIRouter
-from fastapi_cache.decorator import cache
+from fastapi import APIRouter, Query
 
+from app.database import async_session_maker
 from app.exceptions import DateToEarlierThanDateFrom, LargeIntervalBetweenDates
-from app.hotels.hotel_schemas import HotelsRoomsLeftSchema
+from app.hotels.hotel_cache import hotel_search_cache
+from app.hotels.hotel_schemas import (
+    HOTELS_PAGE_SIZE,
+    MAX_HOTELS_PAGE_SIZE,
+    HotelsRoomsLeftSchema,
+    HotelsSortOrder,
+)
+from app.pagination import (
+    NEXT_CURSOR_HEADER,
+    TOTAL_COUNT_HEADER,
+    decode_cursor,
+    encode_cursor,
+)
+from app.responses import model_list_response
 
 MAX_PERIOD_OF_DAYS_FOR_SEARCH_HOTEL = 30
+
+SORT_KEYS = {
+    HotelsSortOrder.price: (
+        lambda hotel: (hotel.get("min_price") is None, hotel.get("min_price") or 0, hotel["id"]),
+        (bool, int, int),
+    ),
+    HotelsSortOrder.rooms_left: (
+        lambda hotel: (-hotel["rooms_left"], hotel["id"]),
+        (int, int),
+    ),
+    HotelsSortOrder.name: (
+        lambda hotel: (hotel["name"], hotel["id"]),
+        (str, int),
+    ),
+}
 router = APIRouter(prefix="/hotels", tags=["Отели"])
 
 
@@ -41,23 +74,45 @@ async def get_hotel(hotel_id: int):
     return hotel_inf
 
 
-@router.get("/{location}")
-@cache(expire=20)
-async def get_hotels_by_location_and_time(
-    location: str, date_from: date, date_to: date
-) -> list[HotelsRoomsLeftSchema]:
+async def find_hotels_page(
+    location: str,
+    date_from: date,
+    date_to: date,
+    sort: HotelsSortOrder = HotelsSortOrder.name,
+    limit: int = HOTELS_PAGE_SIZE,
+    cursor: str | None = None,
+) -> tuple[list[dict], int, str | None]:
     """
-    Asynchronously retrieves hotels in a specified location with available rooms for a given date
-    range.
+    Asynchronously retrieves a page of hotels in a specified location with available rooms for
+    a given date range.
+
+    All hotels matching the location are cached, including sold out ones, so a cancellation
+    that frees a room in one of them outdates the cached result. Concurrent misses of the
+    same search run it only once, on the primary: a result read from a lagging replica
+    would be cached under hotel versions already bumped by a booking it does not see. The
+    page is then sorted and cut from the cached result.
+
+    Sorting, the keyset predicate and the limit are deliberately not pushed into SQL. The
+    cached result is tagged with the hotels it covers, so it has to hold every hotel of the
+    location: a page cut in SQL would not be outdated by a cancellation in a hotel outside
+    it that brings the hotel into the page. One entry then serves every page, sort order
+    and page size of a search as well as the total count, and the query behind it returns
+    one row per hotel of the location, which is cheap to sort in process.
+
+    The location is trimmed and lowercased once, and the same value keys the cache and is
+    searched, so searches sharing an entry run the same query.
 
     Args:
         location (str): The location to search for hotels.
         date_from (date): The start date of the booking period.
         date_to (date): The end date of the booking period.
+        sort (HotelsSortOrder): The order of the hotels.
+        limit (int): The maximum number of hotels in the page.
+        cursor (str | None): The cursor of the page, the first page if None.
 
     Returns:
-        list[HotelsRoomsLeftSchema]: A list of hotels with available rooms in the specified
-         location.
+        tuple[list[dict], int, str | None]: The hotels of the page, the number of hotels with
+         available rooms and the cursor of the next page, None for the last page.
     """
     from app.hotels.hotel_dao import HotelsDAO
 
@@ -65,11 +120,63 @@ async def get_hotels_by_location_and_time(
         raise DateToEarlierThanDateFrom
     if (date_to - date_from).days > MAX_PERIOD_OF_DAYS_FOR_SEARCH_HOTEL:
         raise LargeIntervalBetweenDates
+    sort_key, key_types = SORT_KEYS[sort]
+    after = None if cursor is None else decode_cursor(cursor, *key_types)
+    location = location.strip().lower()
+
+    async def search_hotels() -> list[dict]:
+        async with async_session_maker() as session:
+            hotels = await HotelsDAO.find_all_in_location_with_rooms_left(
+                location=location,
+                date_from=date_from,
+                date_to=date_to,
+                only_available=False,
+                session=session,
+            )
+        return [dict(hotel) for hotel in hotels]
+
+    hotels = await hotel_search_cache.fetch(location, date_from, date_to, search_hotels)
+    hotels = sorted((hotel for hotel in hotels if hotel["rooms_left"] > 0), key=sort_key)
+    total = len(hotels)
+    if after is not None:
+        hotels = [hotel for hotel in hotels if sort_key(hotel) > after]
+    if len(hotels) <= limit:
+        return hotels, total, None
+    return hotels[:limit], total, encode_cursor(*sort_key(hotels[limit - 1]))
+
+
+@router.get("/{location}")
+async def get_hotels_by_location_and_time(
+    location: str,
+    date_from: date,
+    date_to: date,
+    sort: HotelsSortOrder = HotelsSortOrder.name,
+    limit: int = Query(HOTELS_PAGE_SIZE, ge=1, le=MAX_HOTELS_PAGE_SIZE),
+    cursor: str | None = None,
+) -> list[HotelsRoomsLeftSchema]:
+    """
+    Asynchronously retrieves a page of hotels in a specified location with available rooms for
+    a given date range.
+
+    The number of hotels with available rooms is sent in the `X-Total-Count` header and, when
+    more hotels follow, the cursor of the next page in the `X-Next-Cursor` header.
+
+    Args:
+        location (str): The location to search for hotels.
+        date_from (date): The start date of the booking period.
+        date_to (date): The end date of the booking period.
+        sort (HotelsSortOrder): The order of the hotels.
+        limit (int): The maximum number of hotels in the page.
+        cursor (str | None): The cursor of the page, the first page if None.
 
-    if (date_to - date_from).days <= MAX_PERIOD_OF_DAYS_FOR_SEARCH_HOTEL:
-        hotels = await HotelsDAO.find_all_in_location_with_rooms_left(
-            location=location,
-            date_from=date_from,
-            date_to=date_to,
-        )
-        return hotels
+    Returns:
+        list[HotelsRoomsLeftSchema]: A page of hotels with available rooms in the specified
+         location.
+    """
+    hotels, total, next_cursor = await find_hotels_page(
+        location, date_from, date_to, sort, limit, cursor
+    )
+    headers = {TOTAL_COUNT_HEADER: str(total)}
+    if next_cursor is not None:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return model_list_response(HotelsRoomsLeftSchema, hotels, headers)
@@ -7,9 +7,15 @@ This module defines Pydantic schemas used for validating and serializing hotel d
 Schemas:
     - HotelsRoomsLeftSchema: Represents detailed information about a hotel, including its
      available rooms.
+    - HotelsSortOrder: The orders hotel search results can be sorted in.
 """
 
-from pydantic import BaseModel, Json
+from enum import Enum
+
+from pydantic import BaseModel
+
+HOTELS_PAGE_SIZE = 20
+MAX_HOTELS_PAGE_SIZE = 100
 
 
 class HotelsRoomsLeftSchema(BaseModel):
@@ -23,16 +29,29 @@ class HotelsRoomsLeftSchema(BaseModel):
         id (int): The unique identifier for the hotel.
         name (str): The name of the hotel.
         location (str): The location of the hotel.
-        services (Json): A JSON representation of the services provided by the hotel.
+        services (list[str]): The services provided by the hotel.
         rooms_quantity (int): The total number of rooms available in the hotel.
         image_id (int): The ID associated with the hotel's image.
         rooms_left (int): The number of available rooms in the hotel for the specified period.
+        min_price (int | None): The lowest price per night of the rooms of the hotel.
     """
 
     id: int
     name: str
     location: str
-    services: Json
+    services: list[str]
     rooms_quantity: int
     image_id: int
     rooms_left: int
+    min_price: int | None = None
+
+
+class HotelsSortOrder(str, Enum):
+    """
+    The orders hotel search results can be sorted in: by the lowest room price ascending, by
+    the number of rooms left descending, or by name.
+    """
+
+    price = "price"
+    rooms_left = "rooms_left"
+    name = "name"
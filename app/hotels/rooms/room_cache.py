@@ -0,0 +1,241 @@
+"""
+Room Cache.
+
+This module defines the `RoomCache` class, which caches the room listings of hotels in two
+parts. The static attributes of the rooms of a hotel (name, description, services, price,
+quantity, image) rarely change and are kept in Redis for a long time, with a local cache of
+the worker in front of it whose short lifetime bounds staleness if an invalidation message is
+lost. They are valid while the rooms version of the hotel, bumped by `invalidate_rooms`, does
+not change. The number of booked rooms for a hotel and period is kept in Redis and is valid while
+the version of the hotel, bumped by its bookings (see `hotel_version_key`), does not change.
+
+Attributes:
+    room_cache (RoomCache): The room cache shared by the application.
+"""
+
+import json
+from datetime import date
+from typing import Iterable
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.cache import (
+    CACHE_REQUESTS,
+    INVALIDATION_CHANNEL,
+    LocalCache,
+    invalidation_message,
+)
+from app.hotels.hotel_cache import hotel_version_key
+from app.logger import logger
+from config import settings
+
+
+class RoomCache:
+    """
+    Cache of the rooms of hotels and of their booked counts by period.
+
+    Room and availability entries store the version read before the rooms or the counts
+    were queried, so a change committed while the query was running outdates them. Redis
+    errors are logged and treated as cache misses.
+
+    Attributes:
+        redis (Redis): The Redis client storing rooms, availability and versions.
+        ttl (int): The lifetime of an availability entry in seconds.
+        rooms_ttl (int): The lifetime of the room attributes of a hotel in Redis, in seconds.
+        local (LocalCache): The local cache of room attributes by hotel.
+    """
+
+    def __init__(self, redis: aioredis.Redis, ttl: int, rooms_ttl: int, local: LocalCache):
+        self.redis = redis
+        self.ttl = ttl
+        self.rooms_ttl = rooms_ttl
+        self.local = local
+
+    async def get_rooms(self, hotel_id: int) -> list[dict] | None:
+        """
+        Returns the cached attributes of the rooms of the hotel.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+        """
+        rooms = self.local.get(str(hotel_id))
+        if rooms is not None:
+            return rooms
+        try:
+            cached, version = await self.redis.mget(
+                [self._rooms_key(hotel_id), self._rooms_version_key(hotel_id)]
+            )
+        except RedisError:
+            logger.warning("Cannot read rooms from Redis cache", exc_info=True)
+            return None
+        entry = None if cached is None else json.loads(cached)
+        if entry is not None and entry["version"] != version:
+            entry = None
+        CACHE_REQUESTS.labels("rooms", "redis", "miss" if entry is None else "hit").inc()
+        if entry is None:
+            return None
+        self.local.set(str(hotel_id), entry["rooms"], tags=[hotel_id])
+        return entry["rooms"]
+
+    async def rooms_version(self, hotel_id: int) -> str | None:
+        """
+        Returns the rooms version of the hotel, to be read before querying its rooms.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+        """
+        try:
+            return await self.redis.get(self._rooms_version_key(hotel_id))
+        except RedisError:
+            logger.warning("Cannot read rooms version from Redis", exc_info=True)
+            return None
+
+    async def set_rooms(self, hotel_id: int, rooms: list[dict], version: str | None) -> None:
+        """
+        Caches the attributes of the rooms of the hotel unless they changed since `version`.
+
+        The local entry is set before the version is checked again, so an invalidation
+        applied to this worker in between cannot be overwritten by it.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+            rooms (list[dict]): The rooms of the hotel.
+            version (str | None): The version returned by `rooms_version` before the query.
+        """
+        self.local.set(str(hotel_id), rooms, tags=[hotel_id])
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    self._rooms_key(hotel_id),
+                    json.dumps({"version": version, "rooms": rooms}, default=str),
+                    ex=self.rooms_ttl,
+                )
+                pipe.get(self._rooms_version_key(hotel_id))
+                _, current = await pipe.execute()
+        except RedisError:
+            logger.warning("Cannot write rooms to Redis cache", exc_info=True)
+            current = None
+        if current != version:
+            self.local.delete(str(hotel_id))
+
+    async def invalidate_rooms(self, hotel_ids: Iterable[int]) -> None:
+        """
+        Outdates the cached rooms of the hotels in Redis and drops them from the local caches
+        of all workers.
+
+        Args:
+            hotel_ids (Iterable[int]): The IDs of the hotels whose rooms changed.
+        """
+        hotel_ids = set(hotel_ids)
+        self.local.invalidate_tags(hotel_ids)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for hotel_id in hotel_ids:
+                    pipe.incr(self._rooms_version_key(hotel_id))
+                pipe.publish(
+                    INVALIDATION_CHANNEL, invalidation_message(self.local.name, tags=hotel_ids)
+                )
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Cannot invalidate room cache", exc_info=True)
+
+    async def get_booked(
+        self,
+        hotel_id: int,
+        date_from: date,
+        date_to: date,
+    ) -> dict[int, int] | None:
+        """
+        Returns the cached numbers of booked rooms by room ID, or None if they are not cached
+        or the hotel has been booked since.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+            date_from (date): The start date of the booking period.
+            date_to (date): The end date of the booking period.
+        """
+        try:
+            cached, version = await self.redis.mget(
+                [self._key(hotel_id, date_from, date_to), hotel_version_key(hotel_id)]
+            )
+        except RedisError:
+            logger.warning("Cannot read room availability from Redis cache", exc_info=True)
+            return None
+        entry = None if cached is None else json.loads(cached)
+        if entry is not None and entry["version"] != version:
+            entry = None
+        CACHE_REQUESTS.labels(
+            "rooms-availability", "redis", "miss" if entry is None else "hit"
+        ).inc()
+        if entry is None:
+            return None
+        return {int(room_id): booked for room_id, booked in entry["booked"].items()}
+
+    async def hotel_version(self, hotel_id: int) -> str | None:
+        """
+        Returns the version of the hotel, to be read before counting its booked rooms.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+        """
+        try:
+            return await self.redis.get(hotel_version_key(hotel_id))
+        except RedisError:
+            logger.warning("Cannot read hotel version from Redis", exc_info=True)
+            return None
+
+    async def set_booked(
+        self,
+        hotel_id: int,
+        date_from: date,
+        date_to: date,
+        booked: dict[int, int],
+        version: str | None,
+    ) -> None:
+        """
+        Caches the numbers of booked rooms of the hotel for the period.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+            date_from (date): The start date of the booking period.
+            date_to (date): The end date of the booking period.
+            booked (dict[int, int]): The numbers of booked rooms by room ID.
+            version (str | None): The version returned by `hotel_version` before counting.
+        """
+        try:
+            await self.redis.set(
+                self._key(hotel_id, date_from, date_to),
+                json.dumps({"version": version, "booked": booked}),
+                ex=self.ttl,
+            )
+        except RedisError:
+            logger.warning("Cannot write room availability to Redis cache", exc_info=True)
+
+    @staticmethod
+    def _key(hotel_id: int, date_from: date, date_to: date) -> str:
+        return f"/cache/rooms-availability:{hotel_id}:{date_from}:{date_to}"
+
+    @staticmethod
+    def _rooms_key(hotel_id: int) -> str:
+        return f"/cache/rooms:{hotel_id}"
+
+    @staticmethod
+    def _rooms_version_key(hotel_id: int) -> str:
+        return f"/cache/rooms-version:{hotel_id}"
+
+
+room_cache = RoomCache(
+    redis=aioredis.from_url(
+        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+        encoding="utf-8",
+        decode_responses=True,
+    ),
+    ttl=settings.ROOM_AVAILABILITY_CACHE_TTL_SECONDS,
+    rooms_ttl=settings.ROOM_CACHE_TTL_SECONDS,
+    local=LocalCache(
+        "rooms",
+        max_size=settings.LOCAL_CACHE_SIZE,
+        ttl=settings.LOCAL_CACHE_TTL_SECONDS,
+    ),
+)
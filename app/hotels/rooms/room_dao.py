@@ -7,17 +7,19 @@ including available rooms for specific dates in a hotel.
 
 Methods:
     - get_left_rooms: Retrieves available rooms in a hotel within a given date range.
+    - find_hotel_rooms: Retrieves the rooms of a hotel.
+    - count_booked_rooms: Counts the booked rooms of a hotel within a given date range.
 """
 
 from datetime import date
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.sql.functions import count
+from sqlalchemy import Date, and_, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.booking.booking_models import Bookings
+from app.booking.booking_models import RoomDailyOccupancy
 from app.dao.base import BaseDAO
-from app.database import async_session_maker
-from app.hotels.hotel_models import Hotels
+from app.database import async_session_maker, read_session_maker, session_scope
+from app.hotels.rooms.room_cache import room_cache
 from app.hotels.rooms.room_models import Rooms
 from app.hotels.rooms.room_schemas import HotelRoomsSchema
 
@@ -40,6 +42,13 @@ class RoomsDAO(BaseDAO):
         """
         Asynchronously retrieves available rooms in a hotel for a specified date range.
 
+        The rooms of the hotel and the numbers of booked rooms for the period are cached
+        separately (see `room_cache`), so only the counts are queried again after a booking.
+        Rows that fill the cache are read from the primary, since a lagging replica would
+        miss a change that already outdated the cached rows, such as a booking that bumped
+        the hotel version the counts are stored under or a room edit that bumped the rooms
+        version.
+
         Args:
             date_from (date): The start date of the booking period.
             date_to (date): The end date of the booking period.
@@ -48,21 +57,45 @@ class RoomsDAO(BaseDAO):
         Returns:
             list[HotelRoomsSchema]: A list of available rooms with their details.
         """
-        bookings_in_dates = (
-            select(
-                Bookings.room_id.label("room_id"),
-                count(Bookings.id).label("non_left"),
-            )
-            .where(
-                and_(
-                    Bookings.date_from <= date_to,
-                    Bookings.date_to >= date_from,
-                )
-            )
-            .group_by(Bookings.room_id)
-            .cte()
-        )
+        rooms = await room_cache.get_rooms(hotel_id)
+        if rooms is None:
+            rooms_version = await room_cache.rooms_version(hotel_id)
+            async with async_session_maker() as session:
+                rooms = await cls.find_hotel_rooms(hotel_id, session)
+            await room_cache.set_rooms(hotel_id, rooms, rooms_version)
 
+        booked = await room_cache.get_booked(hotel_id, date_from, date_to)
+        if booked is None:
+            version = await room_cache.hotel_version(hotel_id)
+            async with async_session_maker() as session:
+                booked = await cls.count_booked_rooms(hotel_id, date_from, date_to, session)
+            await room_cache.set_booked(hotel_id, date_from, date_to, booked, version)
+
+        days = (date_to - date_from).days
+        return [
+            {
+                **room,
+                "total_cost": days * room["price"],
+                "rooms_left": max(room["quantity"] - booked.get(room["id"], 0), 0),
+            }
+            for room in rooms
+        ]
+
+    @classmethod
+    async def find_hotel_rooms(
+        cls, hotel_id: int, session: AsyncSession | None = None
+    ) -> list[dict]:
+        """
+        Asynchronously retrieves the rooms of a hotel.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+            session (AsyncSession | None): The session to use instead of a new one on the
+             read replica.
+
+        Returns:
+            list[dict]: The rooms of the hotel.
+        """
         hotel_rooms_stmt = (
             select(
                 Rooms.id,
@@ -73,23 +106,53 @@ class RoomsDAO(BaseDAO):
                 Rooms.price,
                 Rooms.quantity,
                 Rooms.image_id,
-                ((date_to - date_from) * Rooms.price).label("total_price"),
-                (Hotels.rooms_quantity - func.coalesce(bookings_in_dates.c.non_left, 0)).label(
-                    "rooms_free"
-                ),
             )
-            .select_from(Hotels)
-            .join(Rooms, Hotels.id == Rooms.hotel_id, isouter=True)
-            .join(
-                bookings_in_dates,
-                bookings_in_dates.c.room_id == Rooms.id,
-                isouter=True,
-            )
-            .where(hotel_id == Hotels.id)
-            .group_by(Rooms.id, Hotels.rooms_quantity, bookings_in_dates.c.non_left)
+            .where(Rooms.hotel_id == hotel_id)
+            .order_by(Rooms.id)
         )
 
-        async with async_session_maker() as session:
+        async with session_scope(session, read_session_maker()) as session:
             hotel_rooms = await session.execute(hotel_rooms_stmt)
-            hotel_rooms = hotel_rooms.mappings().all()
-            return hotel_rooms
+            return [dict(room) for room in hotel_rooms.mappings()]
+
+    @classmethod
+    async def count_booked_rooms(
+        cls,
+        hotel_id: int,
+        date_from: date,
+        date_to: date,
+        session: AsyncSession | None = None,
+    ) -> dict[int, int]:
+        """
+        Asynchronously counts the booked rooms of every room type of a hotel on the busiest
+        day of a date range, from the daily room occupancy.
+
+        Args:
+            hotel_id (int): The ID of the hotel.
+            date_from (date): The start date of the booking period.
+            date_to (date): The end date of the booking period.
+            session (AsyncSession | None): The session to use instead of a new one on the
+             read replica.
+
+        Returns:
+            dict[int, int]: The numbers of booked rooms by room ID, for booked rooms only.
+        """
+        bookings_in_dates = (
+            select(RoomDailyOccupancy.room_id, func.max(RoomDailyOccupancy.booked))
+            .where(
+                and_(
+                    RoomDailyOccupancy.room_id.in_(
+                        select(Rooms.id).where(Rooms.hotel_id == hotel_id)
+                    ),
+                    RoomDailyOccupancy.day.between(
+                        literal(date_from, Date), literal(date_to, Date)
+                    ),
+                    RoomDailyOccupancy.booked > 0,
+                )
+            )
+            .group_by(RoomDailyOccupancy.room_id)
+        )
+
+        async with session_scope(session, read_session_maker()) as session:
+            booked_rooms = await session.execute(bookings_in_dates)
+            return dict(booked_rooms.tuples().all())
@@ -8,7 +8,7 @@ room name, description, price, services, and quantity.
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, ForeignKey
+from sqlalchemy import JSON, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -41,7 +41,7 @@ class Rooms(Base):
     __tablename__ = "rooms"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    hotel_id: Mapped[int] = mapped_column(ForeignKey("hotels.id"), nullable=False)
+    hotel_id: Mapped[int] = mapped_column(ForeignKey("hotels.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str]
     price: Mapped[int] = mapped_column(nullable=False)
@@ -56,3 +56,6 @@ class Rooms(Base):
     hotel: Mapped["Hotels"] = relationship(
         back_populates="rooms",
     )
+
+
+Index("ix_rooms_hotel_id_price", Rooms.hotel_id, Rooms.price)
@@ -13,10 +13,12 @@ from datetime import date
 
 from app.hotels.hotel_router import router
 from app.hotels.rooms.room_dao import RoomsDAO
+from app.hotels.rooms.room_schemas import HotelRoomsSchema
+from app.responses import model_list_response
 
 
-@router.get("/{hotel_id}/rooms}")
-async def get_hotel_rooms(hotel_id: int, date_from: date, date_to: date):
+@router.get("/{hotel_id}/rooms")
+async def get_hotel_rooms(hotel_id: int, date_from: date, date_to: date) -> list[HotelRoomsSchema]:
     """
     Asynchronously retrieves available rooms for a hotel within a specified date range.
 
@@ -31,4 +33,4 @@ async def get_hotel_rooms(hotel_id: int, date_from: date, date_to: date):
     hotel_rooms_left = await RoomsDAO.get_left_rooms(
         date_from=date_from, date_to=date_to, hotel_id=hotel_id
     )
-    return hotel_rooms_left
+    return model_list_response(HotelRoomsSchema, hotel_rooms_left)
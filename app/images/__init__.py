@@ -8,6 +8,7 @@ the images.
 Modules:
     - router: Defines the FastAPI router for uploading hotel images and processing them
      asynchronously.
+    - image_storage: Streams uploaded images to disk and skips unchanged ones.
 """
 
 from .images_router import router
@@ -0,0 +1,111 @@
+"""
+Image Storage.
+
+This module stores uploaded hotel images without blocking the event loop. An upload is
+received as a stream of chunks which are written to a temporary file in a worker thread while
+their SHA-256 hash is computed, so the size of an upload is capped before it is read to the
+end and its content never has to be held in memory.
+
+The hash of every stored image is kept next to it once its processing has been queued (see
+`remember_image`). When the same bytes are uploaded again, the temporary file is dropped and
+the image is not processed again.
+"""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+
+from app.exceptions import ImageTooLargeException
+
+IMAGES_DIRECTORY = Path("app/static/images")
+
+
+def image_path(name: int) -> Path:
+    """
+    Returns the path of the original image of a hotel.
+    """
+    return IMAGES_DIRECTORY / f"{name}.webp"
+
+
+def _write_chunk(file_object: BinaryIO, digest, chunk: bytes) -> None:
+    file_object.write(chunk)
+    digest.update(chunk)
+
+
+def _read_hash(hash_path: Path) -> str | None:
+    try:
+        return hash_path.read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+def _replace(part_path: Path, path: Path, hash_path: Path) -> None:
+    hash_path.unlink(missing_ok=True)
+    os.replace(part_path, path)
+
+
+async def store_image(
+    chunks: AsyncIterator[bytes],
+    name: int,
+    max_bytes: int,
+) -> tuple[str, bool]:
+    """
+    Streams an uploaded image to disk.
+
+    The chunks are written to a temporary file of the upload which only replaces the stored
+    image once the upload is complete, so an interrupted or rejected upload leaves the
+    previous image intact. The hash of a replaced image is dropped until `remember_image`
+    records the new one.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The content of the upload.
+        name (int): The ID of the image.
+        max_bytes (int): The largest accepted upload, in bytes.
+
+    Returns:
+        tuple[str, bool]: The hex SHA-256 hash of the image and whether it differs from the
+         previously stored image.
+
+    Raises:
+        ImageTooLargeException: If the upload is larger than `max_bytes`.
+    """
+    path = image_path(name)
+    part_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.part")
+    hash_path = path.with_name(f"{path.name}.sha256")
+    digest = hashlib.sha256()
+    size = 0
+    file_object = await asyncio.to_thread(open, part_path, "wb")
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_bytes:
+                raise ImageTooLargeException
+            await asyncio.to_thread(_write_chunk, file_object, digest, chunk)
+    except BaseException:
+        await asyncio.to_thread(file_object.close)
+        await asyncio.to_thread(part_path.unlink, missing_ok=True)
+        raise
+    await asyncio.to_thread(file_object.close)
+
+    sha256 = digest.hexdigest()
+    if path.exists() and await asyncio.to_thread(_read_hash, hash_path) == sha256:
+        await asyncio.to_thread(part_path.unlink, missing_ok=True)
+        return sha256, False
+    await asyncio.to_thread(_replace, part_path, path, hash_path)
+    return sha256, True
+
+
+async def remember_image(name: int, sha256: str) -> None:
+    """
+    Records the hash of the stored image once its processing has been queued, so later
+    uploads of the same bytes are not processed again.
+
+    Args:
+        name (int): The ID of the image.
+        sha256 (str): The hex SHA-256 hash returned by `store_image`.
+    """
+    path = image_path(name)
+    await asyncio.to_thread(path.with_name(f"{path.name}.sha256").write_text, sha256)
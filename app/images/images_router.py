@@ -2,44 +2,129 @@
 Router module for handling image uploads.
 
 This module defines the FastAPI router for handling image uploads related to hotels.
-It provides an endpoint for uploading hotel images, storing them in the static images directory,
+It provides endpoints for uploading hotel images, streaming them to the static images directory,
 and processing the images asynchronously using a background task.
 
 Endpoints:
-    - add_hotel_image: Uploads an image for a hotel, stores it, and triggers background image
-     processing.
+    - add_hotel_image: Uploads an image for a hotel as a form file.
+    - put_hotel_image: Uploads an image for a hotel as the raw request body.
+
+Requests whose `Content-Length` shows they are too large are rejected before their body is
+read, so an oversized form is not spooled to a temporary file first.
 """
 
-import shutil
+import asyncio
+from typing import AsyncIterator, Callable, Coroutine
 
-from fastapi import APIRouter, UploadFile
+from fastapi import APIRouter, Request, Response, UploadFile
+from fastapi.routing import APIRoute
 
+from app.exceptions import ImageTooLargeException, IncorrectContentLengthException
+from app.images.image_storage import image_path, remember_image, store_image
 from app.tasks.tasks import proceed_picture
+from config import settings
+
+FORM_OVERHEAD_BYTES = 16 * 1024
+
+
+def _check_content_length(request: Request, max_bytes: int) -> None:
+    """
+    Rejects the request if its `Content-Length` header is invalid or exceeds `max_bytes`.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None and not content_length.isdigit():
+        raise IncorrectContentLengthException
+    if content_length and int(content_length) > max_bytes:
+        raise ImageTooLargeException
+
+
+class ImageUploadRoute(APIRoute):
+    """
+    Route checking the `Content-Length` of a request before its body is parsed.
+
+    The limit leaves `FORM_OVERHEAD_BYTES` for the boundaries and headers of a multipart form
+    on top of `IMAGE_UPLOAD_MAX_BYTES`; the exact size of the file is checked as it is stored.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def upload_route_handler(request: Request) -> Response:
+            _check_content_length(request, settings.IMAGE_UPLOAD_MAX_BYTES + FORM_OVERHEAD_BYTES)
+            return await route_handler(request)
+
+        return upload_route_handler
+
 
 router = APIRouter(
     prefix="/images",
     tags=["Загрузка картинок"],
+    route_class=ImageUploadRoute,
 )
 
 
+async def _file_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(settings.IMAGE_UPLOAD_CHUNK_BYTES):
+        yield chunk
+
+
+async def _save_hotel_image(name: int, chunks: AsyncIterator[bytes]) -> dict:
+    """
+    Stores the uploaded image and triggers its processing unless its content is unchanged.
+
+    The hash of the image is only recorded once its processing is queued, so an upload that
+    failed to queue it is processed when it is sent again. The task is sent to the broker in
+    a worker thread, so a slow broker does not block the event loop.
+    """
+    sha256, changed = await store_image(chunks, name, settings.IMAGE_UPLOAD_MAX_BYTES)
+    if changed:
+        await asyncio.to_thread(proceed_picture.delay, str(image_path(name)))
+        await remember_image(name, sha256)
+    return {"name": name, "sha256": sha256, "processed": changed}
+
+
 @router.post("/hotels")
-async def add_hotel_image(name: int, file: UploadFile):
+async def add_hotel_image(name: int, file: UploadFile) -> dict:
     """
     Asynchronously uploads and processes a hotel image.
 
     This endpoint allows users to upload an image for a hotel. The image is saved in the
     `app/static/images/` directory with the provided hotel name as the file name
-    (with a `.webp` extension). After storing the file, a background task (`proceed_picture`)
-    is triggered to process the image.
+    (with a `.webp` extension). The file is copied in chunks without blocking the event loop,
+    and uploads larger than `IMAGE_UPLOAD_MAX_BYTES` are rejected. The form is spooled to a
+    temporary file before it is handled, so clients sending large images, or sending them
+    without a `Content-Length`, should use `put_hotel_image`. After storing the file, a
+    background task (`proceed_picture`) is triggered to process the image, unless the same
+    image was already uploaded.
 
     Args:
         name (int): The ID or name associated with the hotel to which the image belongs.
         file (UploadFile): The image file being uploaded.
 
     Returns:
-        dict: A message indicating the successful upload and processing initiation.
+        dict: The name and SHA-256 hash of the image, and whether it is being processed.
+    """
+    if file.size is not None and file.size > settings.IMAGE_UPLOAD_MAX_BYTES:
+        raise ImageTooLargeException
+    return await _save_hotel_image(name, _file_chunks(file))
+
+
+@router.put("/hotels/{name}")
+async def put_hotel_image(name: int, request: Request) -> dict:
+    """
+    Asynchronously uploads and processes a hotel image sent as the raw request body.
+
+    The body is streamed to disk as it is received, so large images are neither buffered in
+    memory nor spooled to a temporary file first. A request whose `Content-Length` exceeds
+    `IMAGE_UPLOAD_MAX_BYTES` is rejected before its body is read, and a body growing past the
+    limit is rejected as soon as it does.
+
+    Args:
+        name (int): The ID or name associated with the hotel to which the image belongs.
+        request (Request): The request with the image as its body.
+
+    Returns:
+        dict: The name and SHA-256 hash of the image, and whether it is being processed.
     """
-    im_path = f"app/static/images/{name}.webp"
-    with open(im_path, "wb+") as file_object:
-        shutil.copyfileobj(file.file, file_object)
-    proceed_picture.delay(im_path)
+    _check_content_length(request, settings.IMAGE_UPLOAD_MAX_BYTES)
+    return await _save_hotel_image(name, request.stream())
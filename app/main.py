@@ -4,19 +4,18 @@ from starlette.staticfiles import StaticFiles
 from app.app_components.admin import setup_admin_panel
 from app.app_components.instrumentation import setup_instrumentation
 from app.app_components.middleware import setup_middleware
-from app.app_components.redis_cache import init_cache
+from app.app_components.outbox import setup_outbox_dispatcher
+from app.app_components.redis_cache import setup_cache_invalidation
 from app.app_components.routes import include_routers
 from app.app_components.sentry import init_sentry
 from app.app_components.versioning import init_versioned_fastapi
+from app.responses import ORJSONResponse
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Инициализация Sentry
 init_sentry()
 
-# Инициализация кэша
-init_cache()
-
 # Добавление роутеров
 include_routers(app)
 
@@ -33,3 +32,9 @@ setup_instrumentation(app)
 
 # Настройка административной панели
 setup_admin_panel(app)
+
+# Согласование локальных кэшей воркеров
+setup_cache_invalidation(app)
+
+# Публикация задач из outbox в Celery
+setup_outbox_dispatcher(app)
@@ -0,0 +1,41 @@
+"""hotels location trigram index
+
+Revision ID: 4f1d2c7a9b3e
+Revises: e3a4ba708831
+Create Date: 2026-10-18 10:40:12.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f1d2c7a9b3e"
+down_revision: Union[str, None] = "e3a4ba708831"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+        """
+    )
+    op.create_index(
+        "ix_hotels_location_trgm",
+        "hotels",
+        [sa.text("f_unaccent(lower(location)) gin_trgm_ops")],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_hotels_location_trgm", table_name="hotels")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
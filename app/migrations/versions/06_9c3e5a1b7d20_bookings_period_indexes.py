@@ -0,0 +1,34 @@
+"""bookings period indexes
+
+Revision ID: 9c3e5a1b7d20
+Revises: 4f1d2c7a9b3e
+Create Date: 2026-10-18 11:02:47.905113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e5a1b7d20"
+down_revision: Union[str, None] = "4f1d2c7a9b3e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.create_index(
+        "ix_bookings_room_id_period",
+        "bookings",
+        ["room_id", sa.text("daterange(date_from, date_to, '[]')")],
+        postgresql_using="gist",
+    )
+    op.create_index("ix_rooms_hotel_id", "rooms", ["hotel_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rooms_hotel_id", table_name="rooms")
+    op.drop_index("ix_bookings_room_id_period", table_name="bookings")
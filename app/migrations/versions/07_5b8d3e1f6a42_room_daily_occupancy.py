@@ -0,0 +1,53 @@
+"""room daily occupancy
+
+Revision ID: 5b8d3e1f6a42
+Revises: 9c3e5a1b7d20
+Create Date: 2026-10-18 15:20:13.518347
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8d3e1f6a42"
+down_revision: Union[str, None] = "9c3e5a1b7d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "room_daily_occupancy",
+        sa.Column("room_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("booked", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "modified_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["room_id"], ["rooms.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("room_id", "day"),
+    )
+    op.execute(
+        """
+        INSERT INTO room_daily_occupancy (room_id, day, booked)
+        SELECT room_id, day::date, count(*)
+        FROM bookings, generate_series(date_from, date_to, interval '1 day') AS day
+        GROUP BY room_id, day
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("room_daily_occupancy")
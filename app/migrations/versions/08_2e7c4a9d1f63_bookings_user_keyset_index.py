@@ -0,0 +1,29 @@
+"""bookings user keyset index
+
+Revision ID: 2e7c4a9d1f63
+Revises: 5b8d3e1f6a42
+Create Date: 2026-10-18 15:24:11.318402
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2e7c4a9d1f63"
+down_revision: Union[str, None] = "5b8d3e1f6a42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_bookings_user_id_date_from_id",
+        "bookings",
+        ["user_id", "date_from", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bookings_user_id_date_from_id", table_name="bookings")
@@ -0,0 +1,25 @@
+"""rooms hotel id price index
+
+Revision ID: 7d1b5f3c8e24
+Revises: 2e7c4a9d1f63
+Create Date: 2026-10-18 16:02:37.640119
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d1b5f3c8e24"
+down_revision: Union[str, None] = "2e7c4a9d1f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_rooms_hotel_id_price", "rooms", ["hotel_id", "price"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rooms_hotel_id_price", table_name="rooms")
@@ -0,0 +1,32 @@
+"""drop bookings period index
+
+Revision ID: 8a4e2f6c1d95
+Revises: 3f9a6c2d8b17
+Create Date: 2026-10-18 19:40:12.318604
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4e2f6c1d95"
+down_revision: Union[str, None] = "3f9a6c2d8b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_bookings_room_id_period", table_name="bookings")
+
+
+def downgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.create_index(
+        "ix_bookings_room_id_period",
+        "bookings",
+        ["room_id", sa.text("daterange(date_from, date_to, '[]')")],
+        postgresql_using="gist",
+    )
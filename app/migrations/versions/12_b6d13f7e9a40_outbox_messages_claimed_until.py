@@ -0,0 +1,26 @@
+"""outbox messages claimed until
+
+Revision ID: b6d13f7e9a40
+Revises: 8a4e2f6c1d95
+Create Date: 2026-10-18 20:12:37.604918
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d13f7e9a40"
+down_revision: Union[str, None] = "8a4e2f6c1d95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("outbox_messages", sa.Column("claimed_until", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("outbox_messages", "claimed_until")
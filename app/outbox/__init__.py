@@ -0,0 +1,16 @@
+"""
+Outbox Module Package
+
+This package implements the transactional outbox of the application: Celery tasks caused by a
+change are written to a table in the transaction of the change and published to the broker
+by a background dispatcher, so requests do no broker I/O and tasks survive broker outages.
+
+Modules:
+    - models: Contains the `OutboxMessages` model of the tasks waiting to be published.
+    - dao: Contains the `OutboxDAO` class writing tasks to the outbox and publishing them.
+"""
+
+from app.outbox.outbox_dao import OutboxDAO
+from app.outbox.outbox_models import OutboxMessages
+
+__all__ = ["OutboxDAO", "OutboxMessages"]
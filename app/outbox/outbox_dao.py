@@ -0,0 +1,136 @@
+"""
+Outbox Data Access Object Module
+
+This module provides the `OutboxDAO` class, which writes Celery tasks to the outbox within
+the transaction of the caller and publishes them to the broker in batches. Publishing is done
+by a background task of the application (see `app.app_components.outbox`), so requests never
+wait for the broker, and messages written while the broker is unavailable are published once
+it is back.
+
+Tasks are published at least once: the messages of a dispatcher stopped between claiming a
+batch and deleting it are published again once their lease expires.
+"""
+
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dao.base import BaseDAO
+from app.database import async_session_maker
+from app.logger import logger
+from app.outbox.outbox_models import OutboxMessages
+from app.tasks.celery import celery
+from config import settings
+
+
+class OutboxDAO(BaseDAO):
+    """
+    Data Access Object for the outbox of Celery tasks.
+
+    Attributes:
+        written (asyncio.Event): Set when messages are committed, to wake up the dispatcher
+         of the worker before its next poll.
+    """
+
+    model = OutboxMessages
+
+    written = asyncio.Event()
+
+    @classmethod
+    async def add(cls, session: AsyncSession, task: str, kwargs: dict) -> None:
+        """
+        Writes a Celery task to the outbox within the transaction of the session.
+
+        The caller commits the transaction and then calls `notify`.
+
+        Args:
+            session (AsyncSession): The session of the transaction making the change.
+            task (str): The name of the Celery task.
+            kwargs (dict): The JSON keyword arguments of the task.
+        """
+        await session.execute(insert(OutboxMessages).values(task=task, kwargs=kwargs))
+
+    @classmethod
+    def notify(cls) -> None:
+        """
+        Wakes up the dispatcher of the worker after messages have been committed.
+        """
+        cls.written.set()
+
+    @classmethod
+    async def dispatch(cls, batch_size: int) -> int:
+        """
+        Publishes the oldest messages of the outbox to Celery and deletes them.
+
+        The messages are claimed in a short transaction, which leases them for
+        `OUTBOX_LEASE_SECONDS`. Rows are picked with `FOR UPDATE SKIP LOCKED`, so the
+        dispatchers of several workers claim disjoint batches. The batch is then published
+        in a thread, as the broker client is blocking, with no transaction or connection
+        held. A second transaction deletes the published messages and releases the rest, so
+        after a failed publish they are retried by the next batch.
+
+        Args:
+            batch_size (int): The largest number of messages to publish.
+
+        Returns:
+            int: The number of published messages.
+        """
+        claimable = (
+            select(OutboxMessages.id)
+            .where(
+                or_(
+                    OutboxMessages.claimed_until.is_(None),
+                    OutboxMessages.claimed_until < func.now(),
+                )
+            )
+            .order_by(OutboxMessages.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with async_session_maker() as session:
+            messages = await session.execute(
+                update(OutboxMessages)
+                .where(OutboxMessages.id.in_(claimable))
+                .values(
+                    claimed_until=func.now() + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+                )
+                .returning(OutboxMessages.id, OutboxMessages.task, OutboxMessages.kwargs)
+            )
+            messages = sorted(messages.all())
+            await session.commit()
+        if not messages:
+            return 0
+
+        published = await asyncio.to_thread(_publish, messages)
+
+        unpublished = [message_id for message_id, _, _ in messages[len(published) :]]
+        async with async_session_maker() as session:
+            if published:
+                await session.execute(
+                    delete(OutboxMessages).where(OutboxMessages.id.in_(published))
+                )
+            if unpublished:
+                await session.execute(
+                    update(OutboxMessages)
+                    .where(OutboxMessages.id.in_(unpublished))
+                    .values(claimed_until=None)
+                )
+            await session.commit()
+        return len(published)
+
+
+def _publish(messages: list) -> list[int]:
+    """
+    Sends the tasks to the broker and returns the IDs of the published messages.
+    """
+    published = []
+    for message_id, task, kwargs in messages:
+        try:
+            celery.send_task(task, kwargs=kwargs)
+        except Exception:
+            logger.warning("Cannot publish outbox message", extra={"task": task}, exc_info=True)
+            break
+        published.append(message_id)
+    return published
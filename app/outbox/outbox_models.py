@@ -0,0 +1,36 @@
+"""
+Outbox Model.
+
+This module defines the `OutboxMessages` class, which holds the Celery tasks to be published
+for committed changes. A message is inserted in the same transaction as the change it
+belongs to, so it exists if and only if the change was committed, and it is deleted once the
+task has been published (see `OutboxDAO.dispatch`).
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class OutboxMessages(Base):
+    """
+    Represents a Celery task waiting to be published.
+
+    Attributes:
+        id (int): The ID of the message, increasing in the order of insertion.
+        task (str): The name of the Celery task.
+        kwargs (dict): The JSON keyword arguments of the task.
+        claimed_until (datetime | None): When the lease of the dispatcher publishing the
+         message expires, or None if the message is not being published.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    task: Mapped[str] = mapped_column(nullable=False)
+    kwargs: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    claimed_until: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -2,18 +2,25 @@
 Frontend Routes for Rendering HTML Pages.
 
 This module defines the FastAPI router for rendering HTML pages for the frontend. It includes
-a route for rendering the hotels page, which fetches hotel data
+a route for rendering the hotels page, which fetches a page of hotel data
 and renders it using a Jinja2 template.
 
 Endpoints:
     - get_hotels_page: Renders a page displaying hotels available
-     in a specified location and date range.
+     in a specified location and date range, page by page.
 """
 
-from fastapi import APIRouter, Depends, Request
+from datetime import date
+
+from fastapi import APIRouter, Query, Request
 from fastapi.templating import Jinja2Templates
 
-from app.hotels.hotel_router import get_hotels_by_location_and_time
+from app.hotels.hotel_router import find_hotels_page
+from app.hotels.hotel_schemas import (
+    HOTELS_PAGE_SIZE,
+    MAX_HOTELS_PAGE_SIZE,
+    HotelsSortOrder,
+)
 
 router = APIRouter(prefix="/pages", tags=["Фронтент"])
 
@@ -21,22 +28,45 @@ templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("/hotels")
-async def get_hotels_page(request: Request, hotels=Depends(get_hotels_by_location_and_time)):
+async def get_hotels_page(
+    request: Request,
+    location: str,
+    date_from: date,
+    date_to: date,
+    sort: HotelsSortOrder = HotelsSortOrder.name,
+    limit: int = Query(HOTELS_PAGE_SIZE, ge=1, le=MAX_HOTELS_PAGE_SIZE),
+    cursor: str | None = None,
+):
     """
     Renders the hotels page displaying available hotels based on the location and date range.
 
-    This endpoint fetches the list of hotels from the backend (using the
-    `get_hotels_by_location_and_time` function) and renders it on the `hotels.html`
-     page using Jinja2 templates.
+    This endpoint fetches a page of hotels from the backend (using the `find_hotels_page`
+    function) and renders it on the `hotels.html` page using Jinja2 templates, with links
+    to the other sort orders and to the next page.
 
     Args:
         request (Request): The incoming HTTP request required for rendering the template.
-        hotels: A list of hotels retrieved based on the location and date range.
+        location (str): The location to search for hotels.
+        date_from (date): The start date of the booking period.
+        date_to (date): The end date of the booking period.
+        sort (HotelsSortOrder): The order of the hotels.
+        limit (int): The maximum number of hotels in the page.
+        cursor (str | None): The cursor of the page, the first page if None.
 
     Returns:
-        TemplateResponse: The rendered HTML page with the list of hotels.
+        TemplateResponse: The rendered HTML page with the page of hotels.
     """
+    hotels, total, next_cursor = await find_hotels_page(
+        location, date_from, date_to, sort, limit, cursor
+    )
     return templates.TemplateResponse(
         name="hotels.html",
-        context={"request": request, "hotels": hotels},
+        context={
+            "request": request,
+            "hotels": hotels,
+            "total": total,
+            "sort": sort,
+            "sort_orders": list(HotelsSortOrder),
+            "next_cursor": next_cursor,
+        },
     )
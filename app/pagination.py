@@ -0,0 +1,53 @@
+"""
+Cursor Pagination Helpers.
+
+This module provides the opaque cursors used by the paginated endpoints. A cursor holds the
+sort key of the last item of a page, and the next page starts after that key, so pages stay
+consistent while items are added or removed. Endpoints return the page items as a list and
+send the cursor of the next page and the total count in response headers.
+
+Attributes:
+    NEXT_CURSOR_HEADER (str): The header holding the cursor of the next page.
+    TOTAL_COUNT_HEADER (str): The header holding the total number of items.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable
+
+from app.exceptions import IncorrectCursorException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def encode_cursor(*key: Any) -> str:
+    """
+    Builds the opaque cursor of the page starting after the given sort key.
+
+    Args:
+        *key (Any): The values of the sort key of the last item of the page.
+    """
+    return base64.urlsafe_b64encode(json.dumps(key, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """
+    Returns the sort key held by a cursor.
+
+    Args:
+        cursor (str): The cursor built by `encode_cursor`.
+        *types (Callable[[Any], Any]): The converters of the values of the key, in order.
+
+    Raises:
+        IncorrectCursorException: If the cursor was not built by `encode_cursor` for a key
+         of the given types.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor))
+        if not isinstance(key, list) or len(key) != len(types):
+            raise ValueError(cursor)
+        return tuple(convert(value) for convert, value in zip(types, key))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise IncorrectCursorException
@@ -0,0 +1,47 @@
+"""
+JSON Responses.
+
+This module provides the JSON responses of the API. Responses are encoded with orjson (see
+`ORJSONResponse`, the default response class of the application). List endpoints use
+`model_list_response`, which validates rows against the response schema and encodes them to
+JSON in a single pass of pydantic-core, instead of validating them, converting them back to
+Python objects and encoding those.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Mapping
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+__all__ = ["ORJSONResponse", "model_list_response"]
+
+
+@lru_cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """
+    Returns the adapter validating and serializing lists of the given schema.
+    """
+    return TypeAdapter(list[schema])
+
+
+def model_list_response(
+    schema: type[BaseModel],
+    rows: Iterable[Mapping],
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Builds the JSON response of a list of rows validated against a schema.
+
+    Args:
+        schema (type[BaseModel]): The schema of an item of the list.
+        rows (Iterable[Mapping]): The rows, such as SQLAlchemy `RowMapping` objects or dicts.
+        headers (Mapping[str, str] | None): The headers of the response.
+
+    Returns:
+        Response: The response with the JSON encoded list.
+    """
+    adapter = _list_adapter(schema)
+    content = adapter.dump_json(adapter.validate_python(rows))
+    return Response(content=content, media_type="application/json", headers=headers)
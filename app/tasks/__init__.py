@@ -8,17 +8,32 @@ and email templates for booking confirmations.
 Modules:
     - celery: Configures and initializes the Celery application for background tasks.
     - email_templates: Defines templates for creating and sending emails.
-    - tasks: Contains background tasks such as image resizing
-    and email sending that are executed by Celery.
+    - mailer: Sends emails over a pooled SMTP connection of the worker process.
+    - image_renditions: Resizes and encodes the renditions of uploaded images.
+    - tasks: Contains background tasks such as image resizing, email sending
+    and daily room occupancy maintenance that are executed by Celery.
 """
 
 from app.tasks.celery import celery
-from app.tasks.email_templates import create_bookings_confirmation_template
-from app.tasks.tasks import proceed_picture, send_bookings_confirmation_email
+from app.tasks.email_templates import (
+    create_bookings_batch_confirmation_template,
+    create_bookings_confirmation_template,
+)
+from app.tasks.tasks import (
+    check_room_occupancy,
+    proceed_picture,
+    rebuild_room_occupancy,
+    send_bookings_batch_confirmation_email,
+    send_bookings_confirmation_email,
+)
 
 __all__ = [
     "celery",
+    "check_room_occupancy",
+    "create_bookings_batch_confirmation_template",
     "create_bookings_confirmation_template",
     "proceed_picture",
+    "rebuild_room_occupancy",
+    "send_bookings_batch_confirmation_email",
     "send_bookings_confirmation_email",
 ]
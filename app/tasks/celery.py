@@ -7,14 +7,53 @@ asynchronous tasks in the project, with Redis as the message broker.
 Celery is set up based on the application environment, either using the test or production Redis
 instance, and is used for background tasks such as image processing and sending emails.
 
+Tasks are routed to dedicated queues, so that CPU-heavy image processing never delays the
+latency-sensitive confirmation emails: `emails`, `images` and `default` for the maintenance
+tasks. Every queue has its own time limit, and a worker takes the concurrency and prefetch
+multiplier configured for the first queue it consumes (`celery worker -Q images`), unless they
+are given on the command line.
+
+Celery beat checks the daily room occupancy against the bookings every
+`OCCUPANCY_CHECK_SECONDS`.
+
 Attributes:
     celery (Celery): The Celery application instance.
+    QUEUES (dict[str, dict]): The concurrency, prefetch multiplier and time limit by queue.
+    TASK_QUEUES (dict[str, str]): The queue of every task routed off the default queue.
 """
 
 from celery import Celery
+from celery.signals import celeryd_init
+from kombu import Queue
 
 from config import settings
 
+QUEUES = {
+    "emails": {
+        "concurrency": settings.CELERY_EMAILS_CONCURRENCY,
+        "prefetch_multiplier": settings.CELERY_EMAILS_PREFETCH_MULTIPLIER,
+        "time_limit": settings.CELERY_EMAILS_TIME_LIMIT_SECONDS,
+    },
+    "images": {
+        "concurrency": settings.CELERY_IMAGES_CONCURRENCY,
+        "prefetch_multiplier": settings.CELERY_IMAGES_PREFETCH_MULTIPLIER,
+        "time_limit": settings.CELERY_IMAGES_TIME_LIMIT_SECONDS,
+    },
+    "default": {
+        "concurrency": settings.CELERY_DEFAULT_CONCURRENCY,
+        "prefetch_multiplier": settings.CELERY_DEFAULT_PREFETCH_MULTIPLIER,
+        "time_limit": settings.CELERY_DEFAULT_TIME_LIMIT_SECONDS,
+    },
+}
+
+TASK_QUEUES = {
+    "app.tasks.tasks.send_bookings_confirmation_email": "emails",
+    "app.tasks.tasks.send_bookings_batch_confirmation_email": "emails",
+    "app.tasks.tasks.proceed_picture": "images",
+}
+
+HARD_TIME_LIMIT_GRACE_SECONDS = 30
+
 if settings.MODE == "TEST":
     CELERY_BROKER_URL = f"redis://{settings.TEST_REDIS_HOST}:{settings.REDIS_PORT}"
 else:
@@ -25,3 +64,41 @@ celery = Celery(
     broker=CELERY_BROKER_URL,
     include=["app.tasks.tasks"],
 )
+
+celery.conf.update(
+    task_queues=[Queue(name) for name in QUEUES],
+    task_default_queue="default",
+    task_routes={task: {"queue": queue} for task, queue in TASK_QUEUES.items()},
+    task_annotations={
+        task: {
+            "soft_time_limit": QUEUES[queue]["time_limit"],
+            "time_limit": QUEUES[queue]["time_limit"] + HARD_TIME_LIMIT_GRACE_SECONDS,
+        }
+        for task, queue in TASK_QUEUES.items()
+    },
+    task_soft_time_limit=QUEUES["default"]["time_limit"],
+    task_time_limit=QUEUES["default"]["time_limit"] + HARD_TIME_LIMIT_GRACE_SECONDS,
+    task_acks_late=settings.CELERY_ACKS_LATE,
+    task_ignore_result=True,
+    worker_concurrency=QUEUES["default"]["concurrency"],
+    worker_prefetch_multiplier=QUEUES["default"]["prefetch_multiplier"],
+    beat_schedule={
+        "check-room-occupancy": {
+            "task": "app.tasks.tasks.check_room_occupancy",
+            "schedule": settings.OCCUPANCY_CHECK_SECONDS,
+        },
+    },
+)
+
+
+@celeryd_init.connect
+def configure_worker(conf, options: dict, **kwargs) -> None:
+    """
+    Applies the concurrency and prefetch multiplier of the first queue the worker consumes.
+    """
+    queues = options.get("queues") or []
+    if isinstance(queues, str):
+        queues = queues.split(",")
+    queue = next((queue for queue in queues if queue in QUEUES), "default")
+    conf.worker_concurrency = QUEUES[queue]["concurrency"]
+    conf.worker_prefetch_multiplier = QUEUES[queue]["prefetch_multiplier"]
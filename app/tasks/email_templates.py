@@ -1,13 +1,16 @@
 """
 Email Template Generator.
 
-This module contains functions for creating email templates. Currently, it defines a template
-for confirming bookings. The templates use HTML formatting for the email body and are configured
-to be sent via the email server specified in the application settings.
+This module contains functions for creating email templates. Currently, it defines templates
+for confirming a single booking and a batch of bookings. The templates use HTML formatting
+for the email body and are configured to be sent via the email server specified in the
+application settings.
 
 Functions:
     - create_bookings_confirmation_template: Creates an HTML email template for
      booking confirmation.
+    - create_bookings_batch_confirmation_template: Creates an HTML email template for
+     confirmation of several bookings.
 """
 
 from email.message import EmailMessage
@@ -45,3 +48,38 @@ def create_bookings_confirmation_template(bookings: dict, email_to: EmailStr):
         subtype="html",
     )
     return email
+
+
+def create_bookings_batch_confirmation_template(bookings: list[dict], email_to: EmailStr):
+    """
+    Creates a confirmation email template for a batch of bookings.
+
+    This function generates one email that lists the periods of all bookings made
+    in a single batch, formatted in HTML.
+
+    Args:
+        bookings (list[dict]): The bookings that need to be included in the email.
+        email_to (EmailStr): The email address of the recipient.
+
+    Returns:
+        EmailMessage: The constructed email message object with the confirmation details.
+    """
+    email = EmailMessage()
+
+    email["Subject"] = "Подтверждение бронирования"
+    email["From"] = settings.SMTP_USER
+    email["To"] = email_to
+
+    periods = "".join(
+        f"<li>Номер {booking['room_id']}: с {booking['date_from']} до {booking['date_to']}</li>"
+        for booking in bookings
+    )
+    email.set_content(
+        f"""
+            <h1>Подтвердите бронирование</h1>
+            Вы забронировали номера:
+            <ul>{periods}</ul>
+        """,
+        subtype="html",
+    )
+    return email
@@ -0,0 +1,106 @@
+"""
+Image Renditions.
+
+This module turns an uploaded hotel image into its resized renditions. The image is decoded
+once: JPEG images are decoded directly at a reduced scale with `Image.draft`, sized for the
+image as it is displayed after its EXIF orientation is applied, large scale factors are
+covered by the fast box reduction of `Image.reduce` before the final Lanczos resize, and every
+rendition is downsampled from the previous, larger one rather than from the full-resolution
+image.
+
+Renditions are encoded as WebP and, if the installed Pillow can write it, AVIF, with the
+quality configured in the settings.
+
+Functions:
+    - create_renditions: Writes the resized renditions of an image.
+"""
+
+from pathlib import Path
+
+from PIL import ExifTags, Image, ImageOps
+
+from app.logger import logger
+
+REDUCING_GAP = 2
+
+IMAGE_FORMATS = {"webp": "WEBP", "avif": "AVIF"}
+
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def _downscale(image: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """
+    Resizes the image, reducing it by an integer factor first if it is much larger.
+
+    The reduction leaves the image at least `REDUCING_GAP` times larger than the requested
+    size, so the final Lanczos resize keeps its quality while working on far fewer pixels.
+    """
+    factor = min(image.width // (size[0] * REDUCING_GAP), image.height // (size[1] * REDUCING_GAP))
+    if factor > 1:
+        image = image.reduce(factor)
+    return image.resize(size, Image.Resampling.LANCZOS)
+
+
+def _save_options(image_format: str, quality: dict[str, int]) -> dict:
+    if image_format == "avif":
+        return {"quality": quality["avif"], "speed": 6}
+    return {"quality": quality["webp"], "method": 4}
+
+
+def create_renditions(
+    path: Path,
+    sizes: list[tuple[int, int]],
+    formats: list[str],
+    quality: dict[str, int],
+) -> list[Path]:
+    """
+    Writes the renditions of an image next to it, as `resized_{width}_{height}_{name}`.
+
+    Args:
+        path (Path): The path of the uploaded image.
+        sizes (list[tuple[int, int]]): The widths and heights of the renditions.
+        formats (list[str]): The formats of the renditions, `webp` and `avif`.
+        quality (dict[str, int]): The encoder quality by format.
+
+    Returns:
+        list[Path]: The paths of the written renditions.
+    """
+    formats = [image_format for image_format in formats if _can_save(image_format)]
+    sizes = sorted(sizes, key=lambda size: size[0] * size[1], reverse=True)
+    written = []
+    with Image.open(path) as image:
+        if image.format == "JPEG":
+            draft_size = (max(w for w, _ in sizes), max(h for _, h in sizes))
+            if image.getexif().get(ExifTags.Base.Orientation) in ROTATED_ORIENTATIONS:
+                draft_size = draft_size[::-1]
+            image.draft("RGB", draft_size)
+        mode = "RGBA" if image.has_transparency_data else "RGB"
+        source = ImageOps.exif_transpose(image).convert(mode)
+
+    previous = source
+    for size in sizes:
+        if previous.width < size[0] or previous.height < size[1]:
+            previous = source
+        previous = _downscale(previous, size)
+        for image_format in formats:
+            rendition_path = path.with_name(
+                f"resized_{size[0]}_{size[1]}_{path.stem}.{image_format}"
+            )
+            previous.save(
+                rendition_path,
+                IMAGE_FORMATS[image_format],
+                **_save_options(image_format, quality),
+            )
+            written.append(rendition_path)
+    return written
+
+
+def _can_save(image_format: str) -> bool:
+    """
+    Checks that Pillow can encode the format, logging a warning otherwise.
+    """
+    Image.init()
+    if IMAGE_FORMATS[image_format] in Image.SAVE:
+        return True
+    logger.warning("Pillow cannot write image format", extra={"format": image_format})
+    return False
@@ -0,0 +1,181 @@
+"""
+SMTP Mailer.
+
+This module defines the `SMTPMailer` class, which keeps one SMTP connection per worker process
+and sends emails over it, so the TLS handshake and login are paid once per process rather than
+once per email. Confirmations queued for the worker are sent back to back over the same
+session.
+
+A connection that has been idle for longer than the idle timeout is closed before the next
+email, as servers drop idle clients. A reused connection that turns out to be closed by the
+server is reopened once. Failures which may succeed later are told apart from permanent
+ones by `is_transient`, so the tasks can retry them with `retry_countdown`.
+
+Attributes:
+    mailer (SMTPMailer): The mailer of the worker process.
+"""
+
+import os
+import random
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+from app.logger import logger
+from config import settings
+
+
+class SMTPMailer:
+    """
+    Sender of emails over a pooled SMTP connection of the worker process.
+
+    The connection is not shared with forked processes: a process that did not open it opens
+    its own. Sending is serialized by a lock, so the mailer can be used from a threaded pool.
+
+    Attributes:
+        host (str): The host of the SMTP server.
+        port (int): The port of the SMTP server.
+        user (str | None): The user to log in as, or None if the server needs no login.
+        password (str | None): The password of the user.
+        use_ssl (bool): Whether the connection is made over SSL.
+        timeout (float): The socket timeout of the connection, in seconds.
+        idle_timeout (float): How long an unused connection is kept, in seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str | None = None,
+        password: str | None = None,
+        use_ssl: bool = True,
+        timeout: float = 10,
+        idle_timeout: float = 60,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._connection: smtplib.SMTP | None = None
+        self._pid: int | None = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    def send(self, message: EmailMessage) -> None:
+        """
+        Sends the message over the pooled connection.
+
+        A rejected message leaves the connection open for the next ones; any other failure
+        closes it.
+
+        Args:
+            message (EmailMessage): The message to send.
+        """
+        with self._lock:
+            reused = self._drop_stale()
+            while True:
+                try:
+                    if self._connection is None:
+                        self._connect()
+                    self._connection.send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    self._close()
+                    if not reused:
+                        raise
+                    reused = False
+                    logger.info("Reconnecting to SMTP server closed by the server")
+                    continue
+                except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+                    raise
+                except OSError:
+                    self._close()
+                    raise
+                self._last_used = time.monotonic()
+                break
+
+    def close(self) -> None:
+        """
+        Closes the connection of the process, if any.
+        """
+        with self._lock:
+            self._close()
+
+    def _connect(self) -> None:
+        smtp_class = smtplib.SMTP_SSL if self.use_ssl else smtplib.SMTP
+        connection = smtp_class(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.user:
+                connection.login(self.user, self.password)
+        except BaseException:
+            connection.close()
+            raise
+        self._connection = connection
+        self._pid = os.getpid()
+        self._last_used = time.monotonic()
+
+    def _drop_stale(self) -> bool:
+        """
+        Drops a connection inherited from the parent process or idle for too long.
+
+        Returns:
+            bool: Whether an open connection is reused.
+        """
+        if self._connection is None:
+            return False
+        if self._pid != os.getpid():
+            self._connection = None
+            return False
+        if time.monotonic() - self._last_used > self.idle_timeout:
+            self._close()
+            return False
+        return True
+
+    def _close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None or self._pid != os.getpid():
+            return
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Checks whether sending failed for a reason that may go away, such as a dropped connection
+    or a 4xx reply, rather than a rejected login, sender or recipient.
+    """
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+def retry_countdown(retries: int) -> float:
+    """
+    Returns the delay before the next attempt, growing exponentially with jitter.
+
+    Args:
+        retries (int): The number of attempts already retried.
+    """
+    countdown = min(
+        settings.SMTP_RETRY_BACKOFF_SECONDS * 2**retries,
+        settings.SMTP_RETRY_BACKOFF_MAX_SECONDS,
+    )
+    return random.uniform(countdown / 2, countdown)
+
+
+mailer = SMTPMailer(
+    host=settings.SMTP_HOST,
+    port=settings.SMTP_PORT,
+    user=settings.SMTP_USER,
+    password=settings.SMTP_PASS,
+    use_ssl=settings.SMTP_SSL,
+    timeout=settings.SMTP_TIMEOUT_SECONDS,
+    idle_timeout=settings.SMTP_IDLE_TIMEOUT_SECONDS,
+)
@@ -2,54 +2,66 @@
 Background Tasks (Celery) for Image Processing and Email Sending.
 
 This module defines background tasks that are handled by Celery. It includes tasks for processing
-images (resizing them to different resolutions) and sending booking confirmation emails.
+images (writing their resized renditions) and sending booking confirmation emails.
 
 Tasks:
-    - proceed_picture: Resizes uploaded images to different sizes and stores them.
+    - proceed_picture: Writes the resized renditions of uploaded images.
     - send_bookings_confirmation_email: Sends a booking confirmation email to the user.
+    - send_bookings_batch_confirmation_email: Sends one confirmation email for a batch of
+     bookings.
+    - rebuild_room_occupancy: Rebuilds the daily room occupancy from the bookings.
+    - check_room_occupancy: Compares the daily room occupancy with the bookings.
 """
 
-import smtplib
+import asyncio
+from email.message import EmailMessage
 from pathlib import Path
 
-from PIL import Image
+from celery import Task
+from celery.signals import worker_process_shutdown
 from pydantic import EmailStr
 
+from app.database import engine
+from app.logger import logger
 from app.tasks.celery import celery
-from app.tasks.email_templates import create_bookings_confirmation_template
+from app.tasks.email_templates import (
+    create_bookings_batch_confirmation_template,
+    create_bookings_confirmation_template,
+)
+from app.tasks.image_renditions import create_renditions
+from app.tasks.mailer import is_transient, mailer, retry_countdown
 from config import settings
 
-MEDIUM_IMAGE_WIDTH = 1000
-MEDIUM_IMAGE_HEIGHT = 500
-
-SMALL_IMAGE_WIDTH = 200
-SMALL_IMAGE_HEIGHT = 100
-
 
 @celery.task
 def proceed_picture(
     path: str,
-):
+) -> list[str]:
     """
-    Resizes images to specified sizes and saves them.
+    Writes the resized renditions of an uploaded image.
 
-    This task takes an image path, opens the image, and creates resized versions of the image
-    with two different resolutions: 1000x500 and 200x100. The resized images are then saved
-    to the file system.
+    The image is decoded once and resized to every size of `IMAGE_RENDITIONS`, from the
+    largest to the smallest, and the renditions are written in `IMAGE_FORMATS` next to it
+    (see `create_renditions`).
 
     Args:
         path (str): The file path of the image to be processed.
+
+    Returns:
+        list[str]: The file paths of the renditions.
     """
-    im_path = Path(path)
-    im_to_proceed = Image.open(im_path)
-    im_resized_1000_500 = im_to_proceed.resize((MEDIUM_IMAGE_WIDTH, MEDIUM_IMAGE_HEIGHT))
-    im_resized_200_100 = im_to_proceed.resize((SMALL_IMAGE_WIDTH, SMALL_IMAGE_HEIGHT))
-    im_resized_1000_500.save(f"app/static/images/resized_1000_500_{im_path.name}")
-    im_resized_200_100.save(f"app/static/images/resized_200_100_{im_path.name}")
+    renditions = create_renditions(
+        Path(path),
+        sizes=settings.IMAGE_RENDITIONS,
+        formats=settings.IMAGE_FORMATS,
+        quality={"webp": settings.IMAGE_WEBP_QUALITY, "avif": settings.IMAGE_AVIF_QUALITY},
+    )
+    return [str(rendition) for rendition in renditions]
 
 
-@celery.task
+@celery.task(bind=True, max_retries=settings.SMTP_MAX_RETRIES)
 def send_bookings_confirmation_email(
+    self: Task,
     bookings: dict,
     email_to: EmailStr,
 ):
@@ -57,7 +69,9 @@ def send_bookings_confirmation_email(
     Sends a booking confirmation email.
 
     This task sends an email to the user with the details of their booking, using the
-    template generated by `create_bookings_confirmation_template`.
+    template generated by `create_bookings_confirmation_template`. The email is sent over the
+    pooled SMTP connection of the worker, and transient failures are retried with backoff
+    (see `app.tasks.mailer`).
 
     Args:
         bookings (dict): The booking information to be included in the confirmation email.
@@ -67,7 +81,82 @@ def send_bookings_confirmation_email(
         bookings=bookings,
         email_to=email_to,
     )
+    _send_email(self, msg_content)
+
+
+@celery.task(bind=True, max_retries=settings.SMTP_MAX_RETRIES)
+def send_bookings_batch_confirmation_email(
+    self: Task,
+    bookings: list[dict],
+    email_to: EmailStr,
+):
+    """
+    Sends one confirmation email for a batch of bookings.
+
+    Args:
+        bookings (list[dict]): The bookings to be included in the confirmation email.
+        email_to (EmailStr): The email address to send the confirmation to.
+    """
+    msg_content = create_bookings_batch_confirmation_template(
+        bookings=bookings,
+        email_to=email_to,
+    )
+    _send_email(self, msg_content)
+
+
+def _send_email(task: Task, message: EmailMessage) -> None:
+    """
+    Sends the email over the pooled connection of the worker, retrying the task with
+    exponential backoff if sending failed for a transient reason.
+    """
+    try:
+        mailer.send(message)
+    except OSError as error:
+        if not is_transient(error):
+            raise
+        logger.warning("Cannot send email, retrying", extra={"error": repr(error)})
+        raise task.retry(exc=error, countdown=retry_countdown(task.request.retries))
+
+
+@worker_process_shutdown.connect
+def _close_mailer(**kwargs) -> None:
+    mailer.close()
+
+
+async def _run_with_engine(coroutine):
+    """
+    Runs a database coroutine and closes the pooled connections of its event loop.
+
+    The DAOs are imported by the tasks using them: the booking package imports this module,
+    so importing them at the top would make the worker fail to import its tasks.
+    """
+    try:
+        return await coroutine
+    finally:
+        await engine.dispose()
+
+
+@celery.task
+def rebuild_room_occupancy():
+    """
+    Rebuilds the daily room occupancy from the bookings.
+    """
+    from app.booking.booking_dao import BookingDAO
+
+    asyncio.run(_run_with_engine(BookingDAO.rebuild_occupancy()))
+
+
+@celery.task
+def check_room_occupancy() -> int:
+    """
+    Compares the daily room occupancy with the bookings and logs the mismatching days.
+
+    Returns:
+        int: The number of mismatching days.
+    """
+    from app.booking.booking_dao import BookingDAO
 
-    with smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-        server.login(settings.SMTP_USER, settings.SMTP_PASS)
-        server.send_message(msg_content)
+    mismatches = asyncio.run(_run_with_engine(BookingDAO.check_occupancy()))
+    for mismatch in mismatches:
+        logger.warning("Room occupancy does not match bookings", extra=mismatch)
+    return len(mismatches)
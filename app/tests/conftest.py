@@ -7,7 +7,7 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy import insert
 
-from app.app_components.redis_cache import init_cache
+from app.booking.booking_dao import BookingDAO
 from app.booking.booking_models import Bookings
 from app.database import Base, async_session_maker, engine, init_models
 from app.hotels.hotel_models import Hotels
@@ -61,6 +61,8 @@ async def prepare_database():
 
         await session.commit()
 
+    await BookingDAO.rebuild_occupancy()
+
 
 @pytest.fixture(scope="session")
 def event_loop(request):
@@ -100,11 +102,6 @@ async def authenticated_ac():
         yield ac
 
 
-@pytest.fixture(scope="session", autouse=True)
-async def init_redis():
-    init_cache()
-
-
 @pytest.fixture(autouse=True)
 def disable_logging():
     original_level = logging.getLogger().level
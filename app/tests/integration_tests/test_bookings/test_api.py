@@ -1,6 +1,10 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 
+from app.database import READ_PRIMARY_COOKIE
+
 
 @pytest.mark.parametrize(
     "room_id, date_from, date_to, status_code, bookings_quantity",
@@ -28,6 +32,8 @@ async def test_get_add_and_get_bookings(
         },
     )
     assert response_new_booking.status_code == status_code
+    if status_code == 200:
+        assert READ_PRIMARY_COOKIE in response_new_booking.cookies
 
     response_user_bookings = await authenticated_ac.get("/v1/bookings")
 
@@ -62,6 +68,31 @@ async def test_get_hotels_by_location_and_time(
     assert response.status_code == status_code
 
 
+@pytest.mark.parametrize(
+    "location, hotels_quantity",
+    [
+        ("Республика Коми", 2),
+        ("республика КОМИ", 2),
+        ("сыктывкар", 2),
+        ("поселок", 2),
+        ("ПОСЁЛОК", 2),
+        ("Ком_", 0),
+    ],
+)
+async def test_search_hotels_ignores_case_and_diacritics(
+    location,
+    hotels_quantity,
+    ac: AsyncClient,
+):
+    response = await ac.get(
+        f"/v1/hotels/{location}",
+        params={"date_from": "2023-05-03", "date_to": "2023-05-05"},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()) == hotels_quantity
+
+
 async def test_get_and_delete_booking(authenticated_ac: AsyncClient):
 
     response_get = await authenticated_ac.get("/v1/bookings")
@@ -91,3 +122,108 @@ async def test_get_and_delete_booking(authenticated_ac: AsyncClient):
     response_get3 = await authenticated_ac.get("/v1/bookings")
     assert response_get3.status_code == 200
     assert len(response_get3.json()) == len(response_get.json())
+
+
+@pytest.mark.parametrize(
+    "items, all_or_nothing, status_code, booked, rejected",
+    [
+        ([(2, "2024-02-01", "2024-02-05")] * 3, True, 200, 3, 0),
+        ([(4, "2024-02-01", "2024-02-05")] * 9, True, 409, 0, 0),
+        ([(4, "2024-02-01", "2024-02-05")] * 9, False, 200, 8, 1),
+        ([(4, "2024-02-01", "2024-02-05")], False, 409, 0, 0),
+    ],
+)
+async def test_add_bookings_batch(
+    items,
+    all_or_nothing,
+    status_code,
+    booked,
+    rejected,
+    authenticated_ac: AsyncClient,
+):
+    response = await authenticated_ac.post(
+        "/v1/bookings/batch",
+        json={
+            "items": [
+                {"room_id": room_id, "date_from": date_from, "date_to": date_to}
+                for room_id, date_from, date_to in items
+            ],
+            "all_or_nothing": all_or_nothing,
+        },
+    )
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert len(response.json()["booked"]) == booked
+        assert len(response.json()["rejected"]) == rejected
+
+
+async def test_booking_invalidates_cached_hotel_search(authenticated_ac: AsyncClient):
+    search_params = {"date_from": "2025-06-01", "date_to": "2025-06-05"}
+
+    response_before = await authenticated_ac.get("/v1/hotels/Урлу-Аспак", params=search_params)
+    assert response_before.status_code == 200
+    rooms_left = response_before.json()[0]["rooms_left"]
+
+    response_add = await authenticated_ac.post(
+        "/v1/bookings", params={"room_id": 1, **search_params}
+    )
+    assert response_add.status_code == 200
+
+    response_after = await authenticated_ac.get("/v1/hotels/Урлу-Аспак", params=search_params)
+    assert response_after.status_code == 200
+    assert response_after.json()[0]["rooms_left"] == rooms_left - 1
+
+
+async def test_booking_invalidates_cached_hotel_rooms(authenticated_ac: AsyncClient):
+    search_params = {"date_from": "2025-07-01", "date_to": "2025-07-04"}
+
+    response_before = await authenticated_ac.get("/v1/hotels/1/rooms", params=search_params)
+    assert response_before.status_code == 200
+    rooms_before = {room["id"]: room for room in response_before.json()}
+    assert rooms_before[1]["total_cost"] == 3 * rooms_before[1]["price"]
+
+    response_add = await authenticated_ac.post(
+        "/v1/bookings", params={"room_id": 1, **search_params}
+    )
+    assert response_add.status_code == 200
+
+    response_after = await authenticated_ac.get("/v1/hotels/1/rooms", params=search_params)
+    rooms_after = {room["id"]: room for room in response_after.json()}
+    assert rooms_after[1]["rooms_left"] == rooms_before[1]["rooms_left"] - 1
+    assert rooms_after[2]["rooms_left"] == rooms_before[2]["rooms_left"]
+
+
+async def test_get_bookings_by_pages(authenticated_ac: AsyncClient):
+    response_all = await authenticated_ac.get("/v1/bookings", params={"limit": 500})
+    assert response_all.status_code == 200
+    assert "x-next-cursor" not in response_all.headers
+
+    bookings, cursor = [], None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response_page = await authenticated_ac.get("/v1/bookings", params=params)
+        assert response_page.status_code == 200
+        assert len(response_page.json()) <= 2
+        bookings.extend(response_page.json())
+        cursor = response_page.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert bookings == response_all.json()
+    assert bookings == sorted(bookings, key=lambda booking: (booking["date_from"], booking["id"]))
+
+
+async def test_stream_bookings(authenticated_ac: AsyncClient):
+    response_all = await authenticated_ac.get("/v1/bookings", params={"limit": 500})
+
+    response_stream = await authenticated_ac.get("/v1/bookings", params={"stream": True})
+    assert response_stream.status_code == 200
+    assert response_stream.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response_stream.text.splitlines()] == (
+        response_all.json()
+    )
+
+
+async def test_get_bookings_with_incorrect_cursor(authenticated_ac: AsyncClient):
+    response = await authenticated_ac.get("/v1/bookings", params={"cursor": "incorrect"})
+    assert response.status_code == 400
@@ -1,6 +1,14 @@
-from datetime import datetime
+import asyncio
+from datetime import date, datetime, timedelta
 
-from app.booking.booking_dao import BookingDAO
+from sqlalchemy import delete, func, insert, update
+
+from app.booking.booking_dao import CONFIRMATION_TASK, BookingDAO
+from app.booking.booking_models import RoomDailyOccupancy
+from app.hotels.rooms.room_dao import RoomsDAO
+from app.outbox.outbox_dao import OutboxDAO
+from app.outbox.outbox_models import OutboxMessages
+from app.tasks.celery import celery
 
 
 async def test_add_and_get_booking():
@@ -17,3 +25,108 @@ async def test_add_and_get_booking():
     booking = await BookingDAO.find_by_id(booking.id)
 
     assert booking is not None
+
+
+async def test_concurrent_add_does_not_overbook():
+    bookings = await asyncio.gather(
+        *[
+            BookingDAO.add(
+                user_id=1,
+                room_id=1,
+                date_from=date(2025, 3, 1),
+                date_to=date(2025, 3, 3),
+            )
+            for _ in range(8)
+        ]
+    )
+
+    room = await RoomsDAO.find_by_id(1)
+    assert len([booking for booking in bookings if booking]) == room.quantity
+
+
+async def test_occupancy_follows_bookings():
+    booking = await BookingDAO.add(
+        user_id=2,
+        room_id=3,
+        date_from=date(2025, 8, 1),
+        date_to=date(2025, 8, 3),
+    )
+    assert await BookingDAO.check_occupancy() == []
+
+    await BookingDAO.update(booking.id, room_id=4, date_to=date(2025, 8, 5))
+    assert await BookingDAO.check_occupancy() == []
+
+    await BookingDAO.delete(id=booking.id)
+    assert await BookingDAO.check_occupancy() == []
+
+
+async def test_rebuild_occupancy_repairs_drift(async_session):
+    await async_session.execute(delete(RoomDailyOccupancy))
+    await async_session.commit()
+    assert await BookingDAO.check_occupancy()
+
+    await BookingDAO.rebuild_occupancy()
+    assert await BookingDAO.check_occupancy() == []
+
+
+async def test_confirmation_is_published_from_outbox(monkeypatch):
+    def broker_down(task, kwargs):
+        raise ConnectionError
+
+    published = []
+    booking = await BookingDAO.add(
+        user_id=1,
+        room_id=2,
+        date_from=date(2025, 9, 1),
+        date_to=date(2025, 9, 3),
+        confirm_to="firstuser@user.ru",
+    )
+
+    monkeypatch.setattr(celery, "send_task", broker_down)
+    assert await OutboxDAO.dispatch(batch_size=100) == 0
+
+    monkeypatch.setattr(celery, "send_task", lambda task, kwargs: published.append((task, kwargs)))
+    while await OutboxDAO.dispatch(batch_size=100):
+        pass
+    assert (
+        CONFIRMATION_TASK,
+        {
+            "bookings": {
+                "id": booking.id,
+                "room_id": 2,
+                "user_id": 1,
+                "date_from": "2025-09-01",
+                "date_to": "2025-09-03",
+                "price": booking.price,
+                "total_cost": booking.total_cost,
+                "total_days": 2,
+            },
+            "email_to": "firstuser@user.ru",
+        },
+    ) in published
+
+
+async def test_claimed_outbox_message_waits_for_its_lease(async_session, monkeypatch):
+    published = []
+    monkeypatch.setattr(celery, "send_task", lambda task, kwargs: published.append(task))
+    await async_session.execute(
+        insert(OutboxMessages).values(
+            task="leased", kwargs={}, claimed_until=func.now() + timedelta(minutes=1)
+        )
+    )
+    await async_session.commit()
+
+    while await OutboxDAO.dispatch(batch_size=100):
+        pass
+    assert "leased" not in published
+
+    await async_session.execute(
+        update(OutboxMessages)
+        .where(OutboxMessages.task == "leased")
+        .values(claimed_until=func.now() - timedelta(minutes=1))
+    )
+    await async_session.commit()
+
+    while await OutboxDAO.dispatch(batch_size=100):
+        pass
+    assert "leased" in published
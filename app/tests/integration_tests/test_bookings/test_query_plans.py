@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.booking.booking_dao import BookingDAO
+from app.database import engine
+from app.hotels.hotel_dao import HotelsDAO
+from app.hotels.rooms.room_dao import RoomsDAO
+
+
+@pytest.fixture
+def executed_statements():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if context.compiled is not None and (
+            "bookings" in statement or "room_daily_occupancy" in statement
+        ):
+            statements.append(context.compiled.statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def explain(statements) -> list[str]:
+    plans = []
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        for statement in statements:
+            sql = statement.compile(
+                dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+            )
+            result = await connection.exec_driver_sql(f"EXPLAIN {sql}")
+            plans.append("\n".join(row[0] for row in result))
+    return plans
+
+
+async def test_booking_availability_uses_daily_occupancy_index(executed_statements):
+    await BookingDAO.add(
+        user_id=1,
+        room_id=2,
+        date_from=date(2025, 5, 1),
+        date_to=date(2025, 5, 5),
+    )
+
+    plans = await explain(list(executed_statements))
+    occupancy_plans = [plan for plan in plans if "room_daily_occupancy" in plan]
+    assert occupancy_plans
+    for plan in occupancy_plans:
+        assert "room_daily_occupancy_pkey" in plan
+    for plan in plans:
+        assert "Seq Scan on bookings" not in plan
+        assert "Seq Scan on room_daily_occupancy" not in plan
+
+
+async def test_room_listing_uses_indexes(executed_statements):
+    await RoomsDAO.find_hotel_rooms(hotel_id=1)
+    await RoomsDAO.count_booked_rooms(
+        hotel_id=1, date_from=date(2025, 5, 1), date_to=date(2025, 5, 5)
+    )
+
+    plans = await explain(list(executed_statements))
+    assert any("room_daily_occupancy_pkey" in plan for plan in plans)
+    for plan in plans:
+        assert "Seq Scan on bookings" not in plan
+        assert "Seq Scan on room_daily_occupancy" not in plan
+        assert "Seq Scan on rooms" not in plan
+
+
+async def test_hotel_search_uses_indexes(executed_statements):
+    await HotelsDAO.find_all_in_location_with_rooms_left(
+        location="Коми", date_from=date(2025, 5, 1), date_to=date(2025, 5, 5)
+    )
+
+    plans = await explain(list(executed_statements))
+    assert plans
+    for plan in plans:
+        assert "Seq Scan on bookings" not in plan
+        assert "Seq Scan on room_daily_occupancy" not in plan
+        assert "Seq Scan on rooms" not in plan
+        assert "Seq Scan on hotels" not in plan
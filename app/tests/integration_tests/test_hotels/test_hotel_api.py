@@ -0,0 +1,26 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.parametrize("sort", ["price", "rooms_left", "name"])
+async def test_search_hotels_by_pages(sort, ac: AsyncClient):
+    search_params = {"date_from": "2023-05-03", "date_to": "2023-05-05", "sort": sort}
+
+    response_all = await ac.get("/v1/hotels/Республика Коми", params=search_params)
+    assert response_all.status_code == 200
+    assert int(response_all.headers["x-total-count"]) == len(response_all.json())
+
+    hotels, cursor = [], None
+    while True:
+        params = {**search_params, "limit": 1}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response_page = await ac.get("/v1/hotels/Республика Коми", params=params)
+        assert response_page.status_code == 200
+        assert len(response_page.json()) == 1
+        hotels.extend(response_page.json())
+        cursor = response_page.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert hotels == response_all.json()
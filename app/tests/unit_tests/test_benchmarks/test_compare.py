@@ -0,0 +1,39 @@
+from app.benchmarks.compare import compare
+from app.benchmarks.load import percentile
+
+
+def report(throughput, p95, errors=0):
+    return {
+        "endpoints": {
+            "search": {
+                "requests": 1000,
+                "errors": errors,
+                "throughput_rps": throughput,
+                "p50_ms": 10.0,
+                "p95_ms": p95,
+                "p99_ms": 50.0,
+            }
+        }
+    }
+
+
+def test_percentile():
+    latencies = [index / 1000 for index in range(1, 101)]
+
+    assert percentile(latencies, 50) == 50.0
+    assert percentile(latencies, 95) == 95.0
+    assert percentile(latencies, 99) == 99.0
+    assert percentile([], 99) is None
+
+
+def test_compare_within_tolerance():
+    changes, regressions = compare(report(100, 20.0), report(95, 21.0), tolerance=0.1)
+
+    assert changes["search"]["throughput_rps"] == -0.05
+    assert regressions == []
+
+
+def test_compare_detects_regressions():
+    _, regressions = compare(report(100, 20.0), report(80, 30.0, errors=50), tolerance=0.1)
+
+    assert len(regressions) == 3
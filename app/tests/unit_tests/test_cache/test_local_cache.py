@@ -0,0 +1,47 @@
+from app.cache import LocalCache, apply_invalidation, invalidation_message
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LocalCache("test-lru", max_size=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_expired_entry_is_not_returned():
+    cache = LocalCache("test-ttl", max_size=10, ttl=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_entries_are_invalidated_by_tag():
+    cache = LocalCache("test-tags", max_size=10, ttl=30)
+    cache.set("search-1", [1, 2], tags=[1, 2])
+    cache.set("search-2", [2, 3], tags=[2, 3])
+    cache.set("search-3", [3], tags=[3])
+
+    cache.invalidate_tags([1])
+
+    assert cache.get("search-1") is None
+    assert cache.get("search-2") == [2, 3]
+    assert cache.get("search-3") == [3]
+
+
+def test_published_invalidation_is_applied_to_named_cache():
+    cache = LocalCache("test-channel", max_size=10, ttl=30)
+    cache.set("search-1", [1], tags=[1])
+    cache.set("search-2", [2], tags=[2])
+    cache.set("response", b"{}")
+
+    apply_invalidation(invalidation_message("test-channel", keys=["response"], tags=[2]))
+
+    assert cache.get("search-1") == [1]
+    assert cache.get("search-2") is None
+    assert cache.get("response") is None
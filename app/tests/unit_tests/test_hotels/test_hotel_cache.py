@@ -0,0 +1,42 @@
+import asyncio
+import uuid
+from datetime import date
+
+from app.hotels.hotel_cache import HotelSearchCache, hotel_search_cache
+
+
+async def test_concurrent_misses_run_search_once():
+    cache = HotelSearchCache(redis=hotel_search_cache.redis, ttl=30)
+    calls = 0
+
+    async def search():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return [{"id": 1, "rooms_left": 3}]
+
+    location = uuid.uuid4().hex
+    period = (date(2030, 1, 1), date(2030, 1, 2))
+    results = await asyncio.gather(*[cache.fetch(location, *period, search) for _ in range(5)])
+
+    assert calls == 1
+    assert all(hotels == [{"id": 1, "rooms_left": 3}] for hotels in results)
+
+
+async def test_changed_hotel_is_searched_again():
+    cache = HotelSearchCache(redis=hotel_search_cache.redis, ttl=30)
+    calls = 0
+
+    async def search():
+        nonlocal calls
+        calls += 1
+        return [{"id": 1, "rooms_left": 3 - calls}]
+
+    location = uuid.uuid4().hex
+    period = (date(2030, 2, 1), date(2030, 2, 2))
+    assert (await cache.fetch(location, *period, search))[0]["rooms_left"] == 2
+    assert (await cache.fetch(location, *period, search))[0]["rooms_left"] == 2
+
+    await cache.invalidate_hotels([1])
+
+    assert (await cache.fetch(location, *period, search))[0]["rooms_left"] == 1
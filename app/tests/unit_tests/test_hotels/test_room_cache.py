@@ -0,0 +1,25 @@
+import random
+
+from app.cache import LocalCache
+from app.hotels.rooms.room_cache import RoomCache, room_cache
+
+
+async def test_rooms_read_before_invalidation_are_not_cached():
+    cache = RoomCache(
+        redis=room_cache.redis,
+        ttl=30,
+        rooms_ttl=30,
+        local=LocalCache("test-rooms", max_size=10, ttl=30),
+    )
+    hotel_id = random.randint(10**6, 10**9)
+
+    version = await cache.rooms_version(hotel_id)
+    await cache.invalidate_rooms([hotel_id])
+    await cache.set_rooms(hotel_id, [{"id": 1, "price": 100}], version)
+
+    assert await cache.get_rooms(hotel_id) is None
+
+    version = await cache.rooms_version(hotel_id)
+    await cache.set_rooms(hotel_id, [{"id": 1, "price": 200}], version)
+
+    assert await cache.get_rooms(hotel_id) == [{"id": 1, "price": 200}]
@@ -0,0 +1,39 @@
+from PIL import ExifTags, Image
+
+from app.tasks import image_renditions
+from app.tasks.image_renditions import create_renditions
+
+
+def test_renditions_are_written_as_webp_of_every_size(tmp_path):
+    path = tmp_path / "1.webp"
+    Image.new("RGB", (1600, 1200), "teal").save(path, "JPEG")
+
+    renditions = create_renditions(
+        path, sizes=[(200, 100), (1000, 500)], formats=["webp"], quality={"webp": 80}
+    )
+
+    assert [rendition.name for rendition in renditions] == [
+        "resized_1000_500_1.webp",
+        "resized_200_100_1.webp",
+    ]
+    for rendition, size in zip(renditions, [(1000, 500), (200, 100)]):
+        with Image.open(rendition) as image:
+            assert (image.format, image.size) == ("WEBP", size)
+
+
+def test_rotated_jpeg_is_not_upscaled(tmp_path, monkeypatch):
+    path = tmp_path / "1.webp"
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = 6
+    Image.new("RGB", (4000, 2000), "teal").save(path, "JPEG", exif=exif)
+    downscaled = []
+    downscale = image_renditions._downscale
+
+    def record_downscale(image, size):
+        downscaled.append(image.size)
+        return downscale(image, size)
+
+    monkeypatch.setattr(image_renditions, "_downscale", record_downscale)
+    create_renditions(path, sizes=[(1000, 250)], formats=["webp"], quality={"webp": 80})
+
+    assert downscaled[0][0] >= 1000 and downscaled[0][1] >= 250
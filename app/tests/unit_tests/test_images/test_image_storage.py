@@ -0,0 +1,51 @@
+import hashlib
+
+import pytest
+
+from app.exceptions import ImageTooLargeException
+from app.images import image_storage
+
+
+async def chunks_of(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def images_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_storage, "IMAGES_DIRECTORY", tmp_path)
+    return tmp_path
+
+
+async def test_same_image_is_not_changed_again(images_directory):
+    first = await image_storage.store_image(chunks_of(b"ab", b"cd"), 1, max_bytes=10)
+    await image_storage.remember_image(1, first[0])
+    second = await image_storage.store_image(chunks_of(b"abcd"), 1, max_bytes=10)
+
+    assert first == (hashlib.sha256(b"abcd").hexdigest(), True)
+    assert second == (first[0], False)
+    assert (images_directory / "1.webp").read_bytes() == b"abcd"
+    assert sorted(path.name for path in images_directory.iterdir()) == [
+        "1.webp",
+        "1.webp.sha256",
+    ]
+
+
+async def test_too_large_image_keeps_previous_image(images_directory):
+    await image_storage.store_image(chunks_of(b"abcd"), 1, max_bytes=10)
+
+    with pytest.raises(ImageTooLargeException):
+        await image_storage.store_image(chunks_of(b"0123456789", b"a"), 1, max_bytes=10)
+
+    assert (images_directory / "1.webp").read_bytes() == b"abcd"
+    assert not list(images_directory.glob("*.part"))
+
+
+async def test_image_is_changed_until_remembered(images_directory):
+    await image_storage.store_image(chunks_of(b"abcd"), 1, max_bytes=10)
+    await image_storage.remember_image(1, hashlib.sha256(b"abcd").hexdigest())
+    await image_storage.store_image(chunks_of(b"efgh"), 1, max_bytes=10)
+
+    for chunks in (b"efgh", b"abcd"):
+        _, changed = await image_storage.store_image(chunks_of(chunks), 1, max_bytes=10)
+        assert changed
@@ -0,0 +1,20 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.images import images_router
+from config import settings
+
+
+def test_oversized_form_is_rejected_before_it_is_parsed(monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_UPLOAD_MAX_BYTES", 10)
+    app = FastAPI()
+    app.include_router(images_router.router)
+
+    response = TestClient(app).post(
+        "/images/hotels",
+        params={"name": 1},
+        content=b"-" * (images_router.FORM_OVERHEAD_BYTES + 11),
+        headers={"content-type": "multipart/form-data; boundary=upload"},
+    )
+
+    assert response.status_code == 413
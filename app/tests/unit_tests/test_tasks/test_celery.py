@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.tasks.celery import QUEUES, celery, configure_worker
+
+
+@pytest.mark.parametrize(
+    "task, queue",
+    [
+        ("app.tasks.tasks.send_bookings_confirmation_email", "emails"),
+        ("app.tasks.tasks.send_bookings_batch_confirmation_email", "emails"),
+        ("app.tasks.tasks.proceed_picture", "images"),
+        ("app.tasks.tasks.rebuild_room_occupancy", "default"),
+    ],
+)
+def test_tasks_are_routed_to_their_queues(task, queue):
+    assert celery.amqp.router.route({}, task)["queue"].name == queue
+
+
+@pytest.mark.parametrize(
+    "queues, queue",
+    [(["images"], "images"), ("emails,default", "emails"), (None, "default")],
+)
+def test_worker_takes_settings_of_its_first_queue(queues, queue):
+    conf = SimpleNamespace()
+
+    configure_worker(conf=conf, options={"queues": queues})
+
+    assert conf.worker_concurrency == QUEUES[queue]["concurrency"]
+    assert conf.worker_prefetch_multiplier == QUEUES[queue]["prefetch_multiplier"]
+
+
+def test_occupancy_check_is_scheduled():
+    schedule = celery.conf.beat_schedule["check-room-occupancy"]
+
+    assert schedule["task"] == "app.tasks.tasks.check_room_occupancy"
@@ -0,0 +1,100 @@
+import smtplib
+import socket
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.tasks.mailer import SMTPMailer, is_transient
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.sessions = 0
+        self.recipients = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        self.sessions += 1
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port = free_socket.getsockname()[1]
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, controller
+    controller.stop()
+
+
+def message(email_to: str) -> EmailMessage:
+    email = EmailMessage()
+    email["Subject"] = "Подтверждение бронирования"
+    email["From"] = "booking@test.ru"
+    email["To"] = email_to
+    email.set_content("Вы забронировали отель")
+    return email
+
+
+def mailer_for(controller: Controller) -> SMTPMailer:
+    return SMTPMailer(controller.hostname, controller.port, use_ssl=False)
+
+
+def test_emails_share_one_session(smtp_server):
+    handler, controller = smtp_server
+    mailer = mailer_for(controller)
+
+    mailer.send(message("a@test.ru"))
+    mailer.send(message("b@test.ru"))
+    mailer.send(message("c@test.ru"))
+    mailer.close()
+
+    assert handler.recipients == ["a@test.ru", "b@test.ru", "c@test.ru"]
+    assert handler.sessions == 1
+
+
+def test_connection_closed_by_server_is_reopened(smtp_server):
+    handler, controller = smtp_server
+    mailer = mailer_for(controller)
+    mailer.send(message("a@test.ru"))
+
+    mailer._connection.sock.shutdown(socket.SHUT_RDWR)
+    mailer.send(message("b@test.ru"))
+    mailer.close()
+
+    assert handler.recipients == ["a@test.ru", "b@test.ru"]
+    assert handler.sessions == 2
+
+
+def test_idle_connection_is_reopened(smtp_server):
+    handler, controller = smtp_server
+    mailer = mailer_for(controller)
+    mailer.idle_timeout = 0
+
+    mailer.send(message("a@test.ru"))
+    mailer.send(message("b@test.ru"))
+    mailer.close()
+
+    assert handler.sessions == 2
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (smtplib.SMTPServerDisconnected(), True),
+        (ConnectionRefusedError(), True),
+        (smtplib.SMTPResponseException(421, b"try again later"), True),
+        (smtplib.SMTPAuthenticationError(535, b"bad credentials"), False),
+        (smtplib.SMTPRecipientsRefused({"a@test.ru": (550, b"no such user")}), False),
+    ],
+)
+def test_transient_errors(error, transient):
+    assert is_transient(error) is transient
@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+from app.exceptions import TooManyRequestsException
+from app.users import auth
+from app.users.auth import get_password_hash, verify_password
+
+
+async def test_hash_and_verify_password():
+    hashed_password = await get_password_hash("firstuser")
+
+    assert await verify_password("firstuser", hashed_password)
+    assert not await verify_password("firstuser2", hashed_password)
+
+
+async def test_saturated_pool_rejects_requests(monkeypatch):
+    monkeypatch.setattr(auth, "password_slots", asyncio.Semaphore(0))
+
+    with pytest.raises(TooManyRequestsException):
+        await get_password_hash("firstuser")
@@ -0,0 +1,54 @@
+from app.cache import LocalCache, apply_invalidation, invalidation_message
+from app.users.user_cache import UserCache, user_cache
+from app.users.user_schemas import UsersSchema
+
+
+def make_cache(name: str, max_size: int = 10, ttl: int = 30) -> UserCache:
+    return UserCache(
+        redis=user_cache.redis,
+        ttl=ttl,
+        local=LocalCache(name, max_size=max_size, ttl=ttl),
+    )
+
+
+async def test_get_set_and_invalidate():
+    cache = make_cache("test-users")
+    user = UsersSchema(id=1, email="firstuser@user.ru")
+
+    assert await cache.get(1) is None
+    await cache.set(user)
+    assert await cache.get(1) == user
+
+    await cache.invalidate(1)
+    assert await cache.get(1) is None
+
+
+async def test_least_recently_used_user_is_evicted():
+    cache = make_cache("test-users-lru", max_size=2)
+    for user_id in (1, 2):
+        await cache.set(UsersSchema(id=user_id, email=f"user{user_id}@user.ru"))
+
+    await cache.get(1)
+    await cache.set(UsersSchema(id=3, email="user3@user.ru"))
+
+    assert await cache.get(1) is not None
+    assert await cache.get(2) is None
+    assert await cache.get(3) is not None
+
+
+async def test_expired_user_is_not_returned():
+    cache = make_cache("test-users-ttl", ttl=0)
+    await cache.set(UsersSchema(id=1, email="firstuser@user.ru"))
+
+    assert await cache.get(1) is None
+
+
+async def test_user_invalidated_by_another_worker_is_dropped():
+    cache = make_cache("test-users-channel")
+    await cache.set(UsersSchema(id=1, email="firstuser@user.ru"))
+    await cache.set(UsersSchema(id=2, email="user2@user.ru"))
+
+    apply_invalidation(invalidation_message("test-users-channel", tags=[1]))
+
+    assert await cache.get(1) is None
+    assert await cache.get(2) is not None
@@ -10,6 +10,7 @@ Modules:
      user authentication.
     - dao: Contains the `UsersDAO` class for interacting with the database to retrieve and store
      user data.
+    - cache: Contains the `UserCache` class that caches authenticated users.
     - dependencies: Provides dependencies for extracting and verifying JWT tokens,
      and retrieving the current authenticated user.
     - models: Contains the `Users` model for interacting with user data in the database.
@@ -18,19 +19,24 @@ Modules:
 """
 
 from .auth import authenticate_user, create_access_token, get_password_hash
+from .user_cache import UserCache, user_cache
 from .user_dao import UsersDAO
-from .user_dependencies import get_current_user
+from .user_dependencies import get_current_user, get_current_user_from_claims
 from .user_models import Users
 from .user_router import router
-from .user_schemas import UsersAuthSchema
+from .user_schemas import UsersAuthSchema, UsersSchema
 
 __all__ = [
     "authenticate_user",
     "create_access_token",
     "get_password_hash",
+    "UserCache",
+    "user_cache",
     "UsersDAO",
     "get_current_user",
+    "get_current_user_from_claims",
     "Users",
     "router",
     "UsersAuthSchema",
+    "UsersSchema",
 ]
@@ -4,19 +4,27 @@ Authentication Utilities.
 This module provides utility functions for user authentication, including the creation of
 access tokens, password hashing and verification, and user authentication.
 
+Password hashing and verification run bcrypt in a bounded thread pool, so they do not block
+the event loop. When all threads are busy and the waiting queue is full, new operations are
+rejected with `TooManyRequestsException` (HTTP 429).
+
 Functions:
     - create_access_token: Generates a JWT access token for a user.
+    - run_in_password_executor: Runs a blocking password operation in the bounded thread pool.
     - get_password_hash: Hashes a plain-text password using bcrypt.
     - verify_password: Verifies if a plain-text password matches the hashed password.
     - authenticate_user: Authenticates a user based on email and password.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from jose import jwt
 from passlib.context import CryptContext
 from pydantic import EmailStr
 
+from app.exceptions import TooManyRequestsException
 from app.users.user_dao import UsersDAO
 from config import settings
 
@@ -40,8 +48,37 @@ def create_access_token(data: dict) -> str:
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+password_slots = asyncio.Semaphore(
+    settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE
+)
+
+
+async def run_in_password_executor(func, *args):
+    """
+    Runs a blocking password operation in the password thread pool.
+
+    Args:
+        func: The blocking function to run.
+        args: The positional arguments of the function.
+
+    Returns:
+        The result of the function.
+
+    Raises:
+        TooManyRequestsException: If the pool and its waiting queue are full.
+    """
+    if password_slots.locked():
+        raise TooManyRequestsException
+    async with password_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_executor, func, *args)
+
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """
     Hashes a plain-text password using bcrypt.
 
@@ -51,10 +88,10 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: The hashed password.
     """
-    return pwd_context.hash(password)
+    return await run_in_password_executor(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies if a plain-text password matches the hashed password.
 
@@ -65,7 +102,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the passwords match, otherwise False.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await run_in_password_executor(pwd_context.verify, plain_password, hashed_password)
 
 
 async def authenticate_user(email: EmailStr, password: str):
@@ -80,5 +117,5 @@ async def authenticate_user(email: EmailStr, password: str):
         user: The authenticated user object if successful, otherwise None.
     """
     user = await UsersDAO.find_one_or_none(email=email)
-    if user and verify_password(password, hashed_password=user.hashed_password):
+    if user and await verify_password(password, user.hashed_password):
         return user
@@ -0,0 +1,123 @@
+"""
+User Cache.
+
+This module defines the `UserCache` class, a short-lived cache of authenticated users. It keeps
+recently seen users in a local cache of the worker and can optionally share them between
+workers through Redis, so most authenticated requests do not query the database to resolve
+their user. Changed users are dropped from the local caches of all workers through the
+invalidation channel (see `app.cache`).
+
+Attributes:
+    user_cache (UserCache): The user cache shared by the application.
+"""
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.cache import (
+    CACHE_REQUESTS,
+    INVALIDATION_CHANNEL,
+    LocalCache,
+    invalidation_message,
+)
+from app.logger import logger
+from app.users.user_schemas import UsersSchema
+from config import settings
+
+
+class UserCache:
+    """
+    Two-tier cache of users keyed by user ID.
+
+    Entries of the local cache are tagged with the ID of their user. When `shared` is set,
+    users are also stored in Redis with the same TTL. Redis errors are logged and treated as
+    cache misses.
+
+    Attributes:
+        redis (Redis): The Redis client storing shared users and publishing invalidations.
+        ttl (int): The lifetime of an entry in Redis in seconds.
+        local (LocalCache): The local cache of users.
+        shared (bool): Whether users are stored in Redis as well.
+    """
+
+    def __init__(self, redis: aioredis.Redis, ttl: int, local: LocalCache, shared: bool = False):
+        self.redis = redis
+        self.ttl = ttl
+        self.local = local
+        self.shared = shared
+
+    async def get(self, user_id: int) -> UsersSchema | None:
+        """
+        Returns the cached user, or None if it is not cached or has expired.
+
+        Args:
+            user_id (int): The ID of the user.
+        """
+        user = self.local.get(str(user_id))
+        if user is not None or not self.shared:
+            return user
+        try:
+            cached = await self.redis.get(self._key(user_id))
+        except RedisError:
+            logger.warning("Cannot read user from Redis cache", exc_info=True)
+            return None
+        CACHE_REQUESTS.labels("users", "redis", "miss" if cached is None else "hit").inc()
+        if cached is None:
+            return None
+        user = UsersSchema.model_validate_json(cached)
+        self.local.set(str(user_id), user, tags=[user_id])
+        return user
+
+    async def set(self, user: UsersSchema) -> None:
+        """
+        Caches the user in every tier.
+
+        Args:
+            user (UsersSchema): The user to cache.
+        """
+        self.local.set(str(user.id), user, tags=[user.id])
+        if not self.shared:
+            return
+        try:
+            await self.redis.set(self._key(user.id), user.model_dump_json(), ex=self.ttl)
+        except RedisError:
+            logger.warning("Cannot write user to Redis cache", exc_info=True)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drops the user from Redis and from the local caches of all workers.
+
+        Args:
+            user_id (int): The ID of the user.
+        """
+        self.local.invalidate_tags([user_id])
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                if self.shared:
+                    pipe.delete(self._key(user_id))
+                pipe.publish(
+                    INVALIDATION_CHANNEL, invalidation_message(self.local.name, tags=[user_id])
+                )
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Cannot invalidate user cache", exc_info=True)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"/cache/user:{user_id}"
+
+
+user_cache = UserCache(
+    redis=aioredis.from_url(
+        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+        encoding="utf-8",
+        decode_responses=True,
+    ),
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    local=LocalCache(
+        "users",
+        max_size=settings.USER_CACHE_SIZE,
+        ttl=settings.USER_CACHE_TTL_SECONDS,
+    ),
+    shared=settings.USER_CACHE_REDIS,
+)
@@ -3,11 +3,32 @@ Data Access Object for Users.
 
 This module defines the `UsersDAO` class, which provides asynchronous methods for interacting
 with the `Users` model, including checking user existence and performing database operations.
+Deleted users are removed from the user cache of every worker.
 """
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.dao.base import BaseDAO
+from app.users.user_cache import user_cache
 from app.users.user_models import Users
 
 
 class UsersDAO(BaseDAO):
     model = Users
+
+    @classmethod
+    async def delete(cls, session: AsyncSession | None = None, **filter_by):
+        """
+        Deletes the users that match the filter criteria and drops them from the user cache.
+
+        Args:
+            session (AsyncSession | None): The session to use instead of a new one.
+            filter_by: Keyword arguments representing filter criteria (example: `{"id": 1}`).
+
+        Returns:
+            Users | None: The deleted user, or None if no user was found.
+        """
+        deleted = await super().delete(session, **filter_by)
+        if deleted is not None:
+            await user_cache.invalidate(deleted.id)
+        return deleted
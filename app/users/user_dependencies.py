@@ -3,26 +3,32 @@ Dependency Injection for User Authentication.
 
 This module provides dependencies for token extraction, user authentication, and
 retrieving the current user. It verifies JWT tokens and ensures the user is authorized
-before accessing certain resources.
+before accessing certain resources. Resolved users are kept in the user cache.
 
 Functions:
     - get_token: Extracts the JWT token from the request.
+    - decode_access_token: Decodes and validates the JWT token.
     - get_current_user: Retrieves the current authenticated user from the token.
+    - get_current_user_from_claims: Retrieves the current user for read-only endpoints,
+     trusting the signed token claims when enabled.
 """
 
 from datetime import datetime
 
 from fastapi import Depends, Request
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import get_session
 from app.exceptions import (
     IncorrectTokenFormatException,
     TokenAbsentException,
     TokenExpiredException,
     UserIsNotPresentException,
 )
+from app.users.user_cache import user_cache
 from app.users.user_dao import UsersDAO
-from app.users.user_models import Users
+from app.users.user_schemas import UsersSchema
 from config import settings
 
 
@@ -45,15 +51,15 @@ def get_token(request: Request) -> str:
     return token
 
 
-async def get_current_user(token: str = Depends(get_token)) -> Users:
+def decode_access_token(token: str) -> dict:
     """
-    Retrieves the current authenticated user from the JWT token.
+    Decodes the JWT token and checks its expiration and subject.
 
     Args:
         token (str): The JWT token extracted from the request.
 
     Returns:
-        Users: The authenticated user object.
+        dict: The token claims.
 
     Raises:
         IncorrectTokenFormatException: If the token format is incorrect.
@@ -72,7 +78,64 @@ async def get_current_user(token: str = Depends(get_token)) -> Users:
     user_id: str = payload.get("sub")
     if not user_id:
         raise UserIsNotPresentException
-    user = await UsersDAO.find_by_id(int(user_id))
+    return payload
+
+
+async def get_current_user(
+    token: str = Depends(get_token),
+    session: AsyncSession = Depends(get_session),
+) -> UsersSchema:
+    """
+    Retrieves the current authenticated user from the JWT token.
+
+    The user is taken from the user cache and loaded from the database only on a cache miss,
+    in the request session so the endpoint can reuse its connection.
+
+    Args:
+        token (str): The JWT token extracted from the request.
+        session (AsyncSession): The request-scoped database session.
+
+    Returns:
+        UsersSchema: The authenticated user.
+
+    Raises:
+        IncorrectTokenFormatException: If the token format is incorrect.
+        TokenExpiredException: If the token is expired.
+        UserIsNotPresentException: If no user is found in the token.
+    """
+    payload = decode_access_token(token)
+    user_id = int(payload["sub"])
+
+    user = await user_cache.get(user_id)
+    if user:
+        return user
+    user = await UsersDAO.find_by_id(user_id, session)
     if not user:
         raise UserIsNotPresentException
+    user = UsersSchema.model_validate(user, from_attributes=True)
+    await user_cache.set(user)
     return user
+
+
+async def get_current_user_from_claims(
+    token: str = Depends(get_token),
+    session: AsyncSession = Depends(get_session),
+) -> UsersSchema:
+    """
+    Retrieves the current user for read-only endpoints.
+
+    When `TRUST_TOKEN_CLAIMS` is enabled and the token carries the user's email, the user is
+    built from the signed claims without any lookup. Otherwise it behaves like
+    `get_current_user`.
+
+    Args:
+        token (str): The JWT token extracted from the request.
+        session (AsyncSession): The request-scoped database session.
+
+    Returns:
+        UsersSchema: The authenticated user.
+    """
+    payload = decode_access_token(token)
+    if settings.TRUST_TOKEN_CLAIMS and payload.get("email"):
+        return UsersSchema(id=int(payload["sub"]), email=payload["email"])
+    return await get_current_user(token, session)
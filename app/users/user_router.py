@@ -12,7 +12,9 @@ Endpoints:
 """
 
 from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import get_session, stick_to_primary
 from app.exceptions import (
     IncorrectEmailOrPasswordException,
     UserAlreadyExistException,
@@ -23,9 +25,8 @@ from app.users.auth import (
     get_password_hash,
 )
 from app.users.user_dao import UsersDAO
-from app.users.user_dependencies import get_current_user
-from app.users.user_models import Users
-from app.users.user_schemas import UsersAuthSchema
+from app.users.user_dependencies import get_current_user_from_claims
+from app.users.user_schemas import UsersAuthSchema, UsersSchema
 
 router = APIRouter(prefix="/auth", tags=["Auth & Пользователи"])
 
@@ -46,40 +47,57 @@ async def login_user(response: Response, user_data: UsersAuthSchema):
     if not user:
         raise IncorrectEmailOrPasswordException
 
-    access_token = create_access_token({"sub": str(user.id)})
+    access_token = create_access_token({"sub": str(user.id), "email": user.email})
     response.set_cookie("booking_access_token", access_token, httponly=True)
     return access_token
 
 
 @router.post("/register")
-async def register_user(user_data: UsersAuthSchema):
+async def register_user(
+    response: Response,
+    user_data: UsersAuthSchema,
+    session: AsyncSession = Depends(get_session),
+):
     """
     Registers a new user and stores their data.
 
+    The email is checked before the password is hashed, so repeated registrations of an
+    existing user are rejected without running bcrypt. The read transaction of the check is
+    ended before hashing, so the connection goes back to the pool while bcrypt runs.
+
+    The client then reads from the primary for a while, so its first login finds the new user
+    even if the read replica lags behind.
+
     Args:
+        response (Response): The HTTP response where the read routing cookie will be set.
         user_data (UsersAuthSchema): The user's registration information.
+        session (AsyncSession): The request-scoped database session.
 
     Returns:
         int: The ID of the newly registered user.
     """
-    existing_user = await UsersDAO.find_one_or_none(email=user_data.email)
+    existing_user = await UsersDAO.find_one_or_none(session, email=user_data.email)
     if existing_user:
         raise UserAlreadyExistException
-    hashed_password = get_password_hash(user_data.password)
-    user_id = await UsersDAO.add(email=user_data.email, hashed_password=hashed_password)
+    await session.rollback()
+    hashed_password = await get_password_hash(user_data.password)
+    user_id = await UsersDAO.add(session, email=user_data.email, hashed_password=hashed_password)
+    stick_to_primary(response)
     return user_id
 
 
 @router.get("/me")
-async def read_user(current_user: Users = Depends(get_current_user)):
+async def read_user(
+    current_user: UsersSchema = Depends(get_current_user_from_claims),
+) -> UsersSchema:
     """
     Retrieves the current authenticated user's information.
 
     Args:
-        current_user (Users): The current authenticated user.
+        current_user (UsersSchema): The current authenticated user.
 
     Returns:
-        Users: The user's data.
+        UsersSchema: The user's data.
     """
     return current_user
 
@@ -2,10 +2,12 @@
 Schemas for User Authentication.
 
 This module defines Pydantic schemas used for validating user authentication data.
-The `UsersAuthSchema` is used for login and registration processes.
+The `UsersAuthSchema` is used for login and registration processes, and the `UsersSchema`
+represents the authenticated user.
 
 Schemas:
     - UsersAuthSchema: Represents the user's email and password for authentication.
+    - UsersSchema: Represents the authenticated user without credentials.
 """
 
 from pydantic import BaseModel, EmailStr
@@ -20,3 +22,15 @@ class UsersAuthSchema(BaseModel):
 
     email: EmailStr
     password: str
+
+
+class UsersSchema(BaseModel):
+    """
+    Schema for the authenticated user.
+
+    This schema is returned by the authentication dependencies and is stored in the user
+    cache, so it deliberately contains no credentials.
+    """
+
+    id: int
+    email: str
@@ -27,12 +27,66 @@ class Settings(BaseSettings):
         MODE (Literal["DEV", "PROD", "TEST"]): The environment mode of the application.
         LOG_LEVEL (Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]): The logging level.
         DATABASE_URL (str): The URL for connecting to the production database.
+        DATABASE_REPLICA_URL (str | None): The URL for connecting to the read replica of the
+         production database, None if no replica is configured.
+        READ_PRIMARY_AFTER_WRITE_SECONDS (int): How long a client reads from the primary after
+         its own write, so it sees its bookings before they reach the replica.
         TEST_DATABASE_URL (str): The URL for connecting to the test database.
         SMTP configuration variables: For sending emails through SMTP.
+        SMTP_SSL (bool): Whether the SMTP connection is made over SSL.
+        SMTP_TIMEOUT_SECONDS (float): The socket timeout of the SMTP connection.
+        SMTP_IDLE_TIMEOUT_SECONDS (float): How long a worker keeps an unused SMTP connection.
+        SMTP_MAX_RETRIES (int): How many times a transient email failure is retried.
+        SMTP_RETRY_BACKOFF_SECONDS (float): The delay before the first retry, doubled for
+         every next one.
+        SMTP_RETRY_BACKOFF_MAX_SECONDS (float): The longest delay between retries.
+        OUTBOX_BATCH_SIZE (int): The largest number of outbox messages published at once.
+        OUTBOX_POLL_SECONDS (float): How often the outbox is checked for messages written by
+         other workers.
+        OUTBOX_LEASE_SECONDS (int): How long a claimed outbox batch is left to its dispatcher
+         before other dispatchers publish it again.
+        CELERY_ACKS_LATE (bool): Whether tasks are acknowledged after they run rather than
+         when they are received, so the tasks of a lost worker are delivered again.
+        CELERY_{EMAILS,IMAGES,DEFAULT}_CONCURRENCY (int): The number of processes of a worker
+         consuming the queue.
+        CELERY_{EMAILS,IMAGES,DEFAULT}_PREFETCH_MULTIPLIER (int): How many tasks of the queue
+         every worker process reserves in advance.
+        CELERY_{EMAILS,IMAGES,DEFAULT}_TIME_LIMIT_SECONDS (int): The soft time limit of the
+         tasks of the queue; the task is killed 30 seconds later.
         REDIS configuration variables: For connecting to Redis for caching.
         SECRET_KEY_FOR_HASH (str): The secret key used for hashing tokens and passwords.
         ALGORITHM_FOR_HASH (str): The algorithm used for hashing tokens and passwords.
         SENTRY_LINK (str): The Sentry link for error tracking.
+        OCCUPANCY_CHECK_SECONDS (int): How often Celery beat checks the daily room occupancy
+         against the bookings.
+        USER_CACHE configuration variables: For caching authenticated users in process and,
+         optionally, in Redis.
+        TRUST_TOKEN_CLAIMS (bool): Whether read-only endpoints take the user from the signed
+         token claims instead of loading it.
+        HOTEL_SEARCH_CACHE_TTL_SECONDS (int): The lifetime of a cached hotel search result;
+         results are invalidated by bookings earlier than that.
+        HOTEL_SEARCH_CACHE_STALE_SECONDS (int): How long after its lifetime an unchanged hotel
+         search result is still served while it is refreshed in the background.
+        ROOM_AVAILABILITY_CACHE_TTL_SECONDS (int): The lifetime of the cached numbers of booked
+         rooms of a hotel; they are invalidated by bookings earlier than that.
+        ROOM_CACHE_TTL_SECONDS (int): The lifetime of the room attributes of a hotel in Redis.
+        LOCAL_CACHE_SIZE (int): The maximum number of entries in each in-process cache tier.
+        LOCAL_CACHE_TTL_SECONDS (int): The longest time an entry stays in an in-process cache
+         tier, which bounds staleness if an invalidation message is lost.
+        DB_POOL configuration variables: For the connection pool of the database engine.
+        DB_STATEMENT_CACHE_SIZE (int): The size of the asyncpg statement cache per connection.
+        DB_PREPARED_STATEMENT_CACHE_SIZE (int): The size of the SQLAlchemy prepared statement
+         cache per connection.
+        PASSWORD_HASH_WORKERS (int): The number of threads hashing and verifying passwords.
+        PASSWORD_HASH_QUEUE_SIZE (int): How many password operations may wait for a free thread
+         before new ones are rejected.
+        IMAGE_UPLOAD_MAX_BYTES (int): The largest accepted image upload, in bytes.
+        IMAGE_UPLOAD_CHUNK_BYTES (int): The size of the chunks an image upload is written in.
+        IMAGE_RENDITIONS (list[tuple[int, int]]): The widths and heights of the resized
+         renditions of uploaded images.
+        IMAGE_FORMATS (list[Literal["webp", "avif"]]): The formats the renditions are written in.
+        IMAGE_WEBP_QUALITY (int): The quality of WebP renditions, from 0 to 100.
+        IMAGE_AVIF_QUALITY (int): The quality of AVIF renditions, from 0 to 100.
     """
 
     MODE: Literal["DEV", "PROD", "TEST"]
@@ -44,10 +98,43 @@ class Settings(BaseSettings):
     DB_PASS: str
     DB_NAME: str
 
+    DB_REPLICA_HOST: str | None = None
+    DB_REPLICA_PORT: int | None = None
+    READ_PRIMARY_AFTER_WRITE_SECONDS: int = 10
+
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
     SMTP_HOST: str
     SMTP_PORT: int
     SMTP_USER: str
     SMTP_PASS: str
+    SMTP_SSL: bool = True
+    SMTP_TIMEOUT_SECONDS: float = 10
+    SMTP_IDLE_TIMEOUT_SECONDS: float = 60
+    SMTP_MAX_RETRIES: int = 5
+    SMTP_RETRY_BACKOFF_SECONDS: float = 2
+    SMTP_RETRY_BACKOFF_MAX_SECONDS: float = 300
+
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_SECONDS: float = 1
+    OUTBOX_LEASE_SECONDS: int = 60
+
+    CELERY_ACKS_LATE: bool = True
+    CELERY_EMAILS_CONCURRENCY: int = 8
+    CELERY_EMAILS_PREFETCH_MULTIPLIER: int = 4
+    CELERY_EMAILS_TIME_LIMIT_SECONDS: int = 60
+    CELERY_IMAGES_CONCURRENCY: int = 2
+    CELERY_IMAGES_PREFETCH_MULTIPLIER: int = 1
+    CELERY_IMAGES_TIME_LIMIT_SECONDS: int = 120
+    CELERY_DEFAULT_CONCURRENCY: int = 1
+    CELERY_DEFAULT_PREFETCH_MULTIPLIER: int = 1
+    CELERY_DEFAULT_TIME_LIMIT_SECONDS: int = 1800
 
     REDIS_HOST: str
     REDIS_PORT: int
@@ -56,6 +143,30 @@ class Settings(BaseSettings):
     ALGORITHM_FOR_HASH: str
     SENTRY_LINK: str
 
+    OCCUPANCY_CHECK_SECONDS: int = 3600
+
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_REDIS: bool = False
+    TRUST_TOKEN_CLAIMS: bool = False
+
+    HOTEL_SEARCH_CACHE_TTL_SECONDS: int = 600
+    HOTEL_SEARCH_CACHE_STALE_SECONDS: int = 60
+    ROOM_AVAILABILITY_CACHE_TTL_SECONDS: int = 600
+    ROOM_CACHE_TTL_SECONDS: int = 3600
+    LOCAL_CACHE_SIZE: int = 1000
+    LOCAL_CACHE_TTL_SECONDS: int = 30
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 16
+
+    IMAGE_UPLOAD_MAX_BYTES: int = 25 * 1024 * 1024
+    IMAGE_UPLOAD_CHUNK_BYTES: int = 1024 * 1024
+    IMAGE_RENDITIONS: list[tuple[int, int]] = [(1000, 500), (200, 100)]
+    IMAGE_FORMATS: list[Literal["webp", "avif"]] = ["webp"]
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_AVIF_QUALITY: int = 60
+
     @property
     def DATABASE_URL(self) -> str:
         """
@@ -68,6 +179,22 @@ class Settings(BaseSettings):
         db_address = f"{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         return f"postgresql+asyncpg://{db_creds}@{db_address}"
 
+    @property
+    def DATABASE_REPLICA_URL(self) -> str | None:
+        """
+        Generates the database URL for connecting to the read replica of the PostgreSQL database.
+
+        Returns:
+            str | None: The PostgreSQL replica connection string, or None if no replica
+             host is set.
+        """
+        if self.DB_REPLICA_HOST is None:
+            return None
+        db_creds = f"{self.DB_USER}:{self.DB_PASS}"
+        db_port = self.DB_REPLICA_PORT or self.DB_PORT
+        db_address = f"{self.DB_REPLICA_HOST}:{db_port}/{self.DB_NAME}"
+        return f"postgresql+asyncpg://{db_creds}@{db_address}"
+
     TEST_DB_HOST: str
     TEST_DB_PORT: int
     TEST_DB_USER: str
@@ -1,7 +1,10 @@
 #!/bin/bash
 
 if [[ "${1}" == "celery" ]]; then
-  celery --app=app.tasks.celery:celery worker -l INFO
+  queues="${2:-emails,images,default}"
+  celery --app=app.tasks.celery:celery worker -l INFO -Q "${queues}" -n "${queues%%,*}@%h"
+elif [[ "${1}" == "beat" ]]; then
+  celery --app=app.tasks.celery:celery beat -l INFO
 elif [[ "${1}" == "flower" ]]; then
   celery --app=app.tasks.celery:celery flower
 fi
\ No newline at end of file